@@ -1,65 +1,80 @@
 import itertools
+from functools import lru_cache
 
 import pandas as pd
 from openpyxl import load_workbook
 
 from carbon_bombs.conf import FPATH_OUT_ALL
-from carbon_bombs.conf import FPATH_SRC_GEM_COAL
-from carbon_bombs.conf import FPATH_SRC_GEM_GASOIL
 from carbon_bombs.conf import FPATH_SRC_KHUNE_PAPER
+from carbon_bombs.io.excel import read_excel_cached
+from carbon_bombs.io.gem import load_coal_mine_gem_database
+from carbon_bombs.io.gem import load_gasoil_mine_gem_database
+
+# ===================================================== #
+# Load datasets to check values (once, on first check) #
+# ===================================================== #
+
+
+@lru_cache(maxsize=None)
+def _get_cb_source_df():
+    """Return carbon bombs of the Khune paper (coal and gasoil)"""
+    # Prepare khune paper Gasoil dataframe
+    cb_gasoil_source_df = read_excel_cached(
+        FPATH_SRC_KHUNE_PAPER,
+        sheet_name="Oil&Gas",
+        engine="openpyxl",
+        skipfooter=4,
+        skiprows=1,
+    )
+    cb_gasoil_source_df = cb_gasoil_source_df.loc[
+        :, ["New", "Project", "Country", "Gt CO2"]
+    ]
+    cb_gasoil_source_df.columns = [
+        "New",
+        "Project Name",
+        "Country",
+        "Potential emissions (GtCO2)",
+    ]
+    cb_gasoil_source_df["Fuel"] = "Oil&Gas"
+    cb_gasoil_source_df["Country"] = cb_gasoil_source_df["Country"].replace(
+        {
+            "Russian Federation": "Russia",
+            "Turkey": "Türkiye",
+            "Saudi-Arabia": "Saudi Arabia",
+            "Kuwait-Saudi-Arabia-Neutral Zone": "Kuwait",  # see Readme to get the details of this choice
+        }
+    )
+
+    # Prepare khune paper Coal dataframe
+    cb_coal_source_df = read_excel_cached(
+        FPATH_SRC_KHUNE_PAPER, sheet_name="Coal", engine="openpyxl", skipfooter=3
+    )
+    cb_coal_source_df = cb_coal_source_df.loc[
+        :, ["New", "Project Name", "Country", "Potential emissions (GtCO2)", "Fuel"]
+    ]
+    cb_coal_source_df["Country"] = cb_coal_source_df["Country"].replace(
+        {"Russian Federation": "Russia", "Turkey": "Türkiye"}
+    )
+
+    # merge both dataframe into one
+    cb_source_df = pd.concat([cb_coal_source_df, cb_gasoil_source_df])
+    cb_source_df["Project Name"] = cb_source_df["Project Name"].str.strip()
+    cb_source_df = cb_source_df.replace({"Türkiye": "Turkey"})
 
-# =====
-# Load datasets to check values #
-
-# Prepare khune paper Gasoil dataframe
-cb_gasoil_source_df = pd.read_excel(
-    FPATH_SRC_KHUNE_PAPER,
-    sheet_name="Oil&Gas",
-    skipfooter=4,
-    skiprows=1,
-)
-cb_gasoil_source_df = cb_gasoil_source_df.loc[
-    :, ["New", "Project", "Country", "Gt CO2"]
-]
-cb_gasoil_source_df.columns = [
-    "New",
-    "Project Name",
-    "Country",
-    "Potential emissions (GtCO2)",
-]
-cb_gasoil_source_df["Fuel"] = "Oil&Gas"
-cb_gasoil_source_df["Country"] = cb_gasoil_source_df["Country"].replace(
-    {
-        "Russian Federation": "Russia",
-        "Turkey": "Türkiye",
-        "Saudi-Arabia": "Saudi Arabia",
-        "Kuwait-Saudi-Arabia-Neutral Zone": "Kuwait",  # see Readme to get the details of this choice
-    }
-)
-
-# Prepare khune paper Coal dataframe
-cb_coal_source_df = pd.read_excel(
-    FPATH_SRC_KHUNE_PAPER, sheet_name="Coal", skipfooter=3
-)
-cb_coal_source_df = cb_coal_source_df.loc[
-    :, ["New", "Project Name", "Country", "Potential emissions (GtCO2)", "Fuel"]
-]
-cb_coal_source_df["Country"] = cb_coal_source_df["Country"].replace(
-    {"Russian Federation": "Russia", "Turkey": "Türkiye"}
-)
-
-# merge both dataframe into one
-cb_source_df = pd.concat([cb_coal_source_df, cb_gasoil_source_df])
-cb_source_df["Project Name"] = cb_source_df["Project Name"].str.strip()
-cb_source_df = cb_source_df.replace({"Türkiye": "Turkey"})
+    return cb_source_df
 
 
 # GEM coal ans gasoil source
-# gem_coal_df = pd.read_excel(FPATH_SRC_GEM_COAL, sheet_name="Global Coal Mine Tracker")
-gem_coal_df = pd.read_excel(FPATH_SRC_GEM_COAL, sheet_name="GCMT Non-closed Mines")
-gem_gasoil_df = pd.read_excel(
-    FPATH_SRC_GEM_GASOIL, sheet_name="Main data", engine="openpyxl"
-)
+@lru_cache(maxsize=None)
+def _get_gem_coal_df():
+    """Return GEM coal source"""
+    return load_coal_mine_gem_database()
+
+
+@lru_cache(maxsize=None)
+def _get_gem_gasoil_df():
+    """Return GEM gasoil source"""
+    return load_gasoil_mine_gem_database()
 
 
 # ================== #
@@ -118,6 +133,7 @@ def _check_status(cb_df, merge_df):
 
 def _check_cb_names(cb_df):
     """Check CB names"""
+    cb_source_df = _get_cb_source_df()
     if set(cb_df["Project_name"]) == set(cb_source_df["Project Name"]):
         return "✅ OK - carbon_bombs_info: All Carbon bombs names were found \n"
     else:
@@ -160,6 +176,7 @@ def _check_cb_fuel(merge_df):
 
 def _check_units_mines_found_in_gem(units):
     """Check mines and units are all in cleaned df"""
+    gem_coal_df, gem_gasoil_df = _get_gem_coal_df(), _get_gem_gasoil_df()
     diff = (
         units
         # - set(gem_coal_df["Mine IDs"])
@@ -175,6 +192,7 @@ def _check_units_mines_found_in_gem(units):
 
 def _check_gem_url_and_source_found_in_cb(url, cb_df):
     """Check gem wiki url"""
+    gem_coal_df, gem_gasoil_df = _get_gem_coal_df(), _get_gem_gasoil_df()
     diff = (
         url
         # - set(gem_coal_df["GEM Wiki Page (ENG)"])
@@ -240,6 +258,7 @@ def _check_cb_operators(cb_df):
     #     - Split |
     #     - merge GEM id and check same operators
     #     - show amount of "" or None
+    gem_coal_df, gem_gasoil_df = _get_gem_coal_df(), _get_gem_gasoil_df()
     # a = gem_coal_df[["Mine IDs", "Operators"]]
     a = gem_coal_df[["GEM Mine ID", "Operators"]]
     b = gem_gasoil_df[["Unit ID", "Operator"]]
@@ -281,7 +300,7 @@ def check_carbons_bomb_info(cb_df):
 
     # merge with CB source to see if every project is available
     merge_df = cb_df.merge(
-        cb_source_df,
+        _get_cb_source_df(),
         left_on=["Project_name", "Country"],
         right_on=["Project Name", "Country"],
         how="inner",
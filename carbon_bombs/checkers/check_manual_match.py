@@ -1,36 +1,38 @@
 """Function to check if manual match data are valid or not"""
 
-import pandas as pd
+from functools import lru_cache
 
-from carbon_bombs.conf import FPATH_SRC_GEM_COAL
-from carbon_bombs.conf import FPATH_SRC_GEM_GASOIL
 from carbon_bombs.io.banking_climate_chaos import load_banking_climate_chaos
-from carbon_bombs.io.khune_paper import load_carbon_bomb_coal_database
-from carbon_bombs.io.khune_paper import load_carbon_bomb_gasoil_database
-from carbon_bombs.io.manual_match import manual_match_bank
-from carbon_bombs.io.manual_match import manual_match_coal
-from carbon_bombs.io.manual_match import manual_match_company
-from carbon_bombs.io.manual_match import manual_match_gasoil
+from carbon_bombs.io.gem import load_coal_mine_gem_database
+from carbon_bombs.io.gem import load_gasoil_mine_gem_database
+from carbon_bombs.io.manual_match import get_manual_match_bank
+from carbon_bombs.io.manual_match import get_manual_match_coal
+from carbon_bombs.io.manual_match import get_manual_match_company
+from carbon_bombs.io.manual_match import get_manual_match_gasoil
 
 
-# ========= #
-# Load data #
-# ========= #
+# ========================== #
+# Load data (on first check) #
+# ========================== #
 
-# GEM source
-# gem_coal_df = pd.read_excel(FPATH_SRC_GEM_COAL, sheet_name="Global Coal Mine Tracker")
-gem_coal_df = pd.read_excel(FPATH_SRC_GEM_COAL, sheet_name="GCMT Non-closed Mines")
-gem_gasoil_df = pd.read_excel(
-    FPATH_SRC_GEM_GASOIL, sheet_name="Main data", engine="openpyxl"
-)
 
-# paper source
-gasoil = load_carbon_bomb_gasoil_database()
-coal = load_carbon_bomb_coal_database()
-cb_df = pd.concat([gasoil, coal])
+@lru_cache(maxsize=None)
+def _get_gem_coal_df():
+    """GEM coal source"""
+    return load_coal_mine_gem_database()
+
+
+@lru_cache(maxsize=None)
+def _get_gem_gasoil_df():
+    """GEM gasoil source"""
+    return load_gasoil_mine_gem_database()
+
+
+@lru_cache(maxsize=None)
+def _get_bocc_df():
+    """Bank source"""
+    return load_banking_climate_chaos()
 
-# bank source
-bocc_df = load_banking_climate_chaos()
 
 # =============== #
 # Check functions #
@@ -44,9 +46,9 @@ def _check_manual_match_gem_id(manual_match, fuel):
     """
     res_txt = ""
     if fuel == "coal":
-        names = gem_coal_df["Mine Name"].unique()
+        names = _get_gem_coal_df()["Mine Name"].unique()
     else:
-        names = gem_gasoil_df["Unit name"].unique()
+        names = _get_gem_gasoil_df()["Unit name"].unique()
 
     for cb, units in manual_match.items():
         for unit in units.split("$"):
@@ -61,8 +63,8 @@ def check_manual_match_gem_id():
 
     Return a string explaining if something is wrong or not.
     """
-    res_txt = _check_manual_match_gem_id(manual_match_coal, fuel="coal")
-    res_txt += _check_manual_match_gem_id(manual_match_gasoil, fuel="gasoil")
+    res_txt = _check_manual_match_gem_id(get_manual_match_coal(), fuel="coal")
+    res_txt += _check_manual_match_gem_id(get_manual_match_gasoil(), fuel="gasoil")
 
     return res_txt
 
@@ -73,8 +75,9 @@ def check_manual_match_banks():
     Return a string explaining if something is wrong or not.
     """
     res_txt = ""
-    for value in set(manual_match_bank.values()):
-        if value not in bocc_df["Bank"].unique():
+    bocc_banks = _get_bocc_df()["Bank"].unique()
+    for value in set(get_manual_match_bank().values()):
+        if value not in bocc_banks:
             res_txt += f"⚠️ bank check: `{value}` not in BOCC Bank\n"
 
     return res_txt
@@ -86,8 +89,9 @@ def check_manual_match_companies():
     Return a string explaining if something is wrong or not.
     """
     res_txt = ""
-    for value in set(manual_match_company.values()):
-        if value not in bocc_df["Company"].unique():
+    bocc_companies = _get_bocc_df()["Company"].unique()
+    for value in set(get_manual_match_company().values()):
+        if value not in bocc_companies:
             res_txt += f"⚠️ company check: `{value}` not in BOCC Companies\n"
 
     return res_txt
@@ -6,7 +6,15 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from carbon_bombs.conf import DATA_SOURCE_PATH
 from carbon_bombs.conf import FPATH_SRC_BOCC
+from carbon_bombs.conf import FPATH_SRC_MANIFEST
+from carbon_bombs.io.excel import read_excel_cached
+from carbon_bombs.io.manifest import compare_manifests
+from carbon_bombs.io.manifest import create_manifest
+from carbon_bombs.io.manifest import get_file_manifest
+from carbon_bombs.io.manifest import load_manifest
+from carbon_bombs.io.md5 import md5
 from carbon_bombs.utils.logger import LOGGER
 
 
@@ -28,22 +36,69 @@ GEM_GASOIL_URL = "https://globalenergymonitor.org/projects/global-oil-gas-extrac
 GEM_GASOIL_WORD_TO_FIND = "July 2023"
 
 
-def check_bocc_source_updated():
+def _get_content(url: str) -> bytes:
+    """Return the content of an URL. `url` can also be a local path (or a
+    file:// URL), e.g. a folder standing in for the website to check offline.
+    """
+    if url.startswith("file://"):
+        url = url[len("file://") :]
+
+    if os.path.isfile(url):
+        with open(url, "rb") as f:
+            return f.read()
+
+    return requests.get(url, headers=headers).content
+
+
+def _count_changed_rows(df: pd.DataFrame, old_df: pd.DataFrame) -> int:
+    """Return the number of rows that differ between 2 versions of a sheet"""
+    if list(df.columns) != list(old_df.columns):
+        return max(len(df), len(old_df))
+
+    if df.shape == old_df.shape:
+        return len(df.compare(old_df))
+
+    # count rows (with duplicates) found in only one version
+    rows_count = (
+        pd.concat([df.assign(_count=1), old_df.assign(_count=-1)])
+        .groupby(list(df.columns), dropna=False, sort=False)["_count"]
+        .sum()
+    )
+    return int(rows_count.abs().sum())
+
+
+def check_bocc_source_updated(
+    site_url: str = BOCC_URL,
+    data_url: str = CURRENT_BOCC_DATA_URL,
+    manifest_fpath: str = FPATH_SRC_MANIFEST,
+):
     """Check that BOCC data is up to date.
 
+    The downloaded file is compared to the local one by MD5 then by hash of
+    the financing sheet (see the sources manifest), rows are compared only
+    when the financing sheet changed.
+
+    Parameters
+    ----------
+    site_url : str, optional
+        BOCC website page linking to the dataset, by default BOCC_URL
+    data_url : str, optional
+        Expected URL of the dataset, by default CURRENT_BOCC_DATA_URL
+    manifest_fpath : str, optional
+        Manifest of the sources, by default FPATH_SRC_MANIFEST
+
     Return a string explaining if something changed or not.
     """
     res_txt = ""
 
-    response = requests.get(BOCC_URL, headers=headers)
-    soup = BeautifulSoup(response.content, "html.parser")
+    soup = BeautifulSoup(_get_content(site_url), "html.parser")
 
     # find url to download dataset
     fulldata = soup.find("section", {"id": "fulldata-panel"})
     url_data = fulldata.find("div", {"class": "download-data"}).find("a").get("href")
 
     # check if url changed
-    if CURRENT_BOCC_DATA_URL != url_data:
+    if data_url != url_data:
         res_txt += f"⚠️BOCC check: URL changed\n"
         res_txt += (
             f"⚠️ BOCC check: Please download the new dataset... (url = {url_data})\n"
@@ -51,35 +106,71 @@ def check_bocc_source_updated():
         return res_txt
 
     try:
-        s = requests.get(CURRENT_BOCC_DATA_URL, headers=headers).content
         with open(TMP_BOCC_DATA_FPATH, "wb") as f:
-            f.write(s)
+            f.write(_get_content(data_url))
 
-        # read new dataset
-        df = pd.read_excel(
-            TMP_BOCC_DATA_FPATH, sheet_name="Financing (USD)", engine="openpyxl"
+        # compare them by hash
+        fname = os.path.basename(FPATH_SRC_BOCC)
+        old_entry = get_file_manifest(
+            FPATH_SRC_BOCC, load_manifest(manifest_fpath).get(fname)
         )
-        os.remove(TMP_BOCC_DATA_FPATH)
+        if md5(TMP_BOCC_DATA_FPATH) == old_entry["md5"]:
+            return "✅ BOCC check: DATA OK\n"
 
-        # read old dataset
-        old_df = pd.read_excel(
-            FPATH_SRC_BOCC, sheet_name="Financing (USD)", engine="openpyxl"
-        )
+        new_entry = get_file_manifest(TMP_BOCC_DATA_FPATH)
+        sheet_name = "Financing (USD)"
+        if new_entry["sheets"].get(sheet_name) == old_entry["sheets"].get(sheet_name):
+            return f"✅ BOCC check: DATA OK (file changed but not `{sheet_name}`)\n"
 
-        # compare them
-        if not df.equals(old_df):
-            comp = df.compare(old_df)
-            res_txt += (
-                f"⚠️ BOCC check: data was updated. (n rows concerned = {len(comp)})\n"
-            )
-            res_txt += f"⚠️ BOCC check: Please download the new dataset... (url = {CURRENT_BOCC_DATA_URL})\n"
-            return res_txt
+        # compare rows only when the sheet changed
+        df = pd.read_excel(
+            TMP_BOCC_DATA_FPATH, sheet_name=sheet_name, engine="openpyxl"
+        )
+        old_df = read_excel_cached(
+            FPATH_SRC_BOCC, sheet_name=sheet_name, engine="openpyxl"
+        )
+        n_rows = _count_changed_rows(df, old_df)
+        res_txt += f"⚠️ BOCC check: data was updated. (n rows concerned = {n_rows})\n"
+        res_txt += f"⚠️ BOCC check: Please download the new dataset... (url = {data_url})\n"
+        return res_txt
 
     except Exception as e:
         LOGGER.error(e)
         return f"⚠️ ERROR DURING BOCC CHECK: {e}\n"
 
-    return "✅ BOCC check: DATA OK\n"
+    finally:
+        if os.path.isfile(TMP_BOCC_DATA_FPATH):
+            os.remove(TMP_BOCC_DATA_FPATH)
+
+
+def check_local_sources_updated(
+    dir_path: str = DATA_SOURCE_PATH, manifest_fpath: str = FPATH_SRC_MANIFEST
+):
+    """Check local source files against the sources manifest (by hash).
+
+    Return a string explaining if something changed or not.
+    """
+    manifest = load_manifest(manifest_fpath)
+    diff = compare_manifests(manifest, create_manifest(dir_path, previous=manifest))
+
+    res_txt = ""
+    for fname in diff["added"]:
+        res_txt += f"⚠️ Sources check: `{fname}` added\n"
+    for fname in diff["removed"]:
+        res_txt += f"⚠️ Sources check: `{fname}` removed\n"
+    for fname, sheets in diff["changed"].items():
+        if sheets is None:
+            res_txt += f"⚠️ Sources check: `{fname}` changed\n"
+        elif sheets:
+            res_txt += f"⚠️ Sources check: `{fname}` changed (sheets: {sheets})\n"
+        else:
+            res_txt += f"✅ Sources check: `{fname}` file changed but not its data\n"
+
+    if res_txt:
+        res_txt += "⚠️ Sources check: update the manifest once changes are checked\n"
+        return res_txt
+
+    return "✅ Sources check: DATA OK\n"
 
 
 def _check_gem_source_updated(fuel):
@@ -130,6 +221,9 @@ def check_data_sources():
     """
     res = "===== Check data sources =====\n"
 
+    res += "\nCHECK LOCAL SOURCES\n"
+    res += check_local_sources_updated()
+
     # res += "\nCHECK BOCC SOURCE\n"
     # res += check_bocc_source_updated()
 
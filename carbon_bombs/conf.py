@@ -13,6 +13,10 @@ DATA_SOURCE_PATH = f"{REPO_PATH}/data_sources"
 DATA_CLEANED_PATH = f"{REPO_PATH}/data_cleaned"
 DATA_SAVE_OLD = f"{REPO_PATH}/data_save_tmp"
 DATA_NEO4J_PATH = f"{REPO_PATH}/data_neo4j"
+DATA_CACHE_PATH = f"{REPO_PATH}/data_cache"
+
+# Manifest of source files (size, modification time, MD5 and sheets hashes)
+FPATH_SRC_MANIFEST = f"{DATA_SOURCE_PATH}/manifest.json"
 
 # File names of sources
 FPATH_SRC_KHUNE_PAPER = f"{DATA_SOURCE_PATH}/1-s2.0-S0301421522001756-mmc2.xlsx"
@@ -21,6 +25,8 @@ FPATH_SRC_GEM_COAL = f"{DATA_SOURCE_PATH}/Global-Coal-Mine-Tracker-May-2025.xlsx
 FPATH_SRC_GEM_GASOIL = (
     f"{DATA_SOURCE_PATH}/Global-Oil-and-Gas-Extraction-Tracker-Feb-2023.xlsx"
 )
+SHEETNAME_SRC_GEM_COAL = "GCMT Non-closed Mines"
+SHEETNAME_SRC_GEM_GASOIL = "Main data"
 FPATH_SRC_GOGEL_LNG = (
     f"{DATA_SOURCE_PATH}/LNG-Liquefaction-Projects-from-GOGEL-2024.xlsx"
 )
@@ -38,6 +44,15 @@ FPATH_SRC_UNDATA_GDP = (
 FPATH_SRC_UNDATA_CO2 = (
     f"{DATA_SOURCE_PATH}/undata_SYB65_310_202209_Carbon Dioxide Emission Estimates.csv"
 )
+# UNData series kept in the countries dataset and their column names
+UNDATA_SERIES = {
+    "Population mid-year estimates (millions)": "Population_in_millions",
+    "Surface area (thousand km2)": "Surface_thousand_km2",
+    "GDP in current prices (millions of US dollars)": "GDP_millions_US_dollars",
+    "GDP per capita (US dollars)": "GDP_per_capita_US_dollars",
+    "Emissions (thousand metric tons of carbon dioxide)": "Emissions_thousand_tons_CO2",
+    "Emissions per capita (metric tons of carbon dioxide)": "Emissions_per_capita_tons_CO2",
+}
 FPATH_SRC_RYSTAD_CB = f"{DATA_SOURCE_PATH}/Carbon_Bombs_Projects.xlsx"
 SHEETNAME_RYSTAD_CB_EMISSION_INFERIOR_1GT = "V1_method_0.1GT"
 SHEETNAME_RYSTAD_CB_EMISSION = "Carbon_Bombs_1GT"
@@ -52,6 +67,11 @@ SHEETNAME_COMPANIES = "Companies"
 SHEETNAME_BANK = "Bank"
 SHEETNAME_LAT_LONG = "Lat_Long"
 
+# Engine used to read the large GEM / Rystad / GOGEL trackers: "openpyxl" or
+# "calamine" (much faster, needs python-calamine, and decodes `_xHHHH_`
+# escaped characters that openpyxl keeps as is)
+EXCEL_ENGINE = "openpyxl"
+
 # File names for output files used during the process
 FPATH_SRC_UNIFORM_COMP_NAMES = f"{DATA_SOURCE_PATH}/uniform_company_names.json"
 
@@ -78,6 +98,11 @@ FPATH_NEO4J_CONX_CB_COMP = f"{DATA_NEO4J_PATH}/connection_carbonbombs_company.cs
 FPATH_NEO4J_CONX_CB_COUNTRY = f"{DATA_NEO4J_PATH}/connection_carbonbombs_country.csv"
 FPATH_NEO4J_CONX_COMP_COUNTRY = f"{DATA_NEO4J_PATH}/connection_company_country.csv"
 FPATH_OUT_LOCAL_DATABASE = f"{DATA_NEO4J_PATH}/database.json"
+FPATH_OUT_LOCAL_DATABASE_GZIP = f"{DATA_NEO4J_PATH}/database.json.gz"
+FPATH_OUT_LOCAL_DATABASE_MSGPACK = f"{DATA_NEO4J_PATH}/database.msgpack"
+DATA_NEO4J_IMPORT_PATH = f"{DATA_NEO4J_PATH}/import"
+# Neo4J CSV files as of the last successful `sync_neo4j`
+DATA_NEO4J_SYNCED_PATH = f"{DATA_NEO4J_PATH}/.synced"
 
 # MD5 checksum file
 FPATH_CHECKSUM = f"{DATA_CLEANED_PATH}/checksum"
@@ -87,3 +112,6 @@ PROJECT_SEPARATOR = "|"
 
 # Threshold to put a project as operating
 THRESHOLD_OPERATING_PROJECT = 0.3
+
+# Processes scoring the fuzzy candidates of GEM units (-1 to use all CPUs)
+FUZZ_WORKERS = -1
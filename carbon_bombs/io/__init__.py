@@ -8,13 +8,16 @@ It contains all functions to read and save.
 |  banking_climate_chaos.py |                     Functions to load BOCC dataset |
 |             banktracks.py |      Functions to scrap data of banktracks website |
 |                cleaned.py |        Functions to load and save cleaned datasets |
+|                  excel.py |    Functions to read Excel sources through a cache |
 |                company.py |          Functions to load company dataset related |
 |                    gem.py |   Functions to load and scrap GEM related datasets |
 |                  gmaps.py |                        Functions to call GMAPS API |
 |            khune_paper.py |          Functions to read the Khune Paper dataset |
 |           manual_match.py |         All matching dictionaries defined manually |
+|               manifest.py |        Functions to detect changes in source files |
 |                    md5.py |                  Function to generate md5 checksum |
 |                  neo4j.py |                Functions to update and purge neo4j |
+|                 schema.py |        Functions to enforce the schema of a source |
 |                 undata.py |                  Functions to load UNData datasets |
 + ------------------------- + -------------------------------------------------- +
 """
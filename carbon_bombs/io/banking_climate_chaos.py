@@ -3,38 +3,94 @@ import numpy as np
 import pandas as pd
 
 from carbon_bombs.conf import FPATH_SRC_BOCC
+from carbon_bombs.io.excel import read_excel_cached
+from carbon_bombs.io.schema import apply_schema
 from carbon_bombs.utils.logger import LOGGER
 
+# Schema of the BOCC financing sheet (amounts are checked as numbers so that
+# the aggregation below never concatenates strings). Year columns are found
+# in the sheet and checked as integers.
+BOCC_SCHEMA = {
+    "Bank": "string",
+    "Company": "string",
+    "Grand Total": "float64",
+}
+BOCC_SHEET_NAME = "Financing (USD)"
+BOCC_PARENT_COMPANY_COLUMN = "Parent-Level Company "
+
+
+def is_year_column(column) -> bool:
+    """Return True if `column` is a year column of BOCC (e.g. 2016 or "2016")"""
+    return str(column).strip().isdigit() and len(str(column).strip()) == 4
+
+
+def _get_bocc_columns(file_path: str) -> list:
+    """Return the columns of the BOCC financing sheet (header only)"""
+    return list(
+        read_excel_cached(
+            file_path, sheet_name=BOCC_SHEET_NAME, engine="openpyxl", nrows=0
+        ).columns
+    )
+
 
 def load_banking_climate_chaos():
     """
     Loads the banking on climate chaos data from an Excel file located at the
     specified file path. Returns a pandas DataFrame containing the data.
 
+    Only the bank, company and amount columns are read: year columns are
+    discovered in the sheet header so that a new BOCC edition with more years
+    needs no change. Amounts are summed by bank and company, grouping on
+    categorical codes, and yearly amounts are stored as sparse columns (most
+    of them are 0).
+
     Returns
     -------
     pandas.DataFrame
-        A DataFrame containing the banking on climate chaos data.
+        A DataFrame containing the banking on climate chaos data: Bank,
+        Company, one column per year and Grand Total.
 
     Notes
     -----
     - This function requires the pandas and openpyxl libraries to be installed.
     - The Excel file containing the data must be available at the specified
       file path.
-    - The sheet name containing the data must be 'Data'.
+    - The sheet name containing the data must be 'Financing (USD)'.
     """
     LOGGER.debug("Read Banking On Climate Chaos source")
     file_path = FPATH_SRC_BOCC
-    df = pd.read_excel(file_path, sheet_name="Financing (USD)", engine="openpyxl")
+    columns = _get_bocc_columns(file_path)
+    year_columns = [col for col in columns if is_year_column(col)]
+    LOGGER.debug(f"BOCC years found: {year_columns}")
+    amount_columns = year_columns + ["Grand Total"]
+
+    # year columns may be numbers so columns to read are given by position
+    wanted_columns = ["Bank", "Company", BOCC_PARENT_COMPANY_COLUMN] + amount_columns
+    df = read_excel_cached(
+        file_path,
+        sheet_name=BOCC_SHEET_NAME,
+        engine="openpyxl",
+        usecols=[i for i, col in enumerate(columns) if col in wanted_columns],
+    )
 
     df["Company"] = np.where(
-        (df["Parent-Level Company "].isna()) | (df["Parent-Level Company "] == 0),
+        (df[BOCC_PARENT_COMPANY_COLUMN].isna())
+        | (df[BOCC_PARENT_COMPANY_COLUMN] == 0),
         df["Company"],
-        df["Parent-Level Company "],
+        df[BOCC_PARENT_COMPANY_COLUMN],
     )
-    df = df.drop(columns="Parent-Level Company ")
+    df = df.drop(columns=BOCC_PARENT_COMPANY_COLUMN)
+
+    # Check and define column types: nullable integers so that empty year
+    # cells are allowed but fractional amounts raise, empty cells are 0 amounts
+    schema = {**BOCC_SCHEMA, **dict.fromkeys(year_columns, "Int64")}
+    df = apply_schema(df, schema, source="BOCC")
+    df[year_columns] = df[year_columns].fillna(0).astype("int64")
 
-    # TODO : agg
-    df = df.groupby(["Bank", "Company"]).sum().reset_index()
+    # Sum amounts by bank and company
+    keys = [df["Bank"].astype("category"), df["Company"].astype("category")]
+    df = df[amount_columns].groupby(keys, observed=True).sum().reset_index()
+    df = df.astype({"Bank": "string", "Company": "string"})
+    df[year_columns] = df[year_columns].astype(pd.SparseDtype("int64", 0))
 
     return df
@@ -0,0 +1,245 @@
+"""Functions to read Excel sources through a workbook registry and a cache
+
+Each workbook is opened once per run (see `get_workbook`) and every loader
+reading one of its sheets gets the DataFrame parsed from this single open
+workbook, parsed sheets being kept in memory for the rest of the run.
+
+Parsing the sources workbooks with openpyxl is slow, so every sheet read
+(file, sheet and read options) is also stored in `DATA_CACHE_PATH` as a
+Parquet file (or a pickle file when pyarrow is not installed or when Parquet
+cannot store the dataframe as is). Cache files are keyed by the path of the
+source file relative to the repository, so files sharing a name do not share
+a cache, and by its MD5 so a new version of a source is parsed again.
+"""
+import atexit
+import hashlib
+import importlib.util
+import os
+from collections import Counter
+from glob import escape
+from glob import glob
+
+import pandas as pd
+
+from carbon_bombs.conf import DATA_CACHE_PATH
+from carbon_bombs.conf import EXCEL_ENGINE
+from carbon_bombs.conf import REPO_PATH
+from carbon_bombs.io.md5 import md5
+from carbon_bombs.utils.logger import LOGGER
+
+# MD5 of source files by (path, size, modification time)
+_md5_memo = {}
+# Opened workbooks by (path, size, modification time, engine)
+_workbooks = {}
+# Sheets already parsed during the run by cache file path
+_sheets = {}
+# Number of times each workbook was opened (instrumentation)
+workbook_open_counts = Counter()
+
+
+def _get_file_key(fpath: str) -> tuple:
+    """Return a key identifying a version of a file"""
+    stat = os.stat(fpath)
+    return os.path.abspath(fpath), stat.st_size, stat.st_mtime_ns
+
+
+def _get_source_md5(fpath: str) -> str:
+    """Return the MD5 of a source file, computed once per file version"""
+    key = _get_file_key(fpath)
+
+    if key not in _md5_memo:
+        _md5_memo[key] = md5(fpath)
+
+    return _md5_memo[key]
+
+
+def get_excel_engine(engine: str = EXCEL_ENGINE) -> str:
+    """Return `engine` if it is available else "openpyxl"
+
+    Parameters
+    ----------
+    engine : str, optional
+        Wanted engine, by default EXCEL_ENGINE
+
+    Returns
+    -------
+    str
+        Engine to give to `read_excel_cached`
+    """
+    if engine == "calamine" and importlib.util.find_spec("python_calamine") is None:
+        LOGGER.warning("python-calamine is not installed, use openpyxl engine")
+        return "openpyxl"
+    return engine
+
+
+def get_workbook(fpath: str, engine: str = None) -> pd.ExcelFile:
+    """Return the workbook of `fpath`, opening it only the first time it is
+    requested with `engine` (or when the file changed).
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the Excel file
+    engine : str, optional
+        Engine used to open the workbook, by default None
+        (pandas default engine)
+
+    Returns
+    -------
+    pd.ExcelFile
+        Opened workbook
+    """
+    key = (*_get_file_key(fpath), engine)
+
+    if key not in _workbooks:
+        LOGGER.debug(f"Open workbook {fpath} (engine: {engine})")
+        _workbooks[key] = pd.ExcelFile(fpath, engine=engine)
+        workbook_open_counts[key[0]] += 1
+
+    return _workbooks[key]
+
+
+@atexit.register
+def close_workbooks():
+    """Close opened workbooks and forget parsed sheets"""
+    for workbook in _workbooks.values():
+        workbook.close()
+    _workbooks.clear()
+    _sheets.clear()
+
+
+def _parse_sheet(fpath: str, sheet_name, read_options: dict) -> pd.DataFrame:
+    """Parse a sheet from the workbook registry (`read_options` are the
+    `pd.read_excel` options)
+    """
+    read_options = dict(read_options)
+    engine = read_options.pop("engine", None)
+    return get_workbook(fpath, engine).parse(sheet_name, **read_options)
+
+
+def _get_options_key(fpath: str, sheet_name, read_options: dict) -> str:
+    """Return a short hash of the file path (relative to the repository),
+    the sheet name and the read options
+    """
+    relpath = os.path.relpath(os.path.abspath(fpath), REPO_PATH)
+    options = repr((relpath, sheet_name, sorted(read_options.items())))
+    return hashlib.md5(options.encode()).hexdigest()[:12]
+
+
+def _write_cache(df: pd.DataFrame, fpath_cache: str) -> str:
+    """Write `df` as Parquet if it can be read back identical, else as pickle.
+    Return the path of the written file.
+    """
+    fpath_parquet = f"{fpath_cache}.parquet"
+    # Parquet only stores string column names (e.g. BOCC years are numbers)
+    if not all(isinstance(col, str) for col in df.columns):
+        LOGGER.debug("Parquet cache needs string column names, use pickle")
+    else:
+        try:
+            df.to_parquet(fpath_parquet)
+            if pd.read_parquet(fpath_parquet).equals(df):
+                return fpath_parquet
+            LOGGER.debug("Parquet cache changes the dataframe, use pickle")
+        # pyarrow may be missing or raise its own errors (e.g. mixed types)
+        except Exception as e:
+            LOGGER.debug(f"Parquet cache not available ({e}), use pickle")
+
+    if os.path.isfile(fpath_parquet):
+        os.remove(fpath_parquet)
+
+    df.to_pickle(f"{fpath_cache}.pkl")
+    return f"{fpath_cache}.pkl"
+
+
+def read_excel_cached(fpath: str, sheet_name, use_cache: bool = True, **kwargs):
+    """Read an Excel sheet like `pd.read_excel` from the workbook registry,
+    using a cache keyed by the path and the MD5 of the file, the sheet name
+    and the read options. A sheet is read only once per run.
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the Excel file
+    sheet_name : str
+        Name of the sheet to read
+    use_cache : bool, optional
+        Whether to read and write the cache, by default True
+    **kwargs
+        Other options given to `pd.read_excel`
+
+    Returns
+    -------
+    pd.DataFrame
+        Content of the sheet
+    """
+    name = os.path.splitext(os.path.basename(fpath))[0]
+    options_key = _get_options_key(fpath, sheet_name, kwargs)
+    fpath_cache = f"{DATA_CACHE_PATH}/{name}-{options_key}-{_get_source_md5(fpath)}"
+
+    if fpath_cache not in _sheets:
+        _sheets[fpath_cache] = _read_sheet(
+            fpath, sheet_name, kwargs, fpath_cache, use_cache
+        )
+
+    # loaders modify the dataframe they get
+    return _sheets[fpath_cache].copy()
+
+
+def _read_sheet(
+    fpath: str, sheet_name, read_options: dict, fpath_cache: str, use_cache: bool
+) -> pd.DataFrame:
+    """Read a sheet from the cache if available else parse it from the
+    workbook and cache it.
+    """
+    if not use_cache:
+        return _parse_sheet(fpath, sheet_name, read_options)
+
+    if os.path.isfile(f"{fpath_cache}.parquet"):
+        LOGGER.debug(f"Read `{sheet_name}` of {fpath} from cache")
+        return pd.read_parquet(f"{fpath_cache}.parquet")
+    if os.path.isfile(f"{fpath_cache}.pkl"):
+        LOGGER.debug(f"Read `{sheet_name}` of {fpath} from cache")
+        return pd.read_pickle(f"{fpath_cache}.pkl")
+
+    df = _parse_sheet(fpath, sheet_name, read_options)
+
+    # Remove cache of previous versions of the file (same path, sheet and options)
+    name, options_key, _ = os.path.basename(fpath_cache).rsplit("-", 2)
+    for fpath_old in glob(f"{DATA_CACHE_PATH}/{escape(name)}-{options_key}-*"):
+        os.remove(fpath_old)
+
+    os.makedirs(DATA_CACHE_PATH, exist_ok=True)
+    fpath_written = _write_cache(df, fpath_cache)
+    LOGGER.debug(f"Cache `{sheet_name}` of {fpath} in {fpath_written}")
+
+    return df
+
+
+def read_excel_sheets(fpath: str, sheet_names: list, **kwargs) -> dict:
+    """Read several sheets of a workbook (opened once) with the same options
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the Excel file
+    sheet_names : list
+        Names of the sheets to read
+    **kwargs
+        Options given to `read_excel_cached`
+
+    Returns
+    -------
+    dict
+        Content of each sheet by sheet name
+    """
+    return {
+        sheet_name: read_excel_cached(fpath, sheet_name, **kwargs)
+        for sheet_name in sheet_names
+    }
+
+
+def clear_excel_cache():
+    """Remove all cached Excel sheets"""
+    _sheets.clear()
+    for fpath in glob(f"{DATA_CACHE_PATH}/*"):
+        os.remove(fpath)
@@ -9,13 +9,23 @@ from bs4 import BeautifulSoup
 
 from carbon_bombs.conf import FPATH_SRC_GEM_COAL
 from carbon_bombs.conf import FPATH_SRC_GEM_GASOIL
+from carbon_bombs.conf import SHEETNAME_SRC_GEM_COAL
+from carbon_bombs.conf import SHEETNAME_SRC_GEM_GASOIL
+from carbon_bombs.io.excel import get_excel_engine
+from carbon_bombs.io.excel import read_excel_cached
 from carbon_bombs.utils.logger import LOGGER
 
 
-def load_coal_mine_gem_database_april_2023():
+def load_coal_mine_gem_database_april_2023(columns=None):
     """
     Loads the Global Coal Mine Tracker database from an Excel file.
 
+    Parameters
+    ----------
+    columns : list, optional
+        Columns to read (the others are not parsed), by default None which
+        reads all columns
+
     Returns
     -------
     pd.DataFrame:
@@ -36,16 +46,25 @@ def load_coal_mine_gem_database_april_2023():
     The sheet to be read is "Global Coal Mine Tracker".
     """
     LOGGER.debug("Read GEM source: `Global Coal Mine Tracker`")
-    df = pd.read_excel(
-        FPATH_SRC_GEM_COAL, sheet_name="Global Coal Mine Tracker", engine="openpyxl"
+    df = read_excel_cached(
+        FPATH_SRC_GEM_COAL,
+        sheet_name="Global Coal Mine Tracker",
+        engine=get_excel_engine(),
+        usecols=None if columns is None else list(columns),
     )
     return df
 
 
-def load_coal_mine_gem_database():
+def load_coal_mine_gem_database(columns=None):
     """
     Loads the Global Coal Mine Tracker database from an Excel file.
 
+    Parameters
+    ----------
+    columns : list, optional
+        Columns to read (the others are not parsed), by default None which
+        reads all columns
+
     Returns
     -------
     pd.DataFrame:
@@ -65,19 +84,26 @@ def load_coal_mine_gem_database():
     "./data_sources/Global-Coal-Mine-Tracker-April-2023.xlsx".
     The sheet to be read is "Global Coal Mine Tracker".
     """
-    LOGGER.debug("Read GEM source: `GCMT Non-closed Mines`")
-    df = pd.read_excel(
+    LOGGER.debug(f"Read GEM source: `{SHEETNAME_SRC_GEM_COAL}`")
+    df = read_excel_cached(
         FPATH_SRC_GEM_COAL,
-        sheet_name="GCMT Non-closed Mines",
-        engine="openpyxl",
+        sheet_name=SHEETNAME_SRC_GEM_COAL,
+        engine=get_excel_engine(),
+        usecols=None if columns is None else list(columns),
     )
     return df
 
 
-def load_gasoil_mine_gem_database():
+def load_gasoil_mine_gem_database(columns=None):
     """
     Loads the Global Oil and Gas Extraction Tracker database from an Excel file.
 
+    Parameters
+    ----------
+    columns : list, optional
+        Columns to read (the others are not parsed), by default None which
+        reads all columns
+
     Returns
     -------
     pd.DataFrame:
@@ -96,10 +122,15 @@ def load_gasoil_mine_gem_database():
     "./data_sources/Global-Oil-and-Gas-Extraction-Tracker-Feb-2023.xlsx".
     The sheet to be read is "Main data".
     """
-    LOGGER.debug("Read GEM source: `Main data` (gasoil)")
+    LOGGER.debug(f"Read GEM source: `{SHEETNAME_SRC_GEM_GASOIL}` (gasoil)")
     # Line that must be passed before in order to avoid useless warning
     warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
-    df = pd.read_excel(FPATH_SRC_GEM_GASOIL, sheet_name="Main data", engine="openpyxl")
+    df = read_excel_cached(
+        FPATH_SRC_GEM_GASOIL,
+        sheet_name=SHEETNAME_SRC_GEM_GASOIL,
+        engine=get_excel_engine(),
+        usecols=None if columns is None else list(columns),
+    )
 
     return df
 
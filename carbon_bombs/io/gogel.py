@@ -1,9 +1,20 @@
 """Functions to read GOGEL dataset for LNG"""
-import pandas as pd
 
 from carbon_bombs.conf import FPATH_SRC_GOGEL_LNG
+from carbon_bombs.io.excel import get_excel_engine
+from carbon_bombs.io.excel import read_excel_cached
+from carbon_bombs.io.schema import apply_schema
 from carbon_bombs.utils.logger import LOGGER
 
+# Schema of the LNG projects dataframe
+LNG_SCHEMA = {
+    "Project_name": "string",
+    "Export_capacity_in_Mtpa": "float64",
+    "Project_status": "category",
+    "Country": "category",
+    "Companies_involved": "string",
+}
+
 
 def load_lng_database():
     """
@@ -15,12 +26,6 @@ def load_lng_database():
         A dataframe containing the data from the database.
     """
     LOGGER.debug("Read GOGEL data: all LNG project")
-    df = pd.read_excel(
-        FPATH_SRC_GOGEL_LNG,
-        sheet_name="LNG Liquefaction projects",
-        engine="openpyxl",
-        skiprows=2,
-    )
     renamed_columns = {
         "Name (project)": "Project_name",
         "Export capacity (Mtpa)": "Export_capacity_in_Mtpa",
@@ -28,8 +33,17 @@ def load_lng_database():
         "Country": "Country",
         "Companies involved": "Companies_involved",
     }
-    # Only keep columns of interest for the project
+    df = read_excel_cached(
+        FPATH_SRC_GOGEL_LNG,
+        sheet_name="LNG Liquefaction projects",
+        engine=get_excel_engine(),
+        skiprows=2,
+        usecols=list(renamed_columns),
+    )
+    # Only keep columns of interest for the project (in this order)
     df = df.loc[:, renamed_columns.keys()]
     # Rename columns
     df = df.rename(columns=renamed_columns)
+    # Check and define column types
+    df = apply_schema(df, LNG_SCHEMA, source="GOGEL LNG")
     return df
@@ -3,8 +3,20 @@ import numpy as np
 import pandas as pd
 
 from carbon_bombs.conf import FPATH_SRC_KHUNE_PAPER
+from carbon_bombs.io.excel import read_excel_cached
+from carbon_bombs.io.schema import apply_schema
 from carbon_bombs.utils.logger import LOGGER
 
+# Schema of coal and gasoil carbon bombs dataframes. Country stays a string
+# since it is edited and concatenated to project names during processing
+KHUNE_PAPER_SCHEMA = {
+    "New_project": "category",
+    "Project Name": "string",
+    "Country": "string",
+    "Potential emissions (GtCO2)": "float64",
+    "Fuel": "category",
+}
+
 
 def load_carbon_bomb_list_database():
     """
@@ -16,7 +28,7 @@ def load_carbon_bomb_list_database():
         A dataframe containing the data from the database.
     """
     LOGGER.debug("Read Khune paper data: all carbon bombs project")
-    df = pd.read_excel(
+    df = read_excel_cached(
         FPATH_SRC_KHUNE_PAPER,
         sheet_name="Full Carbon Bombs List",
         engine="openpyxl",
@@ -67,7 +79,7 @@ def load_carbon_bomb_coal_database():
     correspond to GEM database.
     """
     LOGGER.debug("Read Khune paper data: coal projects")
-    df = pd.read_excel(
+    df = read_excel_cached(
         FPATH_SRC_KHUNE_PAPER, sheet_name="Coal", engine="openpyxl", skipfooter=3
     )
     # Filtering columns of interest
@@ -81,15 +93,8 @@ def load_carbon_bomb_coal_database():
     # TODO: move
     df["New_project"] = np.where(df["New_project"] == "*", "not started", "operating")
 
-    # Define column types
-    dtype_d = {
-        "New_project": "string",
-        "Project Name": "string",
-        "Country": "string",
-        "Potential emissions (GtCO2)": "float",
-        "Fuel": "category",
-    }
-    df = df.astype(dtype_d)
+    # Check and define column types
+    df = apply_schema(df, KHUNE_PAPER_SCHEMA, source="Khune paper")
 
     # Change country name to correspond to GEM database (only for Russia)
     # use "Türkiye" since this is the format in the khune paper
@@ -125,7 +130,7 @@ def load_carbon_bomb_gasoil_database():
     names to correspond to GEM database.
     """
     LOGGER.debug("Read Khune paper data: gasoil projects")
-    df = pd.read_excel(
+    df = read_excel_cached(
         FPATH_SRC_KHUNE_PAPER,
         sheet_name="Oil&Gas",
         engine="openpyxl",
@@ -146,15 +151,8 @@ def load_carbon_bomb_gasoil_database():
     # TODO: move
     df["New_project"] = np.where(df["New_project"] == "*", "not started", "operating")
 
-    # Define column types
-    dtype_d = {
-        "New_project": "string",
-        "Project Name": "string",
-        "Country": "string",
-        "Potential emissions (GtCO2)": "float",
-        "Fuel": "category",
-    }
-    df = df.astype(dtype_d)
+    # Check and define column types
+    df = apply_schema(df, KHUNE_PAPER_SCHEMA, source="Khune paper")
 
     # Change country name to correspond to GEM database (only for Russia)
     # use "Türkiye" since this is the format in the khune paper
@@ -0,0 +1,210 @@
+"""Functions to describe source files with a manifest and detect changes
+
+The manifest of a folder records for each file its size, modification time,
+MD5 and, for Excel files, a hash of the content of each sheet:
+
+    {
+        "file.xlsx": {
+            "size": 1070580,
+            "mtime": 1689238800.0,
+            "md5": "201fc65a2c4e2253cc03113c58558bb7",
+            "sheets": {"Sheet 1": "8f1d...", ...},
+        },
+        "file.csv": {"size": ..., "mtime": ..., "md5": ..., "sheets": None},
+    }
+
+A file whose size and modification time did not change keeps its recorded
+MD5 (no read), and sheets are hashed only when the MD5 changed, so checking
+a folder against its manifest is cheap when nothing changed.
+"""
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from carbon_bombs.conf import DATA_SOURCE_PATH
+from carbon_bombs.conf import FPATH_SRC_MANIFEST
+from carbon_bombs.io.md5 import md5
+from carbon_bombs.utils.logger import LOGGER
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+
+def hash_sheet(df: pd.DataFrame) -> str:
+    """Return a hash of the content (header and values) of a sheet"""
+    return hashlib.md5(df.to_csv(index=False).encode("utf-8")).hexdigest()
+
+
+def get_sheets_hashes(fpath: str) -> dict:
+    """Return the hash of the content of each sheet of an Excel file
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the Excel file
+
+    Returns
+    -------
+    dict
+        Hash of each sheet by sheet name
+    """
+    LOGGER.debug(f"Hash sheets of {fpath}")
+    # not read through the workbook registry: the file may be a temporary
+    # download and hashes are only computed when a file changed
+    with pd.ExcelFile(fpath, engine="openpyxl") as workbook:
+        return {
+            sheet_name: hash_sheet(workbook.parse(sheet_name))
+            for sheet_name in workbook.sheet_names
+        }
+
+
+def get_file_manifest(fpath: str, previous: dict = None) -> dict:
+    """Return the manifest entry of a file (size, modification time, MD5 and
+    hash of each sheet for Excel files)
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the file
+    previous : dict, optional
+        Previous manifest entry of the file, by default None. Its MD5 is kept
+        if the size and modification time did not change and its sheets
+        hashes are kept if the MD5 did not change.
+
+    Returns
+    -------
+    dict
+        Manifest entry of the file
+    """
+    stat = os.stat(fpath)
+    entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    if previous and (previous["size"], previous["mtime"]) == (
+        entry["size"],
+        entry["mtime"],
+    ):
+        entry["md5"] = previous["md5"]
+    else:
+        entry["md5"] = md5(fpath)
+
+    if not fpath.endswith(EXCEL_EXTENSIONS):
+        entry["sheets"] = None
+    elif previous and previous["md5"] == entry["md5"]:
+        entry["sheets"] = previous["sheets"]
+    else:
+        entry["sheets"] = get_sheets_hashes(fpath)
+
+    return entry
+
+
+def create_manifest(dir_path: str = DATA_SOURCE_PATH, previous: dict = None):
+    """Return the manifest of all files of a folder
+
+    Parameters
+    ----------
+    dir_path : str, optional
+        Folder to describe, by default DATA_SOURCE_PATH
+    previous : dict, optional
+        Previous manifest of the folder used to avoid reading unchanged files
+        (see `get_file_manifest`), by default None
+
+    Returns
+    -------
+    dict
+        Manifest entry of each file by file name
+    """
+    previous = previous or {}
+    manifest_name = os.path.basename(FPATH_SRC_MANIFEST)
+    fnames = sorted(
+        fname
+        for fname in os.listdir(dir_path)
+        if os.path.isfile(f"{dir_path}/{fname}") and fname != manifest_name
+    )
+    return {
+        fname: get_file_manifest(f"{dir_path}/{fname}", previous.get(fname))
+        for fname in fnames
+    }
+
+
+def load_manifest(fpath: str = FPATH_SRC_MANIFEST) -> dict:
+    """Load a manifest, empty if the file does not exist"""
+    if not os.path.isfile(fpath):
+        LOGGER.warning(f"No manifest found at {fpath}")
+        return {}
+
+    with open(fpath, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: dict, fpath: str = FPATH_SRC_MANIFEST):
+    """Save a manifest as JSON"""
+    with open(fpath, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    LOGGER.debug(f"Manifest of {len(manifest)} files saved in {fpath}")
+
+
+def update_manifest(
+    dir_path: str = DATA_SOURCE_PATH, fpath: str = FPATH_SRC_MANIFEST
+) -> dict:
+    """Create the manifest of a folder (reusing the saved one for unchanged
+    files) and save it
+
+    Parameters
+    ----------
+    dir_path : str, optional
+        Folder to describe, by default DATA_SOURCE_PATH
+    fpath : str, optional
+        Path of the manifest, by default FPATH_SRC_MANIFEST
+
+    Returns
+    -------
+    dict
+        Manifest of the folder
+    """
+    manifest = create_manifest(dir_path, previous=load_manifest(fpath))
+    save_manifest(manifest, fpath)
+    return manifest
+
+
+def compare_manifests(old: dict, new: dict) -> dict:
+    """Compare two manifests by hash
+
+    Parameters
+    ----------
+    old : dict
+        Reference manifest
+    new : dict
+        Manifest to compare to the reference
+
+    Returns
+    -------
+    dict
+        - added: files only in `new`
+        - removed: files only in `old`
+        - changed: files whose MD5 changed with the sheets whose content
+          changed (added and removed sheets included, None for non Excel
+          files)
+    """
+    changed = {}
+    for fname in sorted(set(old) & set(new)):
+        if old[fname]["md5"] == new[fname]["md5"]:
+            continue
+
+        old_sheets = old[fname]["sheets"]
+        new_sheets = new[fname]["sheets"]
+        if old_sheets is None or new_sheets is None:
+            changed[fname] = None
+        else:
+            changed[fname] = sorted(
+                sheet
+                for sheet in set(old_sheets) | set(new_sheets)
+                if old_sheets.get(sheet) != new_sheets.get(sheet)
+            )
+
+    return {
+        "added": sorted(set(new) - set(old)),
+        "removed": sorted(set(old) - set(new)),
+        "changed": changed,
+    }
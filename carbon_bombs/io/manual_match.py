@@ -4,22 +4,24 @@ Script that define dictionnaries objects that allows to make correspondance
 between the differents database.\n
 Pay attention that some Carbon Bombs have beeen renamed with they country in
 order to avoid duplication on manual matching
-It define 3 dictionnaries :\n
-manual_match_coal : Dictionnary that defined key-value pair to allow the
-correspondance between Climate Bombs name into K.Kuhne paper (dictionnary key)
-and Coal extraction site defined in GEM database (dictionnary value). This
-correspondance is only applicable to Coal extraction sites.\n
-manual_match_gasoil: Dictionnary that defined key-value pair to allow the
-correspondance between Climate Bombs name into K.Kuhne paper (dictionnary key)
-and Gasoil extraction site defined in GEM database (dictionnary value). This
-correspondance is only applicable to Gasoil extraction sites.\n
-manual_match_company: Dictionnary that defined key-value pair to allow the
-correspondance between fossil fuel company defined into Parent company column
-of GEM database (dictionnary key) and fossil fuel company defined into
-Banking on Climate Chaos (BOCC) database\n
+It define 3 dictionnaries, read on first call of their accessor :\n
+manual_match_coal (get_manual_match_coal) : Dictionnary that defined key-value
+pair to allow the correspondance between Climate Bombs name into K.Kuhne paper
+(dictionnary key) and Coal extraction site defined in GEM database (dictionnary
+value). This correspondance is only applicable to Coal extraction sites.\n
+manual_match_gasoil (get_manual_match_gasoil): Dictionnary that defined
+key-value pair to allow the correspondance between Climate Bombs name into
+K.Kuhne paper (dictionnary key) and Gasoil extraction site defined in GEM
+database (dictionnary value). This correspondance is only applicable to Gasoil
+extraction sites.\n
+manual_match_company (get_manual_match_company): Dictionnary that defined
+key-value pair to allow the correspondance between fossil fuel company defined
+into Parent company column of GEM database (dictionnary key) and fossil fuel
+company defined into Banking on Climate Chaos (BOCC) database\n
 """
+from functools import lru_cache
+
 import numpy as np
-import pandas as pd
 
 from carbon_bombs.conf import FPATH_SRC_MANUAL_MATCHING
 from carbon_bombs.conf import SHEETNAME_BANK
@@ -27,64 +29,112 @@ from carbon_bombs.conf import SHEETNAME_COMPANIES
 from carbon_bombs.conf import SHEETNAME_GEM_COAL
 from carbon_bombs.conf import SHEETNAME_GEM_GASOIL
 from carbon_bombs.conf import SHEETNAME_LAT_LONG
+from carbon_bombs.io.excel import read_excel_cached
 
-# Dictionnary for Coal Mine only
-match_coal = pd.read_excel(FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_GEM_COAL)
-# Remove match that are not used anymore
-match_coal = match_coal.loc[match_coal["endDate"].isna()]
-match_coal = (
-    match_coal.fillna("None")
-    .groupby("CarbonBombs KK")
-    .agg(units=("Mine name", lambda x: "$".join(x)))
-)
-manual_match_coal = match_coal["units"].to_dict()
+# Sheets are read on first use of each accessor and then memoised
 
-# Dictionnary for Gas and Oil only
-match_gasoil = pd.read_excel(
-    FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_GEM_GASOIL
-).dropna(subset=["CarbonBombs KK"])
-# Remove match that are not used anymore
-match_gasoil = match_gasoil.loc[match_gasoil["endDate"].isna()]
-match_gasoil["CB"] = match_gasoil["CarbonBombs KK"] + np.where(
-    match_gasoil["country"].isna(), "", "_" + match_gasoil["country"]
-)
-match_gasoil = (
-    match_gasoil.fillna("None")
-    .groupby("CB")
-    .agg(units=("Unit name", lambda x: "$".join(x)))
-)
-manual_match_gasoil = match_gasoil["units"].to_dict()
 
-# Dictionnary for company matching between GEM (Global Energy Monitor) (key)
-# and BOCC (Banking On Climate Chaos) (values)
-match_bank = pd.read_excel(FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_BANK)
-# Remove match that are not used anymore
-match_bank = match_bank.loc[match_bank["endDate"].isna()]
-manual_match_bank = match_bank.set_index("BankfromBankTracksWebsite")[
-    "BankfromBOCC"
-].to_dict()
+@lru_cache(maxsize=None)
+def get_manual_match_coal() -> dict:
+    """Dictionnary for Coal Mine only: Carbon Bomb name -> GEM mines names
+    separated by `$`
+    """
+    match_coal = read_excel_cached(
+        FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_GEM_COAL
+    )
+    # Remove match that are not used anymore
+    match_coal = match_coal.loc[match_coal["endDate"].isna()]
+    match_coal = (
+        match_coal.fillna("None")
+        .groupby("CarbonBombs KK")
+        .agg(units=("Mine name", lambda x: "$".join(x)))
+    )
+    return match_coal["units"].to_dict()
+
+
+@lru_cache(maxsize=None)
+def get_manual_match_gasoil() -> dict:
+    """Dictionnary for Gas and Oil only: Carbon Bomb name (with `_country`
+    if given) -> GEM units names separated by `$`
+    """
+    match_gasoil = read_excel_cached(
+        FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_GEM_GASOIL
+    ).dropna(subset=["CarbonBombs KK"])
+    # Remove match that are not used anymore
+    match_gasoil = match_gasoil.loc[match_gasoil["endDate"].isna()]
+    match_gasoil["CB"] = match_gasoil["CarbonBombs KK"] + np.where(
+        match_gasoil["country"].isna(), "", "_" + match_gasoil["country"]
+    )
+    match_gasoil = (
+        match_gasoil.fillna("None")
+        .groupby("CB")
+        .agg(units=("Unit name", lambda x: "$".join(x)))
+    )
+    return match_gasoil["units"].to_dict()
+
+
+@lru_cache(maxsize=None)
+def get_manual_match_bank() -> dict:
+    """Dictionnary for bank matching between BankTrack (key)
+    and BOCC (Banking On Climate Chaos) (values)
+    """
+    match_bank = read_excel_cached(
+        FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_BANK
+    )
+    # Remove match that are not used anymore
+    match_bank = match_bank.loc[match_bank["endDate"].isna()]
+    return match_bank.set_index("BankfromBankTracksWebsite")["BankfromBOCC"].to_dict()
+
+
+@lru_cache(maxsize=None)
+def get_manual_match_company() -> dict:
+    """Dictionnary for company matching between GEM (Global Energy Monitor)
+    (key) and BOCC (Banking On Climate Chaos) (values)
+    """
+    match_companies = read_excel_cached(
+        FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_COMPANIES
+    )
+    # Remove match that are not used anymore
+    match_companies = match_companies.loc[match_companies["endDate"].isna()]
+    return (
+        match_companies.set_index("CompanyGEM")["CompanyBOCC (Neo4j real name)"]
+        .dropna()
+        .to_dict()
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_manual_match_lat_long():
+    """Read the manual Latitude Longitude sheet"""
+    manual_match_lat_long = read_excel_cached(
+        FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_LAT_LONG
+    )
+    # Remove match that are not used anymore
+    return manual_match_lat_long.loc[manual_match_lat_long["endDate"].isna()]
+
+
+def get_manual_match_lat_long():
+    """Dataframe to match Latitude Longitude (a copy, so it can be modified)"""
+    return _load_manual_match_lat_long().copy()
+
+
+# Former module attributes, now computed on first access
+_lazy_attributes = {
+    "manual_match_coal": get_manual_match_coal,
+    "manual_match_gasoil": get_manual_match_gasoil,
+    "manual_match_bank": get_manual_match_bank,
+    "manual_match_company": get_manual_match_company,
+    "manual_match_lat_long": get_manual_match_lat_long,
+}
 
-# Dictionnary for bank matching between BankTrack (key)
-# and BOCC (Banking On Climate Chaos) (values)
-match_companies = pd.read_excel(
-    FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_COMPANIES
-)
-# Remove match that are not used anymore
-match_companies = match_companies.loc[match_companies["endDate"].isna()]
-manual_match_company = (
-    match_companies.set_index("CompanyGEM")["CompanyBOCC (Neo4j real name)"]
-    .dropna()
-    .to_dict()
-)
 
-# Dataframe to match Latitude Longitude
-manual_match_lat_long = pd.read_excel(
-    FPATH_SRC_MANUAL_MATCHING, sheet_name=SHEETNAME_LAT_LONG
-)
-# Remove match that are not used anymore
-manual_match_lat_long = manual_match_lat_long.loc[
-    manual_match_lat_long["endDate"].isna()
-]
+def __getattr__(name):
+    """Return former module attributes (e.g. `manual_match_coal`) from their
+    memoised accessor, read on first access instead of at import
+    """
+    if name in _lazy_attributes:
+        return _lazy_attributes[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 """
@@ -1,12 +1,28 @@
-"""Functions to update and purge neo4j"""
+"""Functions to update and purge neo4j
+
+Neo4J 5.x or later is required (constraints are created with the
+`CREATE CONSTRAINT ... FOR ... REQUIRE` syntax introduced in Neo4J 5.0).
+"""
+import asyncio
+import atexit
+import gzip
 import os
+import shutil
+import time
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
+from neo4j import AsyncGraphDatabase
 from neo4j import basic_auth
 from neo4j import GraphDatabase
+from neo4j.exceptions import CypherSyntaxError
+from neo4j.exceptions import DriverError
+from neo4j.exceptions import Neo4jError
 import json 
 
+from carbon_bombs.conf import DATA_NEO4J_IMPORT_PATH
+from carbon_bombs.conf import DATA_NEO4J_SYNCED_PATH
 from carbon_bombs.conf import FPATH_NEO4J_BANK
 from carbon_bombs.conf import FPATH_NEO4J_CB
 from carbon_bombs.conf import FPATH_NEO4J_COMP
@@ -23,13 +39,27 @@ from carbon_bombs.conf import FPATH_OUT_CONX_BANK_COMP
 from carbon_bombs.conf import FPATH_OUT_CONX_CB_COMP
 from carbon_bombs.conf import FPATH_OUT_COUNTRY
 from carbon_bombs.conf import FPATH_OUT_LOCAL_DATABASE
+from carbon_bombs.conf import FPATH_OUT_LOCAL_DATABASE_GZIP
+from carbon_bombs.conf import FPATH_OUT_LOCAL_DATABASE_MSGPACK
+from carbon_bombs.io.banking_climate_chaos import is_year_column
 from carbon_bombs.utils.logger import LOGGER
 
-load_dotenv()
+# Environment variables holding Neo4J connection settings (also read from .env)
+NEO4J_SETTINGS = ("NEO4J_URI", "NEO4J_USERNAME", "NEO4J_PASSWORD")
 
-NEO4J_URI = os.environ["NEO4J_URI"]
-NEO4J_USERNAME = os.environ["NEO4J_USERNAME"]
-NEO4J_PASSWORD = os.environ["NEO4J_PASSWORD"]
+# Driver shared by all functions of the module, created on first use
+_DRIVER = None
+
+# Number of rows sent to Neo4J in one UNWIND query / transaction
+NEO4J_BATCH_SIZE = 1000
+
+# Maximum number of transactions running at the same time in `update_neo4j_async`
+NEO4J_CONCURRENCY = 4
+# Number of attempts of a transaction failing with a transient error
+NEO4J_MAX_RETRIES = 5
+
+# Separator of node keys in the `:ID` column of neo4j-admin import files
+NEO4J_IMPORT_ID_SEP = "|"
 
 carbon_bombs_new_column = {
     "Carbon_bomb_name_source_CB": "name",
@@ -92,12 +122,157 @@ country_new_column = {
     "Year_Surface_thousand_km2": "year_surface_thousand_km2",
 }
 
+# Properties identifying a node for each label
+# (used for uniqueness constraints and to MERGE nodes)
+nodes_keys = {
+    "carbon_bomb": ["name", "country"],
+    "company": ["name"],
+    "bank": ["name"],
+    "country": ["name"],
+}
+
+# Neo4J CSV of each node label
+nodes_fpaths = {
+    "carbon_bomb": FPATH_NEO4J_CB,
+    "company": FPATH_NEO4J_COMP,
+    "bank": FPATH_NEO4J_BANK,
+    "country": FPATH_NEO4J_COUNTRY,
+}
+
+# Relationships written into Neo4J:
+# - type: relationship type
+# - start / end: (label, {node property: column}) used to match the nodes
+# - fpath: Neo4J CSV of the relationships
+# - columns: CSV columns to keep and their name in the query
+# - year_columns: name in the query of the year columns found in the CSV
+#   (e.g. "2016" -> "year_2016")
+# - constants: constant properties added to every relationship
+connexions_specs = {
+    "cb_companies": {
+        "type": "OPERATES",
+        "start": ("company", {"name": "company"}),
+        "end": ("carbon_bomb", {"name": "carbon_bomb", "country": "country"}),
+        "fpath": FPATH_NEO4J_CONX_CB_COMP,
+        "columns": {
+            "Carbon_bomb_name": "carbon_bomb",
+            "Company": "company",
+            "Country": "country",
+        },
+        "constants": {"weight": 1},  # row['Percentage']
+    },
+    "bank_companies": {
+        "type": "FINANCES",
+        "start": ("bank", {"name": "bank"}),
+        "end": ("company", {"name": "company"}),
+        "fpath": FPATH_NEO4J_CONX_BANK_COMP,
+        "columns": {
+            "Bank": "bank",
+            "Company": "company",
+            "Grand Total": "total",
+        },
+        "year_columns": "year_{}",
+    },
+    "cb_country": {
+        "type": "IS_LOCATED",
+        "start": ("carbon_bomb", {"name": "carbon_bomb", "country": "country"}),
+        "end": ("country", {"name": "country"}),
+        "fpath": FPATH_NEO4J_CONX_CB_COUNTRY,
+        "columns": {"Carbon_bomb": "carbon_bomb", "Country": "country"},
+    },
+    "companies_country": {
+        "type": "IS_LOCATED",
+        "start": ("company", {"name": "company", "country": "country"}),
+        "end": ("country", {"name": "country"}),
+        "fpath": FPATH_NEO4J_CONX_COMP_COUNTRY,
+        "columns": {"Company": "company", "Country": "country"},
+    },
+    "bank_country": {
+        "type": "IS_LOCATED",
+        # bank nodes have no country property (only headquarters_country)
+        "start": ("bank", {"name": "bank"}),
+        "end": ("country", {"name": "country"}),
+        "fpath": FPATH_NEO4J_CONX_BANK_COUNTRY,
+        "columns": {"Bank": "bank", "Country": "country"},
+    },
+}
+
+
+def get_neo4j_config() -> tuple:
+    """Read Neo4J connection settings from the environment (or .env file).
+
+    Returns
+    -------
+    tuple
+        (uri, auth) to give to the Neo4J driver
+
+    Raises
+    ------
+    KeyError
+        If a setting is missing
+    """
+    load_dotenv()
+
+    missing = [name for name in NEO4J_SETTINGS if name not in os.environ]
+    if missing:
+        raise KeyError(f"Missing Neo4J settings in environment: {missing}")
+
+    uri, username, password = (os.environ[name] for name in NEO4J_SETTINGS)
+    return uri, basic_auth(username, password)
+
+
+def get_driver():
+    """Return the Neo4J driver shared by the module, creating it (and its
+    connection pool) on first call. The driver is closed at exit or by
+    `close_driver`.
+    """
+    global _DRIVER
+
+    if _DRIVER is None:
+        LOGGER.debug("Connect to driver...")
+        uri, auth = get_neo4j_config()
+        _DRIVER = GraphDatabase.driver(uri, auth=auth)
+        LOGGER.debug("Driver connected")
+
+    return _DRIVER
+
+
+@atexit.register
+def close_driver():
+    """Close the shared Neo4J driver if it was created"""
+    global _DRIVER
+
+    if _DRIVER is not None:
+        _DRIVER.close()
+        _DRIVER = None
+
+
+def read_cleaned_datasets() -> dict:
+    """Read once every cleaned dataset used by Neo4J, by file path"""
+    return {
+        fpath: pd.read_csv(fpath)
+        for fpath in (
+            FPATH_OUT_CB,
+            FPATH_OUT_COMP,
+            FPATH_OUT_BANK,
+            FPATH_OUT_COUNTRY,
+            FPATH_OUT_CONX_CB_COMP,
+            FPATH_OUT_CONX_BANK_COMP,
+        )
+    }
+
+
+def _read_cleaned(fpath_cleaned: str, cleaned: dict = None) -> pd.DataFrame:
+    """Return a cleaned dataset from `cleaned` if given else read it"""
+    if cleaned is None:
+        return pd.read_csv(fpath_cleaned)
+    return cleaned[fpath_cleaned]
+
 
 def _update_dataset_for_neo4j(
-    fpath_cleaned: str, fpath_neo4j: str, map_columns: dict
+    fpath_cleaned: str, fpath_neo4j: str, map_columns: dict, cleaned: dict = None
 ) -> pd.DataFrame:
     """Update a cleaned dataset for Neo4J"""
-    data = pd.read_csv(fpath_cleaned)
+    data = _read_cleaned(fpath_cleaned, cleaned)
 
     # Replace missing values
     data = data.fillna("None")
@@ -111,294 +286,371 @@ def _update_dataset_for_neo4j(
     return data
 
 
-def update_csv_nodes_neo4j():
-    """Update nodes dataset for Neo4J and return formated datasets."""
+def update_csv_nodes_neo4j(cleaned: dict = None):
+    """Update nodes dataset for Neo4J and return formated datasets.
+    Cleaned datasets are taken from `cleaned` (see `read_cleaned_datasets`)
+    if given else read from disk.
+    """
     # update neo4j CSV for CB
     carbon_bombs = _update_dataset_for_neo4j(
-        FPATH_OUT_CB, FPATH_NEO4J_CB, carbon_bombs_new_column
+        FPATH_OUT_CB, FPATH_NEO4J_CB, carbon_bombs_new_column, cleaned
     )
     # update neo4j CSV for companies
     companies = _update_dataset_for_neo4j(
-        FPATH_OUT_COMP, FPATH_NEO4J_COMP, companies_new_column
+        FPATH_OUT_COMP, FPATH_NEO4J_COMP, companies_new_column, cleaned
     )
     # update neo4j CSV for banks
     banks = _update_dataset_for_neo4j(
-        FPATH_OUT_BANK, FPATH_NEO4J_BANK, banks_new_column
+        FPATH_OUT_BANK, FPATH_NEO4J_BANK, banks_new_column, cleaned
     )
     # update neo4j CSV for country
     countries = _update_dataset_for_neo4j(
-        FPATH_OUT_COUNTRY, FPATH_NEO4J_COUNTRY, country_new_column
+        FPATH_OUT_COUNTRY, FPATH_NEO4J_COUNTRY, country_new_column, cleaned
     )
 
     return carbon_bombs, companies, banks, countries
 
 
-def write_nodes(driver, node_type, node_data):
-    """Write all nodes given a node type (bank, country, carbon_bomb or company)
-    and its data.
-    """
-    LOGGER.debug(f"{node_type} nodes: start writing...")
+def _update_connexions_for_neo4j(
+    fpath_cleaned: str,
+    fpath_neo4j: str,
+    map_columns: dict = None,
+    cleaned: dict = None,
+) -> pd.DataFrame:
+    """Update a cleaned connexions dataset for Neo4J"""
+    data = _read_cleaned(fpath_cleaned, cleaned)
 
-    def _create_nodes(tx, node_type, node_data):
-        cypher_query_carbon_bombs = f"MERGE (n:{node_type} " + "{"
+    # Keep only wanted columns and rename it to wanted format
+    if map_columns is not None:
+        data = data[map_columns.keys()]
+        data = data.rename(columns=map_columns)
 
-        # Dynamically build the query string that sets the attributes
-        for key in node_data.keys():
-            cypher_query_carbon_bombs += f"{key}: ${key},"
+    data.to_csv(fpath_neo4j, encoding="utf-8-sig", index=False)
 
-        # Remove the trailing comma and add closing brackets
-        cypher_query_carbon_bombs = cypher_query_carbon_bombs[:-1] + "})"
-        tx.run(cypher_query_carbon_bombs, **node_data)
+    return data
 
-    with driver.session(database="neo4j") as session:
-        for _, row in node_data.iterrows():
-            LOGGER.debug(f"{node_type} nodes: write `{row.iloc[0]}`")
-            session.execute_write(_create_nodes, node_type, row)
 
-    LOGGER.debug(f"{node_type} nodes: writing done")
+# Cleaned dataset of each connexion and its columns to keep and rename
+# (None to keep all columns)
+connexions_sources = {
+    "cb_companies": (FPATH_OUT_CONX_CB_COMP, None),
+    "bank_companies": (FPATH_OUT_CONX_BANK_COMP, None),
+    "cb_country": (
+        FPATH_OUT_CB,
+        {"Carbon_bomb_name_source_CB": "Carbon_bomb", "Country_source_CB": "Country"},
+    ),
+    "companies_country": (
+        FPATH_OUT_COMP,
+        {"Company_name": "Company", "Country": "Country"},
+    ),
+    "bank_country": (
+        FPATH_OUT_BANK,
+        {"Bank Name": "Bank", "Headquarters country": "Country"},
+    ),
+}
 
 
-def _write_connexions_cb_companies(driver):
-    """Write connexions between CB nodes and company nodes"""
-    ### Carbon Bombs and Companies relationship
-    LOGGER.debug("Start writing connexions between carbon bombs and companies")
-    carbonbombs_companies = pd.read_csv(FPATH_OUT_CONX_CB_COMP)
-    carbonbombs_companies.to_csv(
-        FPATH_NEO4J_CONX_CB_COMP, encoding="utf-8-sig", index=False
+def _update_csv_connexion_neo4j(name: str, cleaned: dict = None) -> pd.DataFrame:
+    """Update the dataset of one connexion for Neo4J and return it formated
+    (see `connexions_specs`)
+    """
+    fpath_cleaned, map_columns = connexions_sources[name]
+    spec = connexions_specs[name]
+    data = _update_connexions_for_neo4j(
+        fpath_cleaned, spec["fpath"], map_columns, cleaned
     )
+    return _format_connexions(data, spec)
+
 
-    query_cb_company = """
-        MATCH (cb:carbon_bomb {name: $carbon_bomb, country: $country})
-        MATCH (c:company {name: $company})
-        MERGE (c)-[:OPERATES {weight: $weight}]->(cb)
+def update_csv_connexions_neo4j(cleaned: dict = None) -> dict:
+    """Update connexions datasets for Neo4J and return formated datasets
+    (see `connexions_specs`) by connexion name. Cleaned datasets are taken
+    from `cleaned` (see `read_cleaned_datasets`) if given else read from disk.
     """
+    return {
+        name: _update_csv_connexion_neo4j(name, cleaned) for name in connexions_specs
+    }
 
-    def create_interaction_cb_companies(tx, cb, company, country, weight):
-        tx.run(
-            query_cb_company,
-            carbon_bomb=cb,
-            company=company,
-            country=country,
-            weight=weight,
-        )
 
-    with driver.session(database="neo4j") as session:
-        for _, row in carbonbombs_companies.iterrows():
-            carbon_bomb = row["Carbon_bomb_name"]
-            company = row["Company"]
-            country = row["Country"]
-            LOGGER.debug(
-                f"Connexion CB to COMPANY: write `{carbon_bomb}` - `{company}`"
-            )
-            weight = 1  # row['Percentage']
-            session.execute_write(
-                create_interaction_cb_companies, carbon_bomb, company, country, weight
-            )
-    LOGGER.debug("Writing connexions between carbon bombs and companies done")
+def _get_connexion_columns(spec: dict, csv_columns: list) -> dict:
+    """Return Neo4J CSV columns of a connexion and their name in the query,
+    adding year columns found in `csv_columns` (in the CSV order)"""
+    if "year_columns" not in spec:
+        return spec["columns"]
 
+    columns = dict(spec["columns"])
+    for col in csv_columns:
+        if is_year_column(col):
+            columns[col] = spec["year_columns"].format(col)
 
-def _write_connexions_bank_companies(driver):
-    """Write connexions between bank nodes and company nodes"""
-    LOGGER.debug("Start writing connexions between banks and companies")
-    ### Banks and Companies relationship
-    banks_companies = pd.read_csv(FPATH_OUT_CONX_BANK_COMP)
-    banks_companies.to_csv(
-        FPATH_NEO4J_CONX_BANK_COMP, encoding="utf-8-sig", index=False
-    )
-    query_bank_company = """
-        MATCH (c:company {name: $company})
-        MATCH (b:bank {name: $bank})
-        MERGE (b)-[:FINANCES {
-            total: $total,
-            year_2016: $year_2016,
-            year_2017: $year_2017,
-            year_2018: $year_2018,
-            year_2019: $year_2019,
-            year_2020: $year_2020,
-            year_2021: $year_2021,
-            year_2022: $year_2022
-            }]->(c)
-    """
+    position = {col: i for i, col in enumerate(csv_columns)}
+    return dict(sorted(columns.items(), key=lambda item: position.get(item[0], -1)))
 
-    def create_interaction_banks_companies(
-        tx,
-        bank,
-        company,
-        year_2016,
-        year_2017,
-        year_2018,
-        year_2019,
-        year_2020,
-        year_2021,
-        year_2022,
-        total,
-    ):
-        tx.run(
-            query_bank_company,
-            bank=bank,
-            company=company,
-            year_2016=year_2016,
-            year_2017=year_2017,
-            year_2018=year_2018,
-            year_2019=year_2019,
-            year_2020=year_2020,
-            year_2021=year_2021,
-            year_2022=year_2022,
-            total=total,
-        )
 
-    with driver.session(database="neo4j") as session:
-        for _, row in banks_companies.iterrows():
-            bank = row["Bank"]
-            company = row["Company"]
-            year_2016 = row["2016"]
-            year_2017 = row["2017"]
-            year_2018 = row["2018"]
-            year_2019 = row["2019"]
-            year_2020 = row["2020"]
-            year_2021 = row["2021"]
-            year_2022 = row["2022"]
-            total = row["Grand Total"]
-            LOGGER.debug(f"Connexion BANK to COMPANY: write `{bank}` - `{company}`")
-            session.execute_write(
-                create_interaction_banks_companies,
-                bank,
-                company,
-                year_2016,
-                year_2017,
-                year_2018,
-                year_2019,
-                year_2020,
-                year_2021,
-                year_2022,
-                total,
-            )
-    LOGGER.debug("Writing connexions between banks and companies done")
+def _format_connexions(data: pd.DataFrame, spec: dict) -> pd.DataFrame:
+    """Keep and rename Neo4J CSV columns of a connexion to query parameters"""
+    columns = _get_connexion_columns(spec, list(data.columns))
+    data = data[columns.keys()].rename(columns=columns)
+    return data.assign(**spec.get("constants", {}))
 
 
-def _write_connexions_cb_country(driver):
-    """Write connexions between CB nodes and country nodes"""
-    LOGGER.debug("Start writing connexions between carbon bombs and countries")
-    ### Carbon Bombs and Country relationship
-    carbonbombs_informations = pd.read_csv(FPATH_OUT_CB)
+def _iter_batches(rows: list, batch_size: int):
+    """Yield successive chunks of `batch_size` elements from `rows`"""
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
 
-    filtered_columns = ["Carbon_bomb_name_source_CB", "Country_source_CB"]
-    carbonbombs_countries = carbonbombs_informations[filtered_columns]
-    carbonbombs_countries.columns = ["Carbon_bomb", "Country"]
+    for start in range(0, len(rows), batch_size):
+        yield rows[start : start + batch_size]
 
-    carbonbombs_countries.to_csv(
-        FPATH_NEO4J_CONX_CB_COUNTRY, encoding="utf-8-sig", index=False
-    )
-    query_cb_country = """
-        MATCH (cb:carbon_bomb {name: $carbon_bomb, country: $country})
-        MATCH (c:country {name: $country})
-        MERGE (cb)-[:IS_LOCATED]->(c)
+
+def _run_query(tx, query: str, **params):
+    """Run a cypher query inside a transaction"""
+    tx.run(query, **params)
+
+
+def _write_batches(driver, name: str, query: str, rows: list, batch_size: int):
+    """Run `query` for each chunk of `rows` (given as `$rows` parameter) in its
+    own write transaction. Log and return the number of rows written per second.
     """
+    start = time.perf_counter()
+    with driver.session(database="neo4j") as session:
+        for batch in _iter_batches(rows, batch_size):
+            LOGGER.debug(f"{name}: write batch of {len(batch)} rows")
+            session.execute_write(_run_query, query, rows=batch)
+    elapsed = time.perf_counter() - start
+
+    rows_per_sec = len(rows) / elapsed if elapsed > 0 else float("inf")
+    LOGGER.info(
+        f"{name}: {len(rows)} rows written in {elapsed:.2f}s "
+        f"({rows_per_sec:.0f} rows/s)"
+    )
+
+    return rows_per_sec
 
-    def create_interaction_cb_countries(tx, cb, country):
-        tx.run(query_cb_country, carbon_bomb=cb, country=country)
 
+def create_constraints(driver):
+    """Create uniqueness constraints on node keys (see `nodes_keys`), each one
+    backed by an index, wait for them to be online and verify them.
+
+    Constraints are created with `IF NOT EXISTS` so calling this function
+    on an already configured database is harmless.
+
+    Raises
+    ------
+    RuntimeError
+        If the server is older than Neo4J 5.0, if a constraint is missing
+        or if its index is not online
+
+    Notes
+    -----
+    Neo4J 4.x is not supported: its `ON ... ASSERT` syntax cannot create a
+    uniqueness constraint on several properties, needed for carbon bombs
+    (name, country).
+    """
+    LOGGER.debug("Create constraints and indexes on node keys...")
     with driver.session(database="neo4j") as session:
-        for _, row in carbonbombs_countries.iterrows():
-            carbon_bomb = row["Carbon_bomb"]
-            country = row["Country"]
-            LOGGER.debug(
-                f"Connexion CB to COUNTRY: write `{carbon_bomb}` - `{country}`"
-            )
-            session.execute_write(create_interaction_cb_countries, carbon_bomb, country)
+        for label, keys in nodes_keys.items():
+            properties = ", ".join(f"n.{key}" for key in keys)
+            try:
+                session.run(
+                    f"CREATE CONSTRAINT {label}_key IF NOT EXISTS "
+                    f"FOR (n:{label}) REQUIRE ({properties}) IS UNIQUE"
+                ).consume()
+            except CypherSyntaxError as error:
+                raise RuntimeError(
+                    f"{label}: cannot create constraint, Neo4J 5.x or later "
+                    f"is required ({error.message})"
+                ) from error
+        session.run("CALL db.awaitIndexes(300)").consume()
+
+        constraints = session.run(
+            "SHOW CONSTRAINTS YIELD labelsOrTypes, properties, ownedIndex"
+        ).data()
+        indexes = session.run("SHOW INDEXES YIELD name, state").data()
+
+    index_state = {index["name"]: index["state"] for index in indexes}
+    found = {
+        (c["labelsOrTypes"][0], tuple(c["properties"])): c["ownedIndex"]
+        for c in constraints
+    }
+    for label, keys in nodes_keys.items():
+        owned_index = found.get((label, tuple(keys)))
+        if owned_index is None:
+            raise RuntimeError(f"{label}: no uniqueness constraint on {keys}")
+        if index_state.get(owned_index) != "ONLINE":
+            raise RuntimeError(f"{label}: index `{owned_index}` is not online")
+        LOGGER.debug(f"{label}: constraint and index on {keys} are online")
+
+
+def _get_plan_operators(plan: dict) -> list:
+    """Return the operator types of a query plan (and its children)"""
+    operators = [plan["operatorType"].split("@")[0]]
+    for child in plan.get("children", []):
+        operators.extend(_get_plan_operators(child))
+    return operators
+
+
+def log_query_plan(driver, name: str, query: str):
+    """Log the operators of the plan of `query` (using EXPLAIN, so the query
+    is not executed) and warn if the nodes are not found through an index seek.
+    """
+    with driver.session(database="neo4j") as session:
+        summary = session.run(f"EXPLAIN {query}", rows=[]).consume()
 
-    LOGGER.debug("Writing connexions between carbon bombs and countries done")
+    operators = _get_plan_operators(summary.plan)
+    LOGGER.info(f"{name}: query plan {' <- '.join(operators)}")
 
+    if not any("IndexSeek" in operator for operator in operators):
+        LOGGER.warning(f"{name}: no index seek in query plan (label scan)")
 
-def _write_connexions_companies_country(driver):
-    """Write connexions between company nodes and company nodes"""
-    LOGGER.debug("Start writing connexions between companies and countries")
-    ### Company and Country relationship
-    company_informations = pd.read_csv(FPATH_OUT_COMP)
 
-    filtered_columns = ["Company_name", "Country"]
-    companies_countries = company_informations[filtered_columns]
-    companies_countries.columns = ["Company", "Country"]
+def _build_node_query(node_type: str, columns: list) -> str:
+    """Build the UNWIND query that merges nodes on their keys then sets every
+    column as property.
+    """
+    keys = nodes_keys.get(node_type, list(columns))
+    keys = ", ".join(f"{key}: row.{key}" for key in keys)
+    return f"UNWIND $rows AS row MERGE (n:{node_type} {{{keys}}}) SET n += row"
 
-    companies_countries.to_csv(
-        FPATH_NEO4J_CONX_COMP_COUNTRY, encoding="utf-8-sig", index=False
-    )
 
-    query_company_country = """
-        MATCH (cp:company {name: $company, country: $country})
-        MATCH (c:country {name: $country})
-        MERGE (cp)-[:IS_LOCATED]->(c)
+def write_nodes(driver, node_type, node_data, batch_size=NEO4J_BATCH_SIZE):
+    """Write all nodes given a node type (bank, country, carbon_bomb or company)
+    and its data.
+
+    Rows are sent by chunks of `batch_size` through a single parameterised
+    `UNWIND $rows AS row MERGE ...` query, one transaction per chunk.
+    Nodes are merged on their keys (see `nodes_keys`) and their other
+    properties are set, so writing twice the same data is harmless.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        Neo4J driver (or any object exposing the same session API)
+    node_type : str
+        Label of the nodes to write
+    node_data : pd.DataFrame
+        Nodes data, one row per node and one column per property
+    batch_size : int, optional
+        Number of rows written per transaction, by default NEO4J_BATCH_SIZE
+
+    Returns
+    -------
+    float
+        Number of rows written per second
     """
+    LOGGER.debug(f"{node_type} nodes: start writing...")
 
-    def create_interaction_companies_countries(tx, company, country):
-        tx.run(query_company_country, company=company, country=country)
+    query = _build_node_query(node_type, node_data.columns)
+    rows = node_data.to_dict(orient="records")
 
-    with driver.session(database="neo4j") as session:
-        for _, row in companies_countries.iterrows():
-            company = row["Company"]
-            country = row["Country"]
-            LOGGER.debug(
-                f"Connexion COMPANY to COUNTRY: write `{company}` - `{country}`"
-            )
-            session.execute_write(
-                create_interaction_companies_countries, company, country
-            )
+    return _write_batches(driver, f"{node_type} nodes", query, rows, batch_size)
 
-    LOGGER.debug("Writing connexions between companies and countries done")
 
+def _node_pattern(var: str, node: tuple) -> str:
+    """Return the cypher pattern matching a node from `row` values given
+    its (label, {node property: column}) tuple.
+    """
+    label, keys = node
+    keys = ", ".join(f"{prop}: row.{column}" for prop, column in keys.items())
+    return f"({var}:{label} {{{keys}}})"
 
-def _write_connexions_bank_country(driver):
-    """Write connexions between bank nodes and country nodes"""
-    LOGGER.debug("Start writing connexions between banks and countries")
-    ### Bank and Country relationship
-    bank_informations = pd.read_csv(FPATH_OUT_BANK)
 
-    filtered_columns = ["Bank Name", "Headquarters country"]
-    banks_countries = bank_informations[filtered_columns]
-    banks_countries.columns = ["Bank", "Country"]
+def _build_relationship_query(spec: dict, properties: list) -> str:
+    """Build the UNWIND query that writes relationships described by `spec`"""
+    rel_properties = ", ".join(f"{prop}: row.{prop}" for prop in properties)
+    rel_properties = f" {{{rel_properties}}}" if rel_properties else ""
 
-    banks_countries.to_csv(
-        FPATH_NEO4J_CONX_BANK_COUNTRY, encoding="utf-8-sig", index=False
+    return (
+        "UNWIND $rows AS row "
+        f"MATCH {_node_pattern('s', spec['start'])} "
+        f"MATCH {_node_pattern('e', spec['end'])} "
+        f"MERGE (s)-[:{spec['type']}{rel_properties}]->(e)"
     )
 
-    query_bank_country = """
-        MATCH (b:bank {name: $bank, country: $country})
-        MATCH (c:country {name: $country})
-        MERGE (b)-[:IS_LOCATED]->(c)
+
+def _get_key_columns(spec: dict) -> list:
+    """Return the columns used to match the start and end nodes of `spec`"""
+    # start and end nodes may be matched on the same column (e.g. country)
+    columns = list(spec["start"][1].values()) + list(spec["end"][1].values())
+    return list(dict.fromkeys(columns))
+
+
+def _get_relationship_name(spec: dict) -> str:
+    """Return the name of a relationship spec used in logs"""
+    return f"{spec['type']} relationships ({spec['start'][0]} -> {spec['end'][0]})"
+
+
+def write_relationships(driver, rel_data, spec, batch_size=NEO4J_BATCH_SIZE):
+    """Write all relationships of one type given its data and its spec.
+
+    Rows are sent by chunks of `batch_size` through a single parameterised
+    `UNWIND $rows AS row MATCH ... MATCH ... MERGE ...` query,
+    one transaction per chunk.
+
+    Parameters
+    ----------
+    driver : neo4j.Driver
+        Neo4J driver (or any object exposing the same session API)
+    rel_data : pd.DataFrame
+        Relationships data, one row per relationship. Columns used to match
+        the start and end nodes are given by `spec`, all the other columns
+        are written as relationship properties
+    spec : dict
+        Relationship spec (see `connexions_specs`) with at least the
+        following keys:
+
+        - `type`: relationship type
+        - `start`: tuple (label, {node property: column}) of the start node
+        - `end`: tuple (label, {node property: column}) of the end node
+    batch_size : int, optional
+        Number of rows written per transaction, by default NEO4J_BATCH_SIZE
+
+    Returns
+    -------
+    float
+        Number of rows written per second
     """
+    name = _get_relationship_name(spec)
+    LOGGER.debug(f"{name}: start writing...")
 
-    def create_interaction_banks_countries(tx, bank, country):
-        tx.run(query_bank_country, bank=bank, country=country)
+    key_columns = _get_key_columns(spec)
+    properties = [col for col in rel_data.columns if col not in key_columns]
+    query = _build_relationship_query(spec, properties)
 
-    with driver.session(database="neo4j") as session:
-        for _, row in banks_countries.iterrows():
-            bank = row["Bank"]
-            country = row["Country"]
-            LOGGER.debug(f"Connexion BANK to COUNTRY: write `{bank}` - `{country}`")
-            session.execute_write(create_interaction_banks_countries, bank, country)
+    # a relationship cannot be matched without its node keys
+    rows = rel_data.dropna(subset=key_columns).to_dict(orient="records")
 
-    LOGGER.debug("Writing connexions between banks and countries done")
+    log_query_plan(driver, name, query)
 
+    return _write_batches(driver, name, query, rows, batch_size)
 
-def write_connexions(driver):
+
+def write_connexions(driver, batch_size=NEO4J_BATCH_SIZE, cleaned=None):
     """Write all connexions between nodes into Neo4J"""
-    _write_connexions_cb_companies(driver)
-    _write_connexions_bank_companies(driver)
-    _write_connexions_cb_country(driver)
-    _write_connexions_companies_country(driver)
-    _write_connexions_bank_country(driver)
+    connexions = update_csv_connexions_neo4j(cleaned)
+
+    for name, rel_data in connexions.items():
+        write_relationships(
+            driver, rel_data, connexions_specs[name], batch_size=batch_size
+        )
+
 
+def update_neo4j(batch_size=NEO4J_BATCH_SIZE):
+    """Update CSV for Neo4J, create nodes and connexions
 
-def update_neo4j():
-    """Update CSV for Neo4J, create nodes and connexions"""
+    Parameters
+    ----------
+    batch_size : int, optional
+        Number of rows written per transaction, by default NEO4J_BATCH_SIZE
+    """
     LOGGER.debug("Update cleaned csv for neo4j and save them")
-    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j()
+    cleaned = read_cleaned_datasets()
+    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j(cleaned)
 
-    LOGGER.debug("Connect to driver...")
-    driver = GraphDatabase.driver(
-        NEO4J_URI, auth=basic_auth(NEO4J_USERNAME, NEO4J_PASSWORD)
-    )
-    LOGGER.debug("Driver connected")
+    driver = get_driver()
+
+    # Constraints and indexes must exist before writing to avoid label scans
+    create_constraints(driver)
 
     # Define dict to iterate over three types node creation
     dict_nodes = {
@@ -411,212 +663,695 @@ def update_neo4j():
     # Iterate throught dictionnary to create each node type
     LOGGER.debug("Write nodes")
     for node_type, node_data in dict_nodes.items():
-        write_nodes(driver, node_type, node_data)
+        write_nodes(driver, node_type, node_data, batch_size=batch_size)
 
     # Define connexion between nodes
     LOGGER.debug("Write connexions")
-    write_connexions(driver)
+    write_connexions(driver, batch_size=batch_size, cleaned=cleaned)
 
-    driver.close()
+    LOGGER.debug("Save synced csv snapshot for neo4j")
+    _save_synced_snapshot()
 
 
-def purge_database():
-    """Purge all Neo4J database"""
-    LOGGER.debug("Connect to driver...")
-    driver = GraphDatabase.driver(
-        NEO4J_URI, auth=basic_auth(NEO4J_USERNAME, NEO4J_PASSWORD)
+async def _async_write_batches(
+    driver, name: str, query: str, rows: list, batch_size: int, semaphore, max_retries
+):
+    """Async version of `_write_batches`: each chunk of `rows` is written in
+    its own transaction once `semaphore` is acquired, retrying up to
+    `max_retries` times with an exponential backoff on transient errors.
+    """
+    start = time.perf_counter()
+    async with driver.session(database="neo4j") as session:
+        for batch in _iter_batches(rows, batch_size):
+            for attempt in range(1, max_retries + 1):
+                try:
+                    async with semaphore:
+                        LOGGER.debug(f"{name}: write batch of {len(batch)} rows")
+                        async with await session.begin_transaction() as tx:
+                            await tx.run(query, rows=batch)
+                            await tx.commit()
+                    break
+                except (Neo4jError, DriverError) as error:
+                    if not error.is_retryable() or attempt == max_retries:
+                        raise
+                    LOGGER.warning(
+                        f"{name}: transient error ({error}), "
+                        f"retry {attempt}/{max_retries - 1}"
+                    )
+                    await asyncio.sleep(0.1 * 2**attempt)
+    elapsed = time.perf_counter() - start
+
+    rows_per_sec = len(rows) / elapsed if elapsed > 0 else float("inf")
+    LOGGER.info(
+        f"{name}: {len(rows)} rows written in {elapsed:.2f}s "
+        f"({rows_per_sec:.0f} rows/s)"
     )
-    LOGGER.debug("Driver connected")
 
-    def delete_all(tx):
-        tx.run("MATCH (n) DETACH DELETE n")
+    return rows_per_sec
 
-    LOGGER.debug("Start NEO4J purge...")
-    with driver.session() as session:
-        session.execute_write(delete_all)
-    LOGGER.debug("NEO4J purge done")
 
-    driver.close()
+async def _async_write_all(
+    dict_nodes, connexions, batch_size, concurrency, max_retries
+):
+    """Write node labels in parallel, then each relationship type as soon as
+    the labels of its start and end nodes are written.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # an async driver is bound to the event loop so it cannot be shared
+    uri, auth = get_neo4j_config()
+    async with AsyncGraphDatabase.driver(uri, auth=auth) as driver:
+        node_tasks = {
+            node_type: asyncio.create_task(
+                _async_write_batches(
+                    driver,
+                    f"{node_type} nodes",
+                    _build_node_query(node_type, node_data.columns),
+                    node_data.to_dict(orient="records"),
+                    batch_size,
+                    semaphore,
+                    max_retries,
+                )
+            )
+            for node_type, node_data in dict_nodes.items()
+        }
+
+        async def write_relationships_task(name):
+            spec = connexions_specs[name]
+            rel_data = connexions[name]
+            start_label, end_label = spec["start"][0], spec["end"][0]
+            await asyncio.gather(node_tasks[start_label], node_tasks[end_label])
+
+            key_columns = _get_key_columns(spec)
+            properties = [col for col in rel_data.columns if col not in key_columns]
+            return await _async_write_batches(
+                driver,
+                _get_relationship_name(spec),
+                _build_relationship_query(spec, properties),
+                rel_data.dropna(subset=key_columns).to_dict(orient="records"),
+                batch_size,
+                semaphore,
+                max_retries,
+            )
 
+        await asyncio.gather(
+            *node_tasks.values(), *map(write_relationships_task, connexions)
+        )
+
+
+def update_neo4j_async(
+    batch_size=NEO4J_BATCH_SIZE,
+    concurrency=NEO4J_CONCURRENCY,
+    max_retries=NEO4J_MAX_RETRIES,
+):
+    """Update CSV for Neo4J, create nodes and connexions like `update_neo4j`
+    but with the async driver: node labels are written in parallel and each
+    relationship type starts once its start and end labels are written, so
+    the load time is bounded by the slowest label instead of the sum.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        Number of rows written per transaction, by default NEO4J_BATCH_SIZE
+    concurrency : int, optional
+        Maximum number of transactions running at the same time,
+        by default NEO4J_CONCURRENCY
+    max_retries : int, optional
+        Number of attempts of a transaction failing with a transient error
+        (deadlock, leader switch...), by default NEO4J_MAX_RETRIES
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
 
-def create_local_database():
-    """Create local database with companies, banks, countries and carbon bombs"""
     LOGGER.debug("Update cleaned csv for neo4j and save them")
-    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j()
+    cleaned = read_cleaned_datasets()
+    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j(cleaned)
+    connexions = update_csv_connexions_neo4j(cleaned)
+
+    # Constraints and indexes must exist before writing to avoid label scans
+    create_constraints(get_driver())
 
-    # Define dict to iterate over three types node creation
     dict_nodes = {
-        "carbon_bomb": carbon_bombs.to_dict(orient='records'),
-        "company": companies.to_dict(orient='records'),
-        "bank": banks.to_dict(orient='records'),
-        "country": countries.to_dict(orient='records'),
+        "carbon_bomb": carbon_bombs,
+        "company": companies,
+        "bank": banks,
+        "country": countries,
     }
 
-    connexions = create_connexions()
-    dict_nodes.update(connexions)
+    start = time.perf_counter()
+    asyncio.run(
+        _async_write_all(dict_nodes, connexions, batch_size, concurrency, max_retries)
+    )
+    LOGGER.info(f"Neo4J async update done in {time.perf_counter() - start:.2f}s")
 
-    with open(FPATH_OUT_LOCAL_DATABASE, 'w') as convert_file: 
-        convert_file.write(json.dumps(dict_nodes))
+    LOGGER.debug("Save synced csv snapshot for neo4j")
+    _save_synced_snapshot()
 
-def create_connexions():
-    """Create connexions between nodes"""
-    return {
-        "banks_x_companies": create_connexions_banks_x_companies(),
-        "banks_x_countries": create_connexions_banks_x_countries(),
-        "bombs_x_companies": create_connexions_bombs_x_companies(),
-        "bombs_x_countries": create_connexions_bombs_x_countries(),
-        "companies_x_countries": create_connexions_companies_x_countries(),
-    }
 
-def create_connexions_bombs_x_companies():
-    """Create connexions between CB nodes and company nodes"""
-    ### Carbon Bombs and Companies relationship
-    LOGGER.debug("Start creating connexions between carbon bombs and companies")
-    carbonbombs_companies = pd.read_csv(FPATH_OUT_CONX_CB_COMP)
-    carbonbombs_companies.to_csv(
-        FPATH_NEO4J_CONX_CB_COMP, encoding="utf-8-sig", index=False
-    )
+def _read_neo4j_snapshot(fpath: str) -> pd.DataFrame:
+    """Read a Neo4J CSV with every value as a string to compare snapshots.
+    Return an empty dataframe if the file does not exist yet.
+    """
+    if not os.path.isfile(fpath):
+        return pd.DataFrame()
 
-    connexions = []
-    for _, row in carbonbombs_companies.iterrows():
-        carbon_bomb = row["Carbon_bomb_name"]
-        company = row["Company"]
-        country = row["Country"]
-        weight = 1 
-        LOGGER.debug(
-            f"Connexion CB to COMPANY: write `{carbon_bomb}` - `{company}`"
-        )
+    return pd.read_csv(fpath, dtype=str, keep_default_na=False, encoding="utf-8-sig")
 
-        if type(company) is str:
-            connexions.append({
-                "carbon_bomb": carbon_bomb,
-                "company": company,
-                "country": country,
-                "weight": weight,
-            })
-    LOGGER.debug("Creating connexions between carbon bombs and companies done")
-    return connexions
-
-def create_connexions_banks_x_companies():
-    """Create connexions between bank nodes and company nodes"""
-    LOGGER.debug("Start Creating connexions between banks and companies")
-    ### Banks and Companies relationship
-    banks_companies = pd.read_csv(FPATH_OUT_CONX_BANK_COMP)
-    banks_companies.to_csv(
-        FPATH_NEO4J_CONX_BANK_COMP, encoding="utf-8-sig", index=False
-    )
 
-    connexions = []
-    for _, row in banks_companies.iterrows():
-        bank = row["Bank"]
-        company = row["Company"]
-        LOGGER.debug(f"Connexion BANK to COMPANY: write `{bank}` - `{company}`")
-    
-        if type(company) is str:
-            connexions.append({
-                "bank": bank,
-                "company": company,
-                "year_2016": row["2016"],
-                "year_2017": row["2017"],
-                "year_2018": row["2018"],
-                "year_2019": row["2019"],
-                "year_2020": row["2020"],
-                "year_2021": row["2021"],
-                "year_2022": row["2022"],
-                "total": row["Grand Total"],
-            })
-    LOGGER.debug("Creating connexions between banks and companies done")
-    return connexions
-
-
-def create_connexions_bombs_x_countries():
-    """Create connexions between CB nodes and country nodes"""
-    LOGGER.debug("Start Creating connexions between carbon bombs and countries")
-    ### Carbon Bombs and Country relationship
-    carbonbombs_informations = pd.read_csv(FPATH_OUT_CB)
-
-    filtered_columns = ["Carbon_bomb_name_source_CB", "Country_source_CB"]
-    carbonbombs_countries = carbonbombs_informations[filtered_columns]
-    carbonbombs_countries.columns = ["Carbon_bomb", "Country"]
-
-    carbonbombs_countries.to_csv(
-        FPATH_NEO4J_CONX_CB_COUNTRY, encoding="utf-8-sig", index=False
+def _get_synced_fpath(fpath: str) -> str:
+    """Return the path of the synced snapshot of a Neo4J CSV"""
+    return os.path.join(DATA_NEO4J_SYNCED_PATH, os.path.basename(fpath))
+
+
+def _save_synced_snapshot():
+    """Copy the Neo4J CSV files into the synced snapshot folder"""
+    fpaths = list(nodes_fpaths.values())
+    fpaths += [spec["fpath"] for spec in connexions_specs.values()]
+
+    os.makedirs(DATA_NEO4J_SYNCED_PATH, exist_ok=True)
+    for fpath in fpaths:
+        shutil.copyfile(fpath, _get_synced_fpath(fpath))
+
+
+def _remove_synced_snapshot():
+    """Remove the synced snapshot so the next sync writes everything"""
+    shutil.rmtree(DATA_NEO4J_SYNCED_PATH, ignore_errors=True)
+
+
+def _isin_rows(left: pd.DataFrame, right: pd.DataFrame, columns: list) -> np.ndarray:
+    """Return a mask of `left` rows whose `columns` values are found in `right`"""
+    if right.empty or not set(columns).issubset(right.columns):
+        return np.zeros(len(left), dtype=bool)
+
+    right_keys = pd.MultiIndex.from_frame(right[columns])
+    return pd.MultiIndex.from_frame(left[columns]).isin(right_keys)
+
+
+def _delete_nodes(driver, node_type, node_keys, batch_size=NEO4J_BATCH_SIZE):
+    """Delete nodes (and their relationships) given their keys"""
+    keys = ", ".join(f"{key}: row.{key}" for key in node_keys.columns)
+    query = f"UNWIND $rows AS row MATCH (n:{node_type} {{{keys}}}) DETACH DELETE n"
+    rows = node_keys.to_dict(orient="records")
+
+    return _write_batches(driver, f"{node_type} nodes delete", query, rows, batch_size)
+
+
+def _delete_relationships(driver, rel_keys, spec, batch_size=NEO4J_BATCH_SIZE):
+    """Delete relationships of one type given the keys of their nodes"""
+    name = _get_relationship_name(spec)
+    query = (
+        "UNWIND $rows AS row "
+        f"MATCH {_node_pattern('s', spec['start'])}"
+        f"-[r:{spec['type']}]->{_node_pattern('e', spec['end'])} "
+        "DELETE r"
     )
+    rows = rel_keys.to_dict(orient="records")
+
+    return _write_batches(driver, f"{name} delete", query, rows, batch_size)
+
+
+def sync_neo4j(batch_size=NEO4J_BATCH_SIZE):
+    """Update CSV for Neo4J and only write the nodes and connexions that changed
+    since the previous synced snapshot, without purging the database.
 
-    connexions = []
-    for _, row in carbonbombs_countries.iterrows():
-        carbon_bomb = row["Carbon_bomb"]
-        country = row["Country"]
-        LOGGER.debug(
-            f"Connexion CB to COUNTRY: write `{carbon_bomb}` - `{country}`"
+    The synced snapshot is a copy of the Neo4J CSV files saved in
+    DATA_NEO4J_SYNCED_PATH once all the steps below succeeded (or once
+    `update_neo4j` or `update_neo4j_async` loaded all data), so it matches
+    what is loaded into Neo4J whatever the commands run in between (e.g.
+    `update_csv_nodes_neo4j` or `create_bulk_import_files` rewriting the
+    Neo4J CSV files). `purge_database` removes it: without snapshot, every
+    node and connexion is written.
+
+    - nodes are compared by key (see `nodes_keys`): new or changed nodes are
+      merged, nodes whose key disappeared are deleted
+    - connexions are compared on all their columns: removed or changed
+      connexions are deleted, then new or changed ones are written. When
+      the columns of a connexion changed, all its connexions are rewritten
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        Number of rows written per transaction, by default NEO4J_BATCH_SIZE
+    """
+    LOGGER.debug("Read synced csv snapshot for neo4j")
+    old_nodes = {
+        label: _read_neo4j_snapshot(_get_synced_fpath(fpath))
+        for label, fpath in nodes_fpaths.items()
+    }
+    old_connexions = {
+        name: _read_neo4j_snapshot(_get_synced_fpath(spec["fpath"]))
+        for name, spec in connexions_specs.items()
+    }
+
+    LOGGER.debug("Update cleaned csv for neo4j and save them")
+    cleaned = read_cleaned_datasets()
+    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j(cleaned)
+    nodes = {
+        "carbon_bomb": carbon_bombs,
+        "company": companies,
+        "bank": banks,
+        "country": countries,
+    }
+    connexions = update_csv_connexions_neo4j(cleaned)
+
+    driver = get_driver()
+
+    create_constraints(driver)
+
+    # Step 1: delete removed or changed connexions
+    added_connexions = {}
+    for name, spec in connexions_specs.items():
+        new = _format_connexions(_read_neo4j_snapshot(spec["fpath"]), spec)
+        new = new.astype(str)
+        columns = list(new.columns)
+        key_columns = _get_key_columns(spec)
+
+        old = old_connexions[name]
+        if set(spec["columns"]).issubset(old.columns):
+            old = _format_connexions(old, spec).astype(str)
+        else:
+            old = pd.DataFrame(columns=columns)
+
+        if list(old.columns) != columns:
+            # e.g. a new BOCC edition adds a year: merging the new properties
+            # would duplicate connexions so all of them are rewritten
+            removed = old
+            added = np.ones(len(new), dtype=bool)
+        else:
+            removed = old.loc[~_isin_rows(old, new, columns)]
+            # connexions sharing nodes with a removed one are deleted with it
+            added = ~_isin_rows(new, old, columns) | _isin_rows(
+                new, removed, key_columns
+            )
+        added_connexions[name] = connexions[name].loc[added]
+
+        LOGGER.info(f"{name}: {len(removed)} removed, {added.sum()} added")
+        if not removed.empty:
+            _delete_relationships(
+                driver, removed[key_columns].drop_duplicates(), spec, batch_size
+            )
+
+    # Step 2: merge new or changed nodes
+    removed_nodes = {}
+    for label, data in nodes.items():
+        old = old_nodes[label]
+        new = _read_neo4j_snapshot(nodes_fpaths[label])
+        keys = nodes_keys[label]
+
+        changed = ~_isin_rows(new, old, list(new.columns))
+        removed_nodes[label] = (
+            old.loc[~_isin_rows(old, new, keys), keys] if not old.empty else old
+        )
+
+        LOGGER.info(
+            f"{label}: {changed.sum()} new or changed, "
+            f"{len(removed_nodes[label])} removed"
         )
+        if changed.any():
+            write_nodes(driver, label, data.loc[changed], batch_size=batch_size)
+
+    # Step 3: write new or changed connexions
+    for name, rel_data in added_connexions.items():
+        if not rel_data.empty:
+            write_relationships(
+                driver, rel_data, connexions_specs[name], batch_size=batch_size
+            )
+
+    # Step 4: delete removed nodes
+    for label, node_keys in removed_nodes.items():
+        if not node_keys.empty:
+            _delete_nodes(driver, label, node_keys, batch_size=batch_size)
+
+    LOGGER.debug("Save synced csv snapshot for neo4j")
+    _save_synced_snapshot()
+
+
+def _delete_nodes_batch(tx, query: str, batch_size: int) -> int:
+    """Delete one batch of nodes and return the number of deleted nodes"""
+    return tx.run(query, batch_size=batch_size).single()["deleted"]
+
+
+def _count_nodes(tx, label: str) -> int:
+    """Return the number of nodes of a label"""
+    return tx.run(f"MATCH (n{label}) RETURN count(n) AS total").single()["total"]
 
-        if type(carbon_bomb) and type(country) is str:
-            connexions.append({
-                "carbon_bomb": carbon_bomb,
-                "country": country,
-            })
 
-    LOGGER.debug("Creating connexions between carbon bombs and countries done")
-    return connexions
+def purge_database(labels=None, batch_size=NEO4J_BATCH_SIZE):
+    """Purge Neo4J database by batches of `batch_size` nodes (with their
+    relationships), one transaction per batch, to keep the transaction memory
+    bounded whatever the size of the graph. The synced snapshot of
+    `sync_neo4j` is removed so the next sync writes all data again.
+
+    Parameters
+    ----------
+    labels : list, optional
+        Node labels to purge (carbon_bomb, company, bank or country),
+        by default None which purges all nodes
+    batch_size : int, optional
+        Number of nodes deleted per transaction, by default NEO4J_BATCH_SIZE
+
+    Raises
+    ------
+    ValueError
+        If a label is not a known node label
+    """
+    if labels is None:
+        labels = [""]
+    else:
+        unknown = set(labels) - set(nodes_keys)
+        if unknown:
+            raise ValueError(f"Unknown labels to purge: {unknown}")
+        labels = [f":{label}" for label in labels]
+
+    driver = get_driver()
+
+    # the graph will not match the synced snapshot anymore
+    _remove_synced_snapshot()
+
+    LOGGER.debug("Start NEO4J purge...")
+    with driver.session(database="neo4j") as session:
+        for label in labels:
+            query = (
+                f"MATCH (n{label}) WITH n LIMIT $batch_size "
+                "DETACH DELETE n RETURN count(n) AS deleted"
+            )
+            total = session.execute_read(_count_nodes, label)
+            deleted = 0
+
+            while True:
+                n_deleted = session.execute_write(
+                    _delete_nodes_batch, query, batch_size
+                )
+                if n_deleted == 0:
+                    break
+                deleted += n_deleted
+                LOGGER.info(f"NEO4J purge (n{label}): {deleted} / {total} deleted")
+
+    LOGGER.debug("NEO4J purge done")
+
+
+def _get_import_type(values: pd.Series) -> str:
+    """Return the neo4j-admin import type of a property given its values
+    (missing values being "None"), the same type the driver would store.
+    """
+    values = values[values.map(lambda value: value != "None")]
 
-def create_connexions_companies_x_countries():
-    """Create connexions between company nodes and company nodes"""
-    LOGGER.debug("Start Creating connexions between companies and countries")
-    ### Company and Country relationship
-    company_informations = pd.read_csv(FPATH_OUT_COMP)
+    if values.empty:
+        return "string"
+    if values.map(lambda value: isinstance(value, (bool, np.bool_))).all():
+        return "boolean"
+    if values.map(lambda value: isinstance(value, (int, np.integer))).all():
+        return "long"
+    if values.map(lambda value: isinstance(value, (int, float, np.number))).all():
+        return "double"
+    return "string"
 
-    filtered_columns = ["Company_name", "Country"]
-    companies_countries = company_informations[filtered_columns]
-    companies_countries.columns = ["Company", "Country"]
 
-    companies_countries.to_csv(
-        FPATH_NEO4J_CONX_COMP_COUNTRY, encoding="utf-8-sig", index=False
+def _format_import_properties(data: pd.DataFrame) -> pd.DataFrame:
+    """Add neo4j-admin import types to property columns.
+
+    String properties keep "None" for missing values (as written by
+    `update_neo4j`) while typed properties leave the field empty so that
+    the property is not set.
+    """
+    columns = {}
+    for column in data.columns:
+        import_type = _get_import_type(data[column])
+        if import_type == "string":
+            columns[column] = column
+        else:
+            data[column] = data[column].mask(data[column].eq("None"))
+            columns[column] = f"{column}:{import_type}"
+
+    return data.rename(columns=columns)
+
+
+def _get_import_ids(data: pd.DataFrame, columns: list) -> pd.Series:
+    """Return the `:ID` of nodes by joining their key columns"""
+    return data[columns].astype(str).agg(NEO4J_IMPORT_ID_SEP.join, axis=1)
+
+
+def _format_import_nodes(node_type: str, node_data: pd.DataFrame) -> pd.DataFrame:
+    """Format nodes of a label for neo4j-admin import"""
+    ids = _get_import_ids(node_data, nodes_keys[node_type])
+
+    # neo4j-admin import fails on duplicated ids where MERGE updates the
+    # node with the last row: keep the same row
+    duplicated = ids.duplicated(keep="last")
+    if duplicated.any():
+        LOGGER.warning(
+            f"{node_type} nodes: {duplicated.sum()} duplicated nodes skipped"
+        )
+
+    data = _format_import_properties(node_data[~duplicated].copy())
+    data.insert(0, f":ID({node_type})", ids[~duplicated])
+    data[":LABEL"] = node_type
+
+    return data
+
+
+def _format_import_relationships(
+    rel_data: pd.DataFrame, spec: dict, node_ids: dict
+) -> pd.DataFrame:
+    """Format relationships of a type for neo4j-admin import"""
+    rel_data = rel_data.dropna(subset=_get_key_columns(spec))
+
+    ids = {}
+    for side in ("start", "end"):
+        label, keys = spec[side]
+        columns = [keys[prop] for prop in nodes_keys[label]]
+        ids[side] = _get_import_ids(rel_data, columns)
+
+    # Relationships to unknown nodes are skipped by the MATCH of
+    # `write_relationships`, do the same instead of failing the import
+    start_label, end_label = spec["start"][0], spec["end"][0]
+    exists = ids["start"].isin(node_ids[start_label]) & ids["end"].isin(
+        node_ids[end_label]
     )
+    if not exists.all():
+        LOGGER.warning(
+            f"{spec['type']} ({start_label} -> {end_label}): "
+            f"{(~exists).sum()} relationships to unknown nodes skipped"
+        )
+
+    properties = [col for col in rel_data.columns if col not in _get_key_columns(spec)]
+    data = _format_import_properties(rel_data.loc[exists, properties].copy())
+    data.insert(0, f":START_ID({start_label})", ids["start"][exists])
+    data.insert(1, f":END_ID({end_label})", ids["end"][exists])
+    data[":TYPE"] = spec["type"]
+
+    return data
+
+
+def create_bulk_import_files(out_dir=DATA_NEO4J_IMPORT_PATH):
+    """Create node and relationship CSV files with header annotations
+    (`:ID`, `:LABEL`, `:START_ID`, `:END_ID`, `:TYPE`, typed properties)
+    to cold-load an empty database with `neo4j-admin database import`.
+
+    Nodes are identified by their keys (see `nodes_keys`) in one id space
+    per label.
+
+    Parameters
+    ----------
+    out_dir : str, optional
+        Folder where import files are written,
+        by default DATA_NEO4J_IMPORT_PATH
+
+    Returns
+    -------
+    list
+        `neo4j-admin database import full` command loading the files
+    """
+    LOGGER.debug("Update cleaned csv for neo4j and save them")
+    cleaned = read_cleaned_datasets()
+    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j(cleaned)
+    connexions = update_csv_connexions_neo4j(cleaned)
+
+    os.makedirs(out_dir, exist_ok=True)
+    command = ["neo4j-admin", "database", "import", "full"]
+
+    node_ids = {}
+    for node_type, node_data in zip(
+        nodes_keys, (carbon_bombs, companies, banks, countries)
+    ):
+        data = _format_import_nodes(node_type, node_data)
+        node_ids[node_type] = data[f":ID({node_type})"]
 
-    connexions = []
-    for _, row in companies_countries.iterrows():
-        company = row["Company"]
-        country = row["Country"]
-        LOGGER.debug(
-            f"Connexion COMPANY to COUNTRY: write `{company}` - `{country}`"
+        fpath = f"{out_dir}/nodes_{node_type}.csv"
+        data.to_csv(fpath, encoding="utf-8", index=False)
+        command.append(f"--nodes={fpath}")
+        LOGGER.debug(f"{node_type} nodes: {len(data)} rows saved in {fpath}")
+
+    for name, rel_data in connexions.items():
+        data = _format_import_relationships(
+            rel_data, connexions_specs[name], node_ids
         )
 
-        if type(company) and type(country) is str:
-            connexions.append({
-                "company": company,
-                "country": country,
-            })
+        fpath = f"{out_dir}/relationships_{name}.csv"
+        data.to_csv(fpath, encoding="utf-8", index=False)
+        command.append(f"--relationships={fpath}")
+        LOGGER.debug(f"{name} relationships: {len(data)} rows saved in {fpath}")
+
+    command.append("neo4j")
+    LOGGER.info(f"Neo4J import files created, load them with: {' '.join(command)}")
 
-    LOGGER.debug("Creating connexions between companies and countries done")
-    return connexions
+    return command
 
 
-def create_connexions_banks_x_countries():
-    """Create connexions between bank nodes and country nodes"""
-    LOGGER.debug("Start Creating connexions between banks and countries")
-    ### Bank and Country relationship
-    bank_informations = pd.read_csv(FPATH_OUT_BANK)
+# Connexions of the local database: section name -> (connexion name,
+# column which must be a string to keep the connexion)
+local_database_connexions = {
+    "banks_x_companies": ("bank_companies", "company"),
+    "banks_x_countries": ("bank_country", "country"),
+    "bombs_x_companies": ("cb_companies", "company"),
+    "bombs_x_countries": ("cb_country", "country"),
+    "companies_x_countries": ("companies_country", "country"),
+}
 
-    filtered_columns = ["Bank Name", "Headquarters country"]
-    banks_countries = bank_informations[filtered_columns]
-    banks_countries.columns = ["Bank", "Country"]
 
-    banks_countries.to_csv(
-        FPATH_NEO4J_CONX_BANK_COUNTRY, encoding="utf-8-sig", index=False
-    )
+# Local database file of each output format
+local_database_fpaths = {
+    "json": FPATH_OUT_LOCAL_DATABASE,
+    "gzip": FPATH_OUT_LOCAL_DATABASE_GZIP,
+    "msgpack": FPATH_OUT_LOCAL_DATABASE_MSGPACK,
+}
+
+
+def _import_msgpack():
+    """Import msgpack which is only needed for the msgpack format"""
+    try:
+        import msgpack
+    except ImportError as error:
+        raise ImportError(
+            "msgpack is required for the msgpack format: pip install msgpack"
+        ) from error
+    return msgpack
+
+
+def _iter_local_database_sections(cleaned: dict):
+    """Yield (section name, list of records) of the local database one at
+    a time: nodes by label then connexions (see `local_database_connexions`)
+    """
+    carbon_bombs, companies, banks, countries = update_csv_nodes_neo4j(cleaned)
+    nodes = {
+        "carbon_bomb": carbon_bombs,
+        "company": companies,
+        "bank": banks,
+        "country": countries,
+    }
+    for node_type, node_data in nodes.items():
+        yield node_type, node_data.to_dict(orient="records")
 
-    connexions = []
-    for _, row in banks_countries.iterrows():
-        bank = row["Bank"]
-        country = row["Country"]
-        LOGGER.debug(f"Connexion BANK to COUNTRY: write `{bank}` - `{country}`")
+    yield from _iter_connexions(cleaned)
 
-        if type(bank) and type(country) is str:
-            connexions.append({
-                "bank": bank,
-                "country": country,
-            })
 
-    LOGGER.debug("Creating connexions between banks and countries done")
-    return connexions
+def _write_local_database_json(sections, file):
+    """Write sections as one JSON object (same output as `json.dumps` of the
+    whole dict) serialising one section at a time.
+    """
+    file.write("{")
+    for i, (section, records) in enumerate(sections):
+        if i > 0:
+            file.write(", ")
+        file.write(f"{json.dumps(section)}: ")
+        file.write(json.dumps(records))
+    file.write("}")
+
+
+def _write_local_database_msgpack(sections, file, n_sections: int):
+    """Write sections as one msgpack map packing one section at a time"""
+    packer = _import_msgpack().Packer()
+    file.write(packer.pack_map_header(n_sections))
+    for section, records in sections:
+        file.write(packer.pack(section))
+        file.write(packer.pack(records))
+
+
+def create_local_database(fmt="json", fpath=None):
+    """Create local database with companies, banks, countries and carbon bombs
+
+    Sections (node labels then connexions) are built and written one after
+    the other so only one of them is held in memory as records.
+
+    Parameters
+    ----------
+    fmt : str, optional
+        Output format: "json", "gzip" (gzipped JSON) or "msgpack",
+        by default "json"
+    fpath : str, optional
+        Output file, by default the one of the format
+        (see `local_database_fpaths`)
+
+    Returns
+    -------
+    str
+        Path of the written file
+    """
+    if fmt not in local_database_fpaths:
+        raise ValueError(
+            f"Unknown local database format `{fmt}`, "
+            f"expected one of {list(local_database_fpaths)}"
+        )
+    fpath = fpath or local_database_fpaths[fmt]
+
+    LOGGER.debug("Update cleaned csv for neo4j and save them")
+    sections = _iter_local_database_sections(read_cleaned_datasets())
+
+    if fmt == "json":
+        with open(fpath, "w") as file:
+            _write_local_database_json(sections, file)
+    elif fmt == "gzip":
+        with gzip.open(fpath, "wt") as file:
+            _write_local_database_json(sections, file)
+    else:
+        n_sections = len(nodes_keys) + len(local_database_connexions)
+        with open(fpath, "wb") as file:
+            _write_local_database_msgpack(sections, file, n_sections)
+
+    LOGGER.debug(f"Local database saved in {fpath}")
+    return fpath
+
+
+def load_local_database(fpath=FPATH_OUT_LOCAL_DATABASE) -> dict:
+    """Load a local database written by `create_local_database`, the format
+    being found from the file extension (.json, .gz or .msgpack).
+
+    Parameters
+    ----------
+    fpath : str, optional
+        Local database file, by default FPATH_OUT_LOCAL_DATABASE
+
+    Returns
+    -------
+    dict
+        Records of the database by section
+    """
+    if fpath.endswith(".msgpack"):
+        with open(fpath, "rb") as file:
+            return _import_msgpack().unpack(file)
+
+    if fpath.endswith(".gz"):
+        with gzip.open(fpath, "rt") as file:
+            return json.load(file)
+
+    with open(fpath, "r") as file:
+        return json.load(file)
+
+
+def _iter_connexions(cleaned: dict = None):
+    """Yield (section name, list of records) of each connexion (see
+    `local_database_connexions`), building one section at a time
+    """
+    for section, (name, column) in local_database_connexions.items():
+        data = _update_csv_connexion_neo4j(name, cleaned)
+        data = data[data[column].map(lambda value: isinstance(value, str))]
+        records = data.to_dict(orient="records")
+        LOGGER.debug(f"Connexions {section}: {len(records)} created")
+        yield section, records
+
+
+def create_connexions(cleaned: dict = None) -> dict:
+    """Create connexions between nodes as lists of records by section
+    (see `local_database_connexions`)
+    """
+    return dict(_iter_connexions(cleaned))
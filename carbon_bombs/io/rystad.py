@@ -6,6 +6,8 @@ from carbon_bombs.conf import SHEETNAME_RYSTAD_CB_EMISSION
 from carbon_bombs.conf import SHEETNAME_RYSTAD_CB_COMPANY
 from carbon_bombs.conf import SHEETNAME_RYSTAD_GASOIL_EMISSION
 from carbon_bombs.conf import SHEETNAME_RYSTAD_CB_EMISSION_INFERIOR_1GT
+from carbon_bombs.io.excel import get_excel_engine
+from carbon_bombs.io.excel import read_excel_cached
 from carbon_bombs.utils.logger import LOGGER
 from carbon_bombs.utils.location import clean_project_names_with_iso
 
@@ -68,12 +70,13 @@ def load_rystad_emission_database(sheet_name: str) -> pd.DataFrame:
 
     LOGGER.debug(log_message)
 
-    df = pd.read_excel(
+    df = read_excel_cached(
         FPATH_SRC_RYSTAD_CB,
         sheet_name=sheet_name,
-        engine="openpyxl",
+        engine=get_excel_engine(),
+        usecols=list(renamed_columns),
     )
-    # Only keep relevant columns
+    # Only keep relevant columns (in this order)
     df = df.loc[:, renamed_columns.keys()]
     # Rename columns
     df = df.rename(columns=renamed_columns)
@@ -84,6 +87,45 @@ def load_rystad_emission_database(sheet_name: str) -> pd.DataFrame:
     return df
 
 
+def _explode_companies(df: pd.DataFrame) -> pd.DataFrame:
+    """Split newline separated companies (ranked from the highest to the
+    lowest participation) and their headquarters countries into one row per
+    company of each project, with its involvement rank.
+
+    When a project does not have as many headquarters countries as companies,
+    its first country is used for all its companies.
+
+    Timings against the previous loops: scripts/benchmark_rystad_explode.py
+    """
+    companies_split = df["Company_involved"].str.split("\n")
+    headquarters_split = df["Company_headquarters_country"].str.split("\n")
+
+    mismatch = companies_split.str.len() != headquarters_split.str.len()
+    for project in df.loc[mismatch, "Project_name"]:
+        LOGGER.warning(
+            f"Project {project} has a mismatch between number of companies and headquarters countries."
+        )
+
+    # Duplicate rows for each company while maintaining order
+    df_expanded = df.assign(Company_involved=companies_split).explode(
+        "Company_involved"
+    )
+    rank = df_expanded.groupby(level=0).cumcount()
+    df_expanded["Company_involvement_rank"] = rank + 1
+
+    # Country at the same rank as the company (first one on mismatch)
+    headquarters_flat = headquarters_split.explode()
+    headquarters_flat.index = pd.MultiIndex.from_arrays(
+        [headquarters_flat.index, headquarters_flat.groupby(level=0).cumcount()]
+    )
+    headquarters_rank = rank.where(~mismatch.reindex(df_expanded.index), 0)
+    df_expanded["Company_headquarters_country"] = headquarters_flat.reindex(
+        pd.MultiIndex.from_arrays([df_expanded.index, headquarters_rank])
+    ).to_numpy()
+
+    return df_expanded.reset_index(drop=True)
+
+
 def load_rystad_cb_company_database():
     """
     Load Carbon Bombs database companies from Rystad.
@@ -94,11 +136,6 @@ def load_rystad_cb_company_database():
         A dataframe containing the data from the database.
     """
     LOGGER.debug("Read Rystad data: all Carbon Bombs project companies")
-    df = pd.read_excel(
-        FPATH_SRC_RYSTAD_CB,
-        sheet_name=SHEETNAME_RYSTAD_CB_COMPANY,
-        engine="openpyxl",
-    )
     renamed_columns = {
         "Project name": "Project_name",
         "Country": "Country",
@@ -106,7 +143,13 @@ def load_rystad_cb_company_database():
         "Company's headquarters country": "Company_headquarters_country",
         "Potential emissions (GTCO2)": "Potential_emissions_in_GTCO2",
     }
-    # Only keep columns of interest for the project
+    df = read_excel_cached(
+        FPATH_SRC_RYSTAD_CB,
+        sheet_name=SHEETNAME_RYSTAD_CB_COMPANY,
+        engine=get_excel_engine(),
+        usecols=list(renamed_columns),
+    )
+    # Only keep columns of interest for the project (in this order)
     df = df.loc[:, renamed_columns.keys()]
     # Rename columns
     df = df.rename(columns=renamed_columns)
@@ -115,37 +158,4 @@ def load_rystad_cb_company_database():
     # Clean project names
     clean_project_names_with_iso(df)
 
-    # Split companies and duplicate rows while maintaining order
-    companies_split = df["Company_involved"].str.split("\n")
-    df_expanded = df.loc[df.index.repeat(companies_split.str.len())]
-
-    # Get the flattened list of companies
-    companies_flat = [company for companies in companies_split for company in companies]
-    df_expanded["Company_involved"] = companies_flat
-
-    # Create involvement rank for each company in their project
-    involvement_ranks = []
-    for companies in companies_split:
-        # Add ranks from 1 to N for each company in the project
-        involvement_ranks.extend(range(1, len(companies) + 1))
-    df_expanded["Company_involvement_rank"] = involvement_ranks
-
-    # Split and expand headquarters countries to match companies
-    headquarters_split = df["Company_headquarters_country"].str.split("\n")
-    headquarters_flat = []
-    for idx, companies in enumerate(companies_split):
-        countries = headquarters_split.iloc[idx]
-        # If we have the same number of countries as companies, use them
-        if len(countries) == len(companies):
-            headquarters_flat.extend(countries)
-        # If numbers don't match, use the first country for all companies (fallback)
-        else:
-            LOGGER.warning(
-                f"Project {df['Project_name'].iloc[idx]} has a mismatch between number of companies and headquarters countries."
-            )
-            headquarters_flat.extend([countries[0]] * len(companies))
-
-    df_expanded["Company_headquarters_country"] = headquarters_flat
-    df_expanded = df_expanded.reset_index(drop=True)
-
-    return df_expanded
+    return _explode_companies(df)
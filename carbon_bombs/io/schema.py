@@ -0,0 +1,54 @@
+"""Functions to enforce the declared schema of a source dataset
+
+A schema is a dict mapping a column name to its dtype (e.g. "string",
+"category", "Int16", "float64"). Loaders declare the schema of the dataframe
+they return and enforce it before returning so that a change in a source
+file (renamed column, text in a numeric column, ...) fails at load time
+instead of somewhere in the processing.
+"""
+import pandas as pd
+
+from carbon_bombs.utils.logger import LOGGER
+
+
+def apply_schema(df: pd.DataFrame, schema: dict, source: str) -> pd.DataFrame:
+    """Check that `df` has all columns of `schema` and cast them to their
+    declared dtype. Other columns are kept as is.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe read from the source
+    schema : dict
+        Declared dtype of each column
+    source : str
+        Name of the source used in error messages
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with the declared dtypes
+
+    Raises
+    ------
+    ValueError
+        If a column is missing or cannot be cast to its declared dtype
+    """
+    missing = [col for col in schema if col not in df.columns]
+    if missing:
+        raise ValueError(
+            f"{source}: columns {missing} not found "
+            f"(available columns: {list(df.columns)})"
+        )
+
+    df = df.copy()
+    for col, dtype in schema.items():
+        try:
+            df[col] = df[col].astype(dtype)
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"{source}: column `{col}` cannot be read as {dtype} ({e})"
+            ) from e
+
+    LOGGER.debug(f"{source}: schema checked ({len(schema)} columns)")
+    return df
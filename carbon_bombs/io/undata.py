@@ -1,11 +1,41 @@
 """Functions to load UNData datasets"""
+import csv
+
 import pandas as pd
 
 from carbon_bombs.conf import FPATH_SRC_UNDATA_CO2
 from carbon_bombs.conf import FPATH_SRC_UNDATA_GDP
 from carbon_bombs.conf import FPATH_SRC_UNDATA_POPU
+from carbon_bombs.io.schema import apply_schema
 from carbon_bombs.utils.logger import LOGGER
 
+# Schema of the concatenated UNData files
+UNDATA_SCHEMA = {
+    "Region_Country_Area_ID": "Int16",
+    "Region_Country_Area_name": "category",
+    "Year": "Int16",
+    "Category": "category",
+    "Series": "category",
+    "Value": "float64",
+    "Footnotes": "string",
+    "Source": "category",
+}
+
+
+def _read_undata_file(fpath: str) -> pd.DataFrame:
+    """Read a csv file downloaded from the UN data website in a single pass.
+
+    The first line of the file gives the category of its series (second
+    field) and values use a comma as thousands separator.
+    """
+    LOGGER.debug(f"Read UNData file: {fpath}")
+    with open(fpath, encoding="utf-8") as f:
+        category = next(csv.reader([f.readline()]))[1]
+        df = pd.read_csv(f, sep=",", thousands=",")
+
+    df.insert(3, "Category", category)
+    return df
+
 
 def load_undata():
     """
@@ -63,19 +93,16 @@ def load_undata():
         FPATH_SRC_UNDATA_POPU,
     ]
 
-    df_undata = pd.DataFrame()
     # Load csv files
-    for file in file_paths:
-        LOGGER.debug(f"Read UNData file: {file}")
-        df = pd.read_csv(file, sep=",", header=1)
-
-        # Retrieve the category in the first row of the csv file
-        df_firstrow = pd.read_csv(file, sep=",", header=None, nrows=1)
-        df.insert(3, "Category", df_firstrow[1].values[0])
-
-        # Concat dataframes
-        df_undata = pd.concat([df_undata, df], ignore_index=True)
+    df_undata = pd.concat(
+        [_read_undata_file(file) for file in file_paths], ignore_index=True
+    )
 
+    if len(df_undata.columns) != len(columns_dataframe):
+        raise ValueError(
+            f"UNData: expected columns {columns_dataframe}, "
+            f"found {list(df_undata.columns)}"
+        )
     df_undata.columns = columns_dataframe
 
     # Map country names to get uniform country names between all files.
@@ -95,4 +122,7 @@ def load_undata():
         "Region_Country_Area_name"
     ].replace(mapping_countries)
 
+    # Check and define column types
+    df_undata = apply_schema(df_undata, UNDATA_SCHEMA, source="UNData")
+
     return df_undata
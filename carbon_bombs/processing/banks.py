@@ -6,7 +6,7 @@ from carbon_bombs.io.banktracks import scrapping_main_page_bank_track
 from carbon_bombs.io.cleaned import load_banks_database
 from carbon_bombs.io.cleaned import load_connexion_bank_company_database
 from carbon_bombs.io.gmaps import get_coordinates_google_api
-from carbon_bombs.io.manual_match import manual_match_bank
+from carbon_bombs.io.manual_match import get_manual_match_bank
 from carbon_bombs.utils.location import get_world_region
 from carbon_bombs.utils.logger import LOGGER
 
@@ -135,6 +135,7 @@ def create_banks_table(check_old_df_address=False):
 
     # Make a remap of bank name based on manual_match_bank in order to have
     # coherent key values in BOCC and banking_informations.csv
+    manual_match_bank = get_manual_match_bank()
     bank_names = [
         manual_match_bank[name] if name in manual_match_bank else name
         for name in bank_names
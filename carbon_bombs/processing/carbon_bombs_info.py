@@ -5,11 +5,11 @@ from itertools import groupby
 
 import numpy as np
 import pandas as pd
-from fuzzywuzzy import fuzz
 from geopy.geocoders import Nominatim
 import country_converter as coco
 
 
+from carbon_bombs.conf import FUZZ_WORKERS
 from carbon_bombs.conf import PROJECT_SEPARATOR
 from carbon_bombs.conf import THRESHOLD_OPERATING_PROJECT
 from carbon_bombs.io.gem import get_gem_wiki_details
@@ -17,67 +17,20 @@ from carbon_bombs.io.gem import load_coal_mine_gem_database
 from carbon_bombs.io.gem import load_gasoil_mine_gem_database
 from carbon_bombs.io.khune_paper import load_carbon_bomb_coal_database
 from carbon_bombs.io.khune_paper import load_carbon_bomb_gasoil_database
-from carbon_bombs.io.manual_match import manual_match_coal
-from carbon_bombs.io.manual_match import manual_match_gasoil
-from carbon_bombs.io.manual_match import manual_match_lat_long
+from carbon_bombs.io.manual_match import get_manual_match_coal
+from carbon_bombs.io.manual_match import get_manual_match_gasoil
+from carbon_bombs.io.manual_match import get_manual_match_lat_long
 from carbon_bombs.io.rystad import load_rystad_cb_database
+from carbon_bombs.utils.fuzzy import get_fuzz_ratios
 from carbon_bombs.utils.location import get_world_region
 from carbon_bombs.utils.logger import LOGGER
+from carbon_bombs.utils.ownership import format_ownership
+from carbon_bombs.utils.ownership import parse_ownership
+from carbon_bombs.utils.ownership import read_ownership
 from carbon_bombs.utils.match_company_bocc import _get_companies_match_cb_to_bocc
 from carbon_bombs.utils.match_company_bocc import save_uniform_company_names
 
 
-def _match_gem_mines_using_fuzz(name: str, df_gem: pd.DataFrame) -> pd.DataFrame:
-    """Try to match GEM mines following theses rules:
-    - Match on first word in `name` and `'Unit_concerned'` column of `df_gem`
-    - If one or zero line found then return this dataframe
-    - Else keep only the line with the best fuzz score between `name`
-      and `'Unit_concerned'` column values
-
-    Parameters
-    ----------
-    name : str
-        Project name to map GEM units with
-    df_gem : pd.DataFrame
-        GEM Dataframe with the following columns:
-        `['GEM_ID', 'Unit_concerned', 'Country', 'GEM_source', 'Latitude',
-        'Longitude', 'Operators', 'Owners', 'Parent_Company', 'Status']`
-
-    Returns
-    -------
-    pd.DataFrame
-        Matched dataframe with the following columns:
-        `['GEM_ID', 'Unit_concerned', 'Country', 'GEM_source', 'Latitude',
-        'Longitude', 'Operators', 'Owners', 'Parent_Company', 'Status']`
-
-        It can only return one or zero line.
-    """
-    # copy dataframe to avoid
-    df_gem = df_gem.copy()
-
-    # get first word for the project name and the unit
-    first_word_name = name.split()[0]
-    df_gem["First_word"] = df_gem["Unit_concerned"].str.split().str[0]
-
-    # try to match on the first word
-    matched_gem_df = df_gem.loc[df_gem["First_word"] == first_word_name]
-
-    # if more than one match found then need to choose between them throught fuzzy wuzzy
-    # Calculate Fuzz_score for each line which as the same first word as the carbon bomb
-    if len(matched_gem_df) > 1:
-        matched_gem_df["Fuzz_score"] = matched_gem_df["Unit_concerned"].apply(
-            lambda x: fuzz.ratio(x, name)
-        )
-        # keep only best score
-        matched_gem_df = matched_gem_df.loc[[matched_gem_df["Fuzz_score"].idxmax()]]
-        matched_gem_df = matched_gem_df.drop(columns="Fuzz_score")
-
-    matched_gem_df = matched_gem_df.drop(columns="First_word")
-    del df_gem
-
-    return matched_gem_df
-
-
 def _handle_status_column(values: list) -> str:
     """Handle status column case.
     If a project has different units with different status then:
@@ -120,19 +73,36 @@ def _handle_status_column(values: list) -> str:
     return values
 
 
+def _get_first_value(values: pd.Series):
+    """Return the first value (even if it is missing)"""
+    return values.iloc[0]
+
+
+def _join_values(values: pd.Series) -> str:
+    """Concatenate values separated by a | (missing values are 'None')"""
+    return PROJECT_SEPARATOR.join(map(str, values.fillna("None")))
+
+
+def _handle_status_values(values: pd.Series) -> str:
+    """Apply _handle_status_column to status values (missing values are
+    'None')
+    """
+    return _handle_status_column(values.fillna("None"))
+
+
 def _handle_multiple_gem_mines(
     matched_gem_df: pd.DataFrame,
     keep_first_cols: list,
     concat_cols: list,
-    num_cols: list,
 ) -> pd.DataFrame:
     """Concatenate matched GEM units into one line.
     It apply the following rules:
 
     - For `keep_first_cols` columns: it only keep the first value
     - For `concat_cols` columns: it concatenates all values and separate them by a '|'
-    - For `'Status'` column: it applies _handle_status_column function
-    - For `num_cols` columns: it updates 'None' values by NaN
+    - For `'Project_status'` column: it applies _handle_status_column function
+
+    Columns keep their dtype (e.g. latitude and longitude stay floats).
 
     Parameters
     ----------
@@ -145,8 +115,6 @@ def _handle_multiple_gem_mines(
         Columns which will only keep the first value
     concat_cols : list
         Columns which will concatenate all values together
-    num_cols : list
-        Numerical columns to replace "None" by NaN
 
     Returns
     -------
@@ -156,49 +124,212 @@ def _handle_multiple_gem_mines(
         ['Country', 'Latitude', 'Longitude', 'GEM_ID', 'Unit_concerned',
         'GEM_source', 'Operators', 'Owners', 'Parent_Company', 'Status']
     """
-    matched_gem_df["tmp"] = ""
-    group_df = matched_gem_df.astype(str).fillna("None").groupby("tmp")
+    aggregations = {
+        **{col: (col, _get_first_value) for col in keep_first_cols},
+        **{col: (col, _join_values) for col in concat_cols},
+        "Project_status": ("Project_status", _handle_status_values),
+    }
+
+    return matched_gem_df.assign(tmp="").groupby("tmp").agg(**aggregations)
+
+
+def _get_rows_positions(df_keys: pd.DataFrame) -> dict:
+    """Return the positions of the rows of `df_keys` for each key (a value for
+    one column, else a tuple of values). Positions keep the rows order and
+    rows with a missing value are left out.
+    """
+    codes = df_keys.groupby(list(df_keys.columns), sort=False).ngroup()
+    codes = codes.to_numpy(dtype="float64")
+    positions = np.flatnonzero(~np.isnan(codes))
+    positions = positions[np.argsort(codes[positions], kind="stable")]
+    starts = np.flatnonzero(np.diff(codes[positions], prepend=-1))
+
+    keys = df_keys.iloc[positions[starts]]
+    if len(df_keys.columns) == 1:
+        keys = keys.iloc[:, 0].tolist()
+    else:
+        keys = list(keys.itertuples(index=False, name=None))
+
+    return dict(zip(keys, np.split(positions, starts[1:])))
+
+
+def _build_gem_index(df_gem: pd.DataFrame) -> dict:
+    """Index GEM units once per fuel so that the units of a project are found
+    without filtering the whole GEM dataframe for each project.
 
-    # keep only first element
-    tmp_merge = group_df[keep_first_cols].agg(lambda x: x.values[0])
+    Parameters
+    ----------
+    df_gem : pd.DataFrame
+        GEM Dataframe with the following columns:
+        `['GEM_ID', 'Unit_concerned', 'Country', 'GEM_source', 'Latitude',
+        'Longitude', 'Operators', 'Owners', 'Parent_Company', 'Status']`
 
-    # concatenate and separate by a |
-    tmp_merge = pd.concat(
-        [tmp_merge, group_df[concat_cols].agg(PROJECT_SEPARATOR.join)], axis=1
+    Returns
+    -------
+    dict
+        - df: GEM dataframe (with a range index)
+        - units: row positions by (country, unit name)
+        - first_words: row positions by (country, first word of unit name)
+    """
+    df_gem = df_gem.reset_index(drop=True)
+    df_first_words = df_gem[["Country"]].assign(
+        First_word=df_gem["Unit_concerned"].str.split().str[0]
     )
 
-    tmp_merge = pd.concat(
-        [tmp_merge, group_df["Project_status"].agg(_handle_status_column)], axis=1
+    return {
+        "df": df_gem,
+        "units": _get_rows_positions(df_gem[["Country", "Unit_concerned"]]),
+        "first_words": _get_rows_positions(df_first_words),
+    }
+
+
+def _get_gem_candidates(
+    df_projects: pd.DataFrame, gem_index: dict, fuel="gasoil"
+) -> pd.DataFrame:
+    """Find all GEM Units / Mines candidates of projects that did not have a
+    perfect match following theses rules:
+    - For `gasoil` projects: use manual_match_gasoil units
+    - For `coal` projects:
+        - use manual_match_coal units
+        - If the project is not in manual_match_coal (or if its units are
+          used by other projects) then GEM units of the same country starting
+          with the same first word are fuzzy candidates, scored with the
+          fuzz ratio between the project and unit names (in one batch
+          split across FUZZ_WORKERS processes)
+
+    Parameters
+    ----------
+    df_projects : pd.DataFrame
+        Projects to match, it needs `'Project Name'` and `'Country_cb'` columns
+    gem_index : dict
+        GEM units index (see `_build_gem_index`)
+    fuel : str, optional
+        Fuel type to see which source is used, by default "gasoil"
+        Use "gasoil" or "coal"
+
+    Returns
+    -------
+    pd.DataFrame
+        Candidates with the following columns:
+        `['Project Name', 'Country_cb', 'Position', 'Order', 'Fuzzy',
+        'Fuzz_score']` where `Position` is the row position of the unit in
+        `gem_index["df"]` and `Order` the order of the unit in the manual
+        match of the project
+    """
+    if fuel == "gasoil":
+        manual_match = get_manual_match_gasoil()
+    else:
+        manual_match = get_manual_match_coal()
+
+    candidates = []
+    fuzzy_projects = []
+    projects = zip(df_projects["Project Name"], df_projects["Country_cb"])
+    # keep only GEM Units of the project country to avoid overlapping
+    for name, country in dict.fromkeys(projects):
+        mine_name = manual_match.get(name, "NOT_FOUND")
+
+        for order, mine_split in enumerate(mine_name.split("$")):
+            for position in gem_index["units"].get((country, mine_split), []):
+                candidates.append((name, country, position, order, False, 100))
+
+        # match on the first name ONLY FOR COAL DATA
+        if fuel == "coal" and "$" not in mine_name and mine_name != "None":
+            positions = gem_index["first_words"].get((country, name.split()[0]), [])
+            fuzzy_projects.append((name, country, positions))
+
+    fuzzy_candidates = [
+        (name, country, position)
+        for name, country, positions in fuzzy_projects
+        for position in positions
+    ]
+    units = gem_index["df"]["Unit_concerned"].tolist()
+    scores = get_fuzz_ratios(
+        [name for name, _, _ in fuzzy_candidates],
+        [units[position] for _, _, position in fuzzy_candidates],
+        workers=FUZZ_WORKERS,
     )
+    candidates += [
+        (name, country, position, 0, True, score)
+        for (name, country, position), score in zip(fuzzy_candidates, scores.tolist())
+    ]
 
-    tmp_merge[num_cols] = tmp_merge[num_cols].replace("None", np.nan).astype(float)
+    return pd.DataFrame(
+        candidates,
+        columns=[
+            "Project Name",
+            "Country_cb",
+            "Position",
+            "Order",
+            "Fuzzy",
+            "Fuzz_score",
+        ],
+    )
+
+
+def _assign_gem_mines(df_candidates: pd.DataFrame, fuel="gasoil") -> dict:
+    """Assign GEM units to projects from their candidates in one pass.
+
+    Manual match candidates are assigned first then fuzzy candidates by
+    decreasing fuzz score. Remaining ties are broken by project name,
+    country and GEM unit position, so the result does not depend on the
+    projects order.
+    - A project gets all its manual match units
+    - A project gets one fuzzy candidate only if it has no manual match unit
+    - For `coal` projects: a unit is assigned to one project only
+
+    Parameters
+    ----------
+    df_candidates : pd.DataFrame
+        Candidates (see `_get_gem_candidates`)
+    fuel : str, optional
+        Fuel type to see which source is used, by default "gasoil"
+        Use "gasoil" or "coal"
 
-    return tmp_merge
+    Returns
+    -------
+    dict
+        Row positions of the GEM units (in manual match order) by
+        (project name, country)
+    """
+    df_candidates = df_candidates.sort_values(
+        ["Fuzzy", "Fuzz_score", "Project Name", "Country_cb", "Position"],
+        ascending=[True, False, True, True, True],
+    )
+
+    assigned_mines = {}
+    used_mines = set()
+    for name, country, position, order, fuzzy in df_candidates[
+        ["Project Name", "Country_cb", "Position", "Order", "Fuzzy"]
+    ].itertuples(index=False, name=None):
+        # For coal data do not put back the same mine for another project
+        if fuel == "coal" and position in used_mines:
+            continue
+        if fuzzy and (name, country) in assigned_mines:
+            continue
+
+        assigned_mines.setdefault((name, country), []).append((order, position))
+        used_mines.add(position)
+
+    return {
+        project: [position for _, position in sorted(mines)]
+        for project, mines in assigned_mines.items()
+    }
 
 
 def _find_gem_mines(
-    row: pd.Series, df_gem: pd.DataFrame, used_mines: list, fuel="gasoil"
+    row: pd.Series, gem_index: dict, assigned_mines: dict, fuel="gasoil"
 ) -> pd.DataFrame:
-    """Find GEM Units / Mines for project that did not have a perfect match.
-
-    For a given project (contained in `row`) it tries to find the units
-    following theses rules:
-    - For `gasoil` projects: use manual_match_gasoil and use it
-    - For `coal` projects:
-        - use manual_match_coal and if mines found then use it
-        - If the project is not in manual_match_coal then try
-          to find mines using _match_gem_mines_using_fuzz function
+    """Return the GEM Units / Mines assigned to a project that did not have
+    a perfect match (see `_assign_gem_mines`) as one line.
 
     Parameters
     ----------
     row : pd.Series
         Project row, it needs `'Project Name'` and `'Country_cb'` columns
-    df_gem : pd.DataFrame
-        GEM Dataframe with the following columns:
-        `['GEM_ID', 'Unit_concerned', 'Country', 'GEM_source', 'Latitude',
-        'Longitude', 'Operators', 'Owners', 'Parent_Company', 'Status']`
-    used_mines : list
-        List of used mines ID (only used for coal projects)
+    gem_index : dict
+        GEM units index (see `_build_gem_index`)
+    assigned_mines : dict
+        Row positions of the GEM units by (project name, country)
     fuel : str, optional
         Fuel type to see which source is used, by default "gasoil"
         Use "gasoil" or "coal"
@@ -212,43 +343,9 @@ def _find_gem_mines(
     """
     name, country = row["Project Name"], row["Country_cb"]
     LOGGER.debug(f"{fuel}: {name} - get informations")
+    df_gem = gem_index["df"]
 
-    # keep only GEM Units of the project country to avoid overlapping
-    df_gem = df_gem.loc[df_gem["Country"] == country].copy()
-
-    # For coal data remove used mines
-    if fuel == "coal":
-        df_gem = df_gem.loc[~df_gem["GEM_ID"].isin(used_mines)]
-
-    # Retrieve mine_name from manual match
-    if fuel == "gasoil":
-        mine_name = (
-            manual_match_gasoil[name] if name in manual_match_gasoil else "NOT_FOUND"
-        )
-    else:
-        mine_name = (
-            manual_match_coal[name] if name in manual_match_coal else "NOT_FOUND"
-        )
-
-    matched_gem_df = pd.DataFrame(columns=df_gem.columns)
-
-    if "$" in mine_name:
-        for mine_split in mine_name.split("$"):
-            mine_df = df_gem.loc[df_gem["Unit_concerned"] == mine_split]
-
-            if matched_gem_df.empty:
-                matched_gem_df = mine_df.copy()
-            else:
-                matched_gem_df = pd.concat([matched_gem_df, mine_df])
-    else:
-        # Perfect match on the mine_name
-        matched_gem_df = df_gem.loc[df_gem["Unit_concerned"] == mine_name]
-
-        # if no match then try to match it on the first name
-        # ONLY FOR COAL DATA
-        if len(matched_gem_df) == 0 and fuel == "coal" and mine_name != "None":
-            LOGGER.debug(f"{fuel}: {name} - match mine using fuzz score")
-            matched_gem_df = _match_gem_mines_using_fuzz(name, df_gem)
+    matched_gem_df = df_gem.iloc[assigned_mines.get((name, country), [])]
 
     if len(matched_gem_df) > 1:
         LOGGER.debug(
@@ -262,7 +359,6 @@ def _find_gem_mines(
                 "Unit_concerned",
                 "Parent_Company",
             ],
-            num_cols=["Latitude", "Longitude"],
         )
 
     elif len(matched_gem_df) == 0:
@@ -274,11 +370,6 @@ def _find_gem_mines(
     else:
         LOGGER.debug(f"{fuel}: {name} - one mine found for this project")
 
-    # add used mines to avoid putting back the same mine for another project
-    used_mines.extend(
-        matched_gem_df["GEM_ID"].astype(str).values[0].split(PROJECT_SEPARATOR)
-    )
-
     return matched_gem_df
 
 
@@ -323,53 +414,6 @@ def cancel_duplicated_rename(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def ponderate_percentage(dict_percentage: dict) -> dict:
-    """
-    Ponderates the percentages in a dictionary such that their sum equals 100%.
-
-    Parameters
-    ----------
-    dict_percentage : dict
-        A dictionary where keys are company names and values are percentages.
-
-    Returns
-    -------
-    dict:
-        A new dictionary with the same keys as `dict_percentage` but with values
-        that have been adjusted such that their sum equals 100%.
-
-    Raises
-    ------
-    ValueError:
-        If the values in `dict_percentage` do not add up to 100.
-
-    Notes
-    -----
-    This function takes a dictionary where the values are percentages that may
-    not add up to exactly 100. It calculates a new set of percentages that are
-    adjusted such that their sum equals 100. The adjusted percentages are then
-    rounded to one decimal point and added up to ensure that their sum equals
-    exactly 100. The function returns a new dictionary with the same keys as
-    the input dictionary but with adjusted percentages as values.
-    """
-    # Calculate sum of percentage to ponderate
-    sum_percentage = sum(list(dict_percentage.values()))
-    # Calculate new percentage based on this sum
-    new_percentage = [elt / sum_percentage for elt in dict_percentage.values()]
-    companies = dict_percentage.keys()
-    # Round each element in the new_percentage list
-    rounded_percentage = [round(x * 100, 1) for x in new_percentage]
-    # Adjust the decimal of the last percentage in order to ensure a 100% sum
-    diff = 100 - sum(rounded_percentage)
-    rounded_percentage[-1] = round(rounded_percentage[-1] + diff, 1)
-    # Build new dictionary
-    dict_percentage = dict()
-    for company, percentage in zip(companies, rounded_percentage):
-        dict_percentage[company] = percentage
-    # Return dict with ponderate percentage
-    return dict_percentage
-
-
 def compute_clean_percentage(raw_line):
     """
     Compute the percentage of involvement of each company mentioned in a given
@@ -420,78 +464,10 @@ def compute_clean_percentage(raw_line):
 
     If there is no information about the company, the output line will be
     'No informations on company (100.0%)'.
-    """
 
-    def _clean_one_unit(raw_line):
-        # With raw_line content 2 possibilities : Percentage are indicated or not
-        if "%" in raw_line:
-            # Case where percentage are indicated
-            # replace "Fullwidth" char by basic char
-            raw_line = (
-                raw_line.replace("，", ",")
-                .replace("）", ")")
-                .replace("（", "(")
-                .replace("]", ")")
-                .replace("[", "(")
-            )
-            # remove useless spaces
-            companies = (
-                re.sub("  +", " ", raw_line).replace(" ;", ";").replace(" ,", ",")
-            )
-
-            # split at each percentage
-            companies = [
-                "(".join(x.split("(")[:-1]) for x in companies.split("%)")[:-1]
-            ]
-            companies = [re.sub(r"[,|;]", "", x).strip() for x in companies]
-            percentages = re.findall(r"\(([\d\.]+)%\)", raw_line)
-            # Merge percentage of same company into one
-            combined_percentages = {}
-            for company, percentage in zip(companies, percentages):
-                if company in combined_percentages:
-                    combined_percentages[company] += float(percentage)
-                else:
-                    combined_percentages[company] = float(percentage)
-            # Once percentage are merge 3 possibilities based on the sum
-            sum_percentage = sum(list(combined_percentages.values()))
-            # Percentage less than 100 percent (We complete by "Others"):
-            if sum_percentage < 100.0:
-                left_percentage = 100.0 - sum_percentage
-                combined_percentages["Others"] = left_percentage
-            # Percentage equal to 100 percent (No action needed):
-            elif sum_percentage == 100.0:
-                pass
-            # Percentage more than 100 percent (We ponderate the results)
-            else:
-                combined_percentages = ponderate_percentage(combined_percentages)
-        else:
-            # Case no percentage are indicated, we defined it based on number of
-            # compagnies defined into
-            companies = raw_line.split(";")
-            if companies == [""]:
-                companies = ["No informations on company"]
-            # Compute percentage considering each company have the same involvement
-            percentages = [100.0 / len(companies) for _ in companies]
-            # Merge percentage of same company into one
-            combined_percentages = {}
-            for company, percentage in zip(companies, percentages):
-                if company in combined_percentages:
-                    combined_percentages[company] += float(percentage)
-                else:
-                    combined_percentages[company] = float(percentage)
-        # Once combined percentage is defined for each case, defined a clean line
-        clean_line = ""
-        for keys in combined_percentages:
-            company_line = f"{keys} ({combined_percentages[keys]}%);"
-            clean_line = clean_line + company_line
-        clean_line = clean_line[:-1]  # Delete last ;
-        return clean_line
-
-    clean_line = []
-    for unit_text in raw_line.split("|"):
-        clean_line.append(_clean_one_unit(unit_text))
-
-    return PROJECT_SEPARATOR.join(clean_line)
+    Lines are parsed with `parse_ownership` (memoised by line).
+    """
+    return format_ownership(parse_ownership(raw_line))
 
 
 def _add_companies_involved(df_carbon_bombs: pd.DataFrame) -> pd.DataFrame:
@@ -515,17 +491,12 @@ def _add_companies_involved(df_carbon_bombs: pd.DataFrame) -> pd.DataFrame:
 
     def replace_comp(x):
         """Replace company names to normalize it"""
-        new_comp = []
-        for projects in x.split(PROJECT_SEPARATOR):
-            new_comp_proj = []
-            for comp_prct in projects.split(";"):
-                comp, prct = comp_prct.rsplit(" (", 1)
-                comp = dict_match[comp] if comp in dict_match else comp
-                new_comp_proj.append(f"{comp} ({prct}")
-
-            new_comp.append(";".join(new_comp_proj))
-
-        return PROJECT_SEPARATOR.join(new_comp)
+        return format_ownership(
+            tuple(
+                tuple((dict_match.get(comp, comp), prct) for comp, prct in unit)
+                for unit in read_ownership(x)
+            )
+        )
 
     df_carbon_bombs["Parent_Company"] = df_carbon_bombs["Parent_Company"].apply(
         replace_comp
@@ -596,9 +567,7 @@ def add_noise_lat_long(x: float) -> float:
 def _add_manual_matching_lat_long(df_carbon_bombs: pd.DataFrame) -> pd.DataFrame:
     """Set Latitude and Longitude with manual matching"""
 
-    print(manual_match_lat_long)
-
-    manual_match_lat_long = manual_match_lat_long.rename(
+    manual_match_lat_long = get_manual_match_lat_long().rename(
         columns={
             "Carbon_bomb_name_source_CB": "Project_name",
             "Country_source_CB": "Country",
@@ -749,9 +718,6 @@ def _init_carbon_bombs_table(fuel: str) -> pd.DataFrame:
     LOGGER.debug(f"{fuel}: Start dataframe initialization")
 
     if fuel == "gasoil":
-        df_cb = load_carbon_bomb_gasoil_database()
-        df_gem = load_gasoil_mine_gem_database()
-
         # Keep specific GEM columns and rename it to normalize it with coal dataset
         GEM_cols_mapping = {
             "Unit ID": "GEM_ID",
@@ -764,10 +730,10 @@ def _init_carbon_bombs_table(fuel: str) -> pd.DataFrame:
             "Production start year": "Start_year",
         }
 
-    else:
-        df_cb = load_carbon_bomb_coal_database()
-        df_gem = load_coal_mine_gem_database()
+        df_cb = load_carbon_bomb_gasoil_database()
+        df_gem = load_gasoil_mine_gem_database(columns=GEM_cols_mapping.keys())
 
+    else:
         # Keep specific GEM columns and rename it to normalize it with gasoil dataset
         GEM_cols_mapping = {
             "GEM Mine ID": "GEM_ID",
@@ -784,6 +750,9 @@ def _init_carbon_bombs_table(fuel: str) -> pd.DataFrame:
             "Coal Grade": "Coal_Grade",
         }
 
+        df_cb = load_carbon_bomb_coal_database()
+        df_gem = load_coal_mine_gem_database(columns=GEM_cols_mapping.keys())
+
     LOGGER.debug(f"{fuel}: CB and GEM dataframes loaded")
 
     df_gem = df_gem.loc[:, GEM_cols_mapping.keys()]
@@ -819,14 +788,22 @@ def _init_carbon_bombs_table(fuel: str) -> pd.DataFrame:
     # get filter for CB with no match or if the project is in manual match keys
     _filter_no_match = df_merge["Unit_concerned"].isna() | df_merge[
         "Project Name"
-    ].isin(manual_match_gasoil.keys())
+    ].isin(get_manual_match_gasoil().keys())
 
     # retrieve data for CB with no match
     LOGGER.debug(f"{fuel}: retrieve informations for projects with no match start...")
-    used_mines = []
+    gem_index = _build_gem_index(df_gem)
+    df_candidates = _get_gem_candidates(df_merge.loc[_filter_no_match], gem_index, fuel)
+    assigned_mines = _assign_gem_mines(df_candidates, fuel)
     no_match_df = pd.concat(
         df_merge.loc[_filter_no_match]
-        .apply(_find_gem_mines, axis=1, df_gem=df_gem, used_mines=used_mines, fuel=fuel)
+        .apply(
+            _find_gem_mines,
+            axis=1,
+            gem_index=gem_index,
+            assigned_mines=assigned_mines,
+            fuel=fuel,
+        )
         .values
     )
     LOGGER.debug(f"{fuel}: retrieve informations for projects with no match done")
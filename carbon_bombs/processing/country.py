@@ -1,7 +1,9 @@
 """Function to process countries information"""
+from functools import lru_cache
 
 import pandas as pd
 
+from carbon_bombs.conf import UNDATA_SERIES
 from carbon_bombs.io.cleaned import load_carbon_bombs_database
 from carbon_bombs.io.undata import load_undata
 from carbon_bombs.utils.logger import LOGGER
@@ -36,22 +38,22 @@ def _get_countries():
     return df
 
 
-def format_serie_values(val):
-    """Format string as interger or float"""
-    if not isinstance(val, str):
-        return val
+def format_serie_values(values: pd.Series) -> pd.Series:
+    """Format serie values as integers if they are all whole numbers
+    else as floats"""
+    values = pd.to_numeric(values)
 
-    val = val.replace(",", "")
+    if (values.dropna() % 1 == 0).all():
+        return values.astype("Int64")
 
-    if "." in val:
-        return float(val)
+    return values
 
-    return int(val)
 
-
-def format_countries_df_with_wanted_series(df_countries: pd.DataFrame) -> pd.DataFrame:
+def format_countries_df_with_wanted_series(
+    df_countries: pd.DataFrame, series: dict = None, how: str = "inner"
+) -> pd.DataFrame:
     """Format raw countries dataframe with a row by country
-    and wanted KPI series (see `columns_map` dict in function).
+    and wanted KPI series (value and year of the last year available).
 
     Parameters
     ----------
@@ -59,6 +61,12 @@ def format_countries_df_with_wanted_series(df_countries: pd.DataFrame) -> pd.Dat
         Dataframe with country names, series value, year for each
         serie. It's the merging of Country from CB data and
         UN datasets
+    series : dict, optional
+        Wanted series (UNData name) and their column names, by default
+        None (`UNDATA_SERIES`)
+    how : str, optional
+        "inner" to keep only countries with all wanted series or "outer"
+        to keep all countries with missing values, by default "inner"
 
     Returns
     -------
@@ -67,59 +75,69 @@ def format_countries_df_with_wanted_series(df_countries: pd.DataFrame) -> pd.Dat
         wanted KPI series as columns with a year column for
         each KPI
     """
-    columns_map = {
-        "Population mid-year estimates (millions)": "Population_in_millions",
-        "Surface area (thousand km2)": "Surface_thousand_km2",
-        "GDP in current prices (millions of US dollars)": "GDP_millions_US_dollars",
-        "GDP per capita (US dollars)": "GDP_per_capita_US_dollars",
-        "Emissions (thousand metric tons of carbon dioxide)": "Emissions_thousand_tons_CO2",
-        "Emissions per capita (metric tons of carbon dioxide)": "Emissions_per_capita_tons_CO2",
-    }
+    if series is None:
+        series = UNDATA_SERIES
+    if how not in ("inner", "outer"):
+        raise ValueError(f"how must be 'inner' or 'outer' (got {how})")
+
     LOGGER.debug(
-        f"Keep only the following informations from UNData: {list(columns_map.keys())}"
+        f"Keep only the following informations from UNData: {list(series.keys())}"
     )
 
     # Keep only some wanted KPI
     df_countries_filtered = df_countries.loc[
-        df_countries["Series"].isin(columns_map.keys())
+        df_countries["Series"].isin(series.keys()),
+        ["Country", "Series", "Year", "Value"],
     ]
 
-    # get max years by country and serie
-    country_year_max = df_countries_filtered.groupby(["Country", "Series"]).agg(
-        year_max=("Year", "max")
-    )
-    country_year_max_df = country_year_max.merge(
-        df_countries,
-        left_on=["Country", "Series", "year_max"],
-        right_on=["Country", "Series", "Year"],
-    ).drop(columns=["year_max"])
+    # get row of max year by country and serie
+    idx_year_max = df_countries_filtered.groupby(
+        ["Country", "Series"], observed=True
+    )["Year"].idxmax()
+    country_year_max_df = df_countries_filtered.loc[idx_year_max]
 
     # Change serie name to wanted format
-    country_year_max_df["Series"] = country_year_max_df["Series"].replace(columns_map)
+    country_year_max_df["Series"] = country_year_max_df["Series"].map(series)
+
+    LOGGER.debug("Add last year found for each information")
+    # Pivot dataframe to get values and year of all series into the same row
+    pivot_df = country_year_max_df.pivot(
+        index="Country", columns="Series", values=["Value", "Year"]
+    )
 
     # Init final countries df
-    final_countries_df = df_countries[["Country"]].drop_duplicates()
+    countries = df_countries["Country"].drop_duplicates()
+    final_countries_df = pd.DataFrame({"Country": countries.to_numpy()})
+    final_countries_df = final_countries_df.set_index("Country", drop=False)
 
-    LOGGER.debug("Add last year found for each information")
-    for serie, serie_df in country_year_max_df.groupby("Series"):
-        # Pivot dataframe to get values and year into the same row
-        serie_df = serie_df.pivot(
-            index=["Country"], columns=["Series"], values=["Value", "Year"]
-        ).reset_index()
+    found_series = sorted(country_year_max_df["Series"].unique())
+    for serie in found_series:
+        final_countries_df[serie] = format_serie_values(pivot_df["Value", serie])
+        final_countries_df[f"Year_{serie}"] = pivot_df["Year", serie].astype("Int64")
 
-        # Format year dtype
-        serie_df["Year"] = serie_df["Year"].astype(int)
+    if how == "inner":
+        final_countries_df = final_countries_df.dropna(subset=found_series)
 
-        # Change columns name
-        serie_df.columns = ["Country", serie, f"Year_{serie}"]
+    return final_countries_df.reset_index(drop=True)
 
-        # Format values
-        serie_df[serie] = serie_df[serie].apply(format_serie_values)
 
-        # merge to add KPI for each countries with the last year available for this metric
-        final_countries_df = final_countries_df.merge(serie_df, on=["Country"])
+@lru_cache(maxsize=None)
+def get_undata_countries_table() -> pd.DataFrame:
+    """Return the table of UNData wanted series (see
+    `format_countries_df_with_wanted_series`) for all countries and areas of
+    UNData. It is computed once per run.
+
+    Returns
+    -------
+    pd.DataFrame
+        UNData countries dataframe with one row per country and wanted KPI
+        series as columns with a year column for each KPI
+    """
+    LOGGER.debug("Load UNData dataset")
+    df_undata = load_undata().rename(columns={"Region_Country_Area_name": "Country"})
 
-    return final_countries_df
+    LOGGER.debug("Keep only wanted information from UNData")
+    return format_countries_df_with_wanted_series(df_undata)
 
 
 def create_country_table():
@@ -144,24 +162,13 @@ def create_country_table():
     LOGGER.debug("Get country from Carbon bombs dataset")
     df_cb_countries = _get_countries()
 
-    # Load UNData with wanted information of countries
-    LOGGER.debug("Load UNData dataset")
-    df_undata = load_undata()
-
-    # Merge the 2 dataframes on country name column.
-    LOGGER.debug("Merge country from CB with UNData dataframes")
+    # Get wanted information of countries from UNData and merge the 2
+    # dataframes on country name column.
+    LOGGER.debug("Merge country from CB with UNData countries table")
     df_countries = df_cb_countries.merge(
-        df_undata,
-        left_on="Country",
-        right_on="Region_Country_Area_name",
-        how="inner",
-        sort=True,
+        get_undata_countries_table(), on="Country", how="inner", sort=True
     )
 
-    # Format countries df to get on row per country
-    LOGGER.debug("Keep only wanted information from UNData")
-    df_countries = format_countries_df_with_wanted_series(df_countries)
-
     # sort df
     LOGGER.debug("Sort dataset by country")
     df_countries = df_countries.sort_values(by="Country")
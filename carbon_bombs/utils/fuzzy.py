@@ -0,0 +1,129 @@
+"""Utils to compute fuzzy matching scores in batch
+
+Scores are the `fuzz.ratio` of fuzzywuzzy (integers between 0 and 100)
+computed with the difflib `SequenceMatcher` used by fuzzywuzzy, so they are
+identical to `fuzz.ratio`. Each query is analysed once for all its choices,
+and with a `score_cutoff` the ratio of a pair is only computed when its quick
+upper bounds reach the cutoff. Large batches of pairs are split across a
+process pool.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+
+import numpy as np
+
+# Minimum number of pairs scored by a worker process: smaller batches are
+# scored in the main process since starting workers would cost more
+MIN_PAIRS_PER_WORKER = 2000
+
+
+def _get_ratio(matcher: SequenceMatcher, query: str, choice: str, score_cutoff=0):
+    """Return the fuzz ratio of `choice` with the query of `matcher` (0 if it
+    is less than `score_cutoff`)
+    """
+    # same special cases as fuzz.ratio
+    if choice == query:
+        return 100
+    if len(choice) == 0 or len(query) == 0:
+        return 0
+
+    matcher.set_seq1(choice)
+    if score_cutoff > 0 and (
+        round(100 * matcher.real_quick_ratio()) < score_cutoff
+        or round(100 * matcher.quick_ratio()) < score_cutoff
+    ):
+        return 0
+
+    score = int(round(100 * matcher.ratio()))
+    return score if score >= score_cutoff else 0
+
+
+def get_fuzz_ratios_matrix(queries: list, choices: list, score_cutoff=0):
+    """Return the fuzz ratio of each query with each choice
+
+    Parameters
+    ----------
+    queries : list
+        Strings to match
+    choices : list
+        Strings to match queries with
+    score_cutoff : int, optional
+        Scores less than `score_cutoff` are set to 0, by default 0
+
+    Returns
+    -------
+    np.ndarray
+        Scores with one row by query and one column by choice
+    """
+    scores = np.zeros((len(queries), len(choices)), dtype=int)
+    matcher = SequenceMatcher(None)
+    for i, query in enumerate(queries):
+        matcher.set_seq2(query)
+        for j, choice in enumerate(choices):
+            scores[i, j] = _get_ratio(matcher, query, choice, score_cutoff)
+
+    return scores
+
+
+def _get_n_workers(n_pairs: int, workers: int) -> int:
+    """Return the number of worker processes used to score `n_pairs` pairs"""
+    if workers == 0 or workers < -1:
+        raise ValueError("workers must be a positive integer or -1")
+
+    if workers == -1:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, n_pairs // MIN_PAIRS_PER_WORKER))
+
+
+def get_fuzz_ratios(queries: list, choices: list, workers=1) -> np.ndarray:
+    """Return the fuzz ratio of each query with the choice at the same position
+
+    Parameters
+    ----------
+    queries : list
+        Strings to match
+    choices : list
+        Strings to match queries with (same length as `queries`)
+    workers : int, optional
+        Maximum number of processes scoring the pairs, -1 to use all CPUs,
+        by default 1. Each process scores at least MIN_PAIRS_PER_WORKER pairs
+
+    Returns
+    -------
+    np.ndarray
+        Score of each pair
+    """
+    if len(queries) != len(choices):
+        raise ValueError(
+            f"queries and choices must have the same length "
+            f"({len(queries)} != {len(choices)})"
+        )
+
+    n_workers = _get_n_workers(len(queries), workers)
+    if n_workers > 1:
+        # contiguous chunks so that pairs of a same query stay together
+        bounds = np.linspace(0, len(queries), n_workers + 1).astype(int)
+        chunks = list(zip(bounds[:-1], bounds[1:]))
+        with ProcessPoolExecutor(n_workers) as executor:
+            scores = executor.map(
+                _get_fuzz_ratios,
+                [queries[start:end] for start, end in chunks],
+                [choices[start:end] for start, end in chunks],
+            )
+            return np.concatenate(list(scores))
+
+    return _get_fuzz_ratios(queries, choices)
+
+
+def _get_fuzz_ratios(queries: list, choices: list) -> np.ndarray:
+    """Score pairs of queries and choices in the current process"""
+    scores = np.zeros(len(queries), dtype=int)
+    matcher = SequenceMatcher(None)
+    for i, (query, choice) in enumerate(zip(queries, choices)):
+        # the query analysis is kept for consecutive pairs of the same query
+        if i == 0 or query != queries[i - 1]:
+            matcher.set_seq2(query)
+        scores[i] = _get_ratio(matcher, query, choice)
+
+    return scores
@@ -4,15 +4,16 @@ import re
 
 import numpy as np
 import pandas as pd
-from fuzzywuzzy import fuzz
 
-from carbon_bombs.conf import PROJECT_SEPARATOR
 from carbon_bombs.io.banking_climate_chaos import load_banking_climate_chaos
 from carbon_bombs.io.cleaned import load_carbon_bombs_database
-from carbon_bombs.io.manual_match import manual_match_company
+from carbon_bombs.io.manual_match import get_manual_match_company
 from carbon_bombs.io.uniform_company_names import load_uniform_company_names
 from carbon_bombs.io.uniform_company_names import save_uniform_company_names
+from carbon_bombs.utils.fuzzy import get_fuzz_ratios_matrix
 from carbon_bombs.utils.logger import LOGGER
+from carbon_bombs.utils.ownership import get_ownership_table
+from carbon_bombs.utils.ownership import read_ownership
 
 
 def split_column_parent_company(row):
@@ -32,23 +33,24 @@ def split_column_parent_company(row):
     -------
     List[Dict[str, Any]]
         A list of dictionaries containing the Carbon Bomb Name and Parent
-        Company values after splitting the Parent Company column.
+        Company values after splitting the Parent Company column (without
+        percentages).
 
     Notes
     -----
-    - This function requires the pandas library to be installed.
+    - Parent Company values are parsed with `read_ownership` (memoised).
     """
     instance = row["Project_name"]
     country = row["Country"]
-    # split by | for different unit and ; for different companies
-    companies = row["Parent_Company"].replace(PROJECT_SEPARATOR, ";").split(";")
+    # | for different unit and ; for different companies
     carbon_bomb_list_company = [
         {
             "Carbon_bomb_name": instance,
             "Country": country,
             "Company": company,
         }
-        for company in companies
+        for unit in read_ownership(str(row["Parent_Company"]))
+        for company, _ in unit
     ]
     return carbon_bomb_list_company
 
@@ -60,6 +62,9 @@ def get_companies_involved_in_cb_df(df_carbon_bombs=None):
     in carbon bombs. Removes the percentage and extra spaces from Parent
     Company column and saves the result in a csv file.
 
+    Parent Company values are parsed once per distinct value into a table of
+    companies (see `get_ownership_table`).
+
     Returns
     -------
     pandas.DataFrame
@@ -81,21 +86,15 @@ def get_companies_involved_in_cb_df(df_carbon_bombs=None):
             "Country",
             "Parent_Company",
         ],
-    ]
-
-    # Force type of column Parent_Company
-    df_carbon_bombs_company["Parent_Company"] = df_carbon_bombs_company.loc[
-        :, "Parent_Company"
-    ].astype("str")
-
-    split_rows = df_carbon_bombs_company.apply(split_column_parent_company, axis=1)
-
-    # Create a dataframe with duplicates carbon bombs
-    df = pd.concat([pd.DataFrame(rows) for rows in split_rows])
-    df.reset_index(drop=True, inplace=True)
+    ].reset_index(drop=True)
 
-    # Remove percentage
-    df["Company"] = df["Company"].apply(lambda x: "(".join(x.split("(")[:-1]))
+    # Create a dataframe with duplicates carbon bombs (one line per company)
+    df = (
+        get_ownership_table(df_carbon_bombs_company["Parent_Company"])[["Company"]]
+        .join(df_carbon_bombs_company[["Project_name", "Country"]])
+        .rename(columns={"Project_name": "Carbon_bomb_name"})
+    )
+    df = df[["Carbon_bomb_name", "Country", "Company"]].reset_index(drop=True)
 
     # Clean extra space from company column
     df["Company"] = df["Company"].str.strip()
@@ -203,18 +202,22 @@ def _get_companies_match_cb_to_bocc(df_cb=None):
 
     dict_match = {}
     LOGGER.debug("Match CB company name with BOCC name with fuzzy score")
-    for company in df_cb["Company"].unique():
+    companies = df_cb["Company"].unique()
+    # fuzzy scores of every company (rows) with every BOCC company (columns)
+    # only scores above the threshold are needed (others are set to 0)
+    fuzzy_scores = get_fuzz_ratios_matrix(
+        [clean(company) for company in companies],
+        df_list_bocc["Company BOCC_cleaned"].tolist(),
+        score_cutoff=threshold + 1,
+    )
+    for company, company_scores in zip(companies, fuzzy_scores):
         LOGGER.debug(f"{company}: try matching")
-        company_cleaned = clean(company)
-        df_list_bocc["fuzzy_score"] = df_list_bocc["Company BOCC_cleaned"].apply(
-            lambda x: fuzz.ratio(x, company_cleaned)
-        )
-        max_fuzz = df_list_bocc["fuzzy_score"].max()
+        max_fuzz = company_scores.max()
 
         if max_fuzz > threshold:
-            company_matched = df_list_bocc.loc[
-                df_list_bocc["fuzzy_score"] == max_fuzz, "Company BOCC"
-            ].values[0]
+            company_matched = df_list_bocc["Company BOCC"].values[
+                np.argmax(company_scores)
+            ]
             dict_match[company] = company_matched
             LOGGER.debug(f"{company}: match found with `{company_matched}`")
         else:
@@ -222,7 +225,7 @@ def _get_companies_match_cb_to_bocc(df_cb=None):
 
     # Now we have dictionnary with auto matching, we had the manual match and
     # be cautious about not erasing key present in auto matching dict.
-    for key, value in manual_match_company.items():
+    for key, value in get_manual_match_company().items():
         # force manual matching
         if key in dict_match:
             dict_match[key] = value
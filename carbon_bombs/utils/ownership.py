@@ -0,0 +1,242 @@
+"""Utils to parse ownership strings of GEM units
+
+GEM gives the owners of a project as a string such as
+`"A (40%); B (60%) | C"`: units are separated by a '|' and companies of a
+unit by a ';' (with or without their share). An ownership is parsed into a
+tuple of units, each unit being a tuple of (company, share) pairs:
+
+    (
+        (("A", 40.0), ("B", 60.0)),
+        (("C", 100.0),),
+    )
+
+and formatted back into a clean string `"A (40.0%);B (60.0%)|C (100.0%)"`.
+Parsed ownerships are memoised by string since many projects share the same
+owners.
+"""
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from carbon_bombs.conf import PROJECT_SEPARATOR
+
+# replace "Fullwidth" char by basic char
+FULLWIDTH_CHARS = str.maketrans(
+    {"，": ",", "）": ")", "（": "(", "]": ")", "[": "("}
+)
+MULTIPLE_SPACES_PATTERN = re.compile("  +")
+SEPARATORS_PATTERN = re.compile(r"[,|;]")
+PERCENTAGE_PATTERN = re.compile(r"\(([\d\.]+)%\)")
+# company and share of a clean ownership item, e.g. "A (40.0%)"
+COMPANY_SHARE_PATTERN = re.compile(r"^(?P<company>.*?) ?\((?P<share>[^(]*)%\)$")
+
+
+def ponderate_percentage(dict_percentage: dict) -> dict:
+    """
+    Ponderates the percentages in a dictionary such that their sum equals 100%.
+
+    Parameters
+    ----------
+    dict_percentage : dict
+        A dictionary where keys are company names and values are percentages.
+
+    Returns
+    -------
+    dict:
+        A new dictionary with the same keys as `dict_percentage` but with values
+        that have been adjusted such that their sum equals 100%.
+
+    Notes
+    -----
+    This function takes a dictionary where the values are percentages that may
+    not add up to exactly 100. It calculates a new set of percentages that are
+    adjusted such that their sum equals 100. The adjusted percentages are then
+    rounded to one decimal point and added up to ensure that their sum equals
+    exactly 100. The function returns a new dictionary with the same keys as
+    the input dictionary but with adjusted percentages as values.
+    """
+    sum_percentage = sum(dict_percentage.values())
+    rounded_percentage = [
+        round(percentage / sum_percentage * 100, 1)
+        for percentage in dict_percentage.values()
+    ]
+    # Adjust the decimal of the last percentage in order to ensure a 100% sum
+    diff = 100 - sum(rounded_percentage)
+    rounded_percentage[-1] = round(rounded_percentage[-1] + diff, 1)
+
+    return dict(zip(dict_percentage.keys(), rounded_percentage))
+
+
+def _combine_percentages(companies: list, percentages: list) -> dict:
+    """Merge percentage of same company into one"""
+    combined_percentages = {}
+    for company, percentage in zip(companies, percentages):
+        if company in combined_percentages:
+            combined_percentages[company] += float(percentage)
+        else:
+            combined_percentages[company] = float(percentage)
+    return combined_percentages
+
+
+def _parse_unit(raw_unit: str) -> tuple:
+    """Parse the owners of one unit into (company, share) pairs.
+
+    With raw_unit content 2 possibilities: percentages are indicated or not.
+    When they are, percentages of a same company are merged and their sum is
+    completed with "Others" if less than 100 or ponderated if more than 100.
+    Else each company has the same share.
+    """
+    if "%" in raw_unit:
+        raw_unit = raw_unit.translate(FULLWIDTH_CHARS)
+        # remove useless spaces
+        companies = (
+            MULTIPLE_SPACES_PATTERN.sub(" ", raw_unit)
+            .replace(" ;", ";")
+            .replace(" ,", ",")
+        )
+
+        # split at each percentage
+        companies = [
+            "(".join(x.split("(")[:-1]) for x in companies.split("%)")[:-1]
+        ]
+        companies = [SEPARATORS_PATTERN.sub("", x).strip() for x in companies]
+        percentages = PERCENTAGE_PATTERN.findall(raw_unit)
+        combined_percentages = _combine_percentages(companies, percentages)
+
+        sum_percentage = sum(combined_percentages.values())
+        # Percentage less than 100 percent (We complete by "Others")
+        if sum_percentage < 100.0:
+            combined_percentages["Others"] = 100.0 - sum_percentage
+        # Percentage more than 100 percent (We ponderate the results)
+        elif sum_percentage > 100.0:
+            combined_percentages = ponderate_percentage(combined_percentages)
+    else:
+        companies = raw_unit.split(";")
+        if companies == [""]:
+            companies = ["No informations on company"]
+        # Compute percentage considering each company have the same involvement
+        percentages = [100.0 / len(companies) for _ in companies]
+        combined_percentages = _combine_percentages(companies, percentages)
+
+    return tuple(combined_percentages.items())
+
+
+@lru_cache(maxsize=None)
+def parse_ownership(raw_line: str) -> tuple:
+    """Parse a raw ownership string (e.g. `"A (40%), B (60%)|C"`)
+
+    Parameters
+    ----------
+    raw_line : str
+        Owners of a project, units separated by a '|'
+
+    Returns
+    -------
+    tuple
+        (company, share) pairs of each unit
+    """
+    return tuple(_parse_unit(raw_unit) for raw_unit in raw_line.split("|"))
+
+
+def format_ownership(ownership: tuple) -> str:
+    """Format a parsed ownership into a clean ownership string
+    (e.g. `"A (40.0%);B (60.0%)|C (100.0%)"`)
+
+    Parameters
+    ----------
+    ownership : tuple
+        (company, share) pairs of each unit
+
+    Returns
+    -------
+    str
+        Clean ownership string
+    """
+    return PROJECT_SEPARATOR.join(
+        ";".join(f"{company} ({share}%)" for company, share in unit)
+        for unit in ownership
+    )
+
+
+def _read_item(item: str) -> tuple:
+    """Return the company and share of a clean ownership item (the share is
+    NaN and the company empty if the item has no share)
+    """
+    match = COMPANY_SHARE_PATTERN.match(item)
+    if match is None:
+        return "(".join(item.split("(")[:-1]), np.nan
+
+    try:
+        share = float(match["share"])
+    except ValueError:
+        share = np.nan
+    return match["company"], share
+
+
+@lru_cache(maxsize=None)
+def read_ownership(line: str) -> tuple:
+    """Parse a clean ownership string (see `format_ownership`)
+
+    Parameters
+    ----------
+    line : str
+        Clean ownership string
+
+    Returns
+    -------
+    tuple
+        (company, share) pairs of each unit
+    """
+    return tuple(
+        tuple(_read_item(item) for item in unit.split(";"))
+        for unit in line.split(PROJECT_SEPARATOR)
+    )
+
+
+def get_ownership_table(lines: pd.Series) -> pd.DataFrame:
+    """Return the companies of clean ownership strings as a table, each
+    distinct string being parsed once
+
+    Parameters
+    ----------
+    lines : pd.Series
+        Clean ownership strings
+
+    Returns
+    -------
+    pd.DataFrame
+        One line per company of each unit with the following columns:
+        `['Unit', 'Company', 'Share']` (the position of the unit in the
+        string, the company and its share). Index values of `lines` are
+        repeated for each of their companies.
+    """
+    codes, uniques = pd.factorize(lines, use_na_sentinel=False)
+    ownerships = [read_ownership(str(line)) for line in uniques]
+
+    # companies of each distinct string, one after the other
+    df_companies = pd.DataFrame(
+        [
+            (i, company, share)
+            for ownership in ownerships
+            for i, unit in enumerate(ownership)
+            for company, share in unit
+        ],
+        columns=["Unit", "Company", "Share"],
+    )
+    lengths = np.array(
+        [sum(map(len, ownership)) for ownership in ownerships], dtype=int
+    )
+    starts = np.cumsum(lengths) - lengths
+
+    # positions in df_companies of the companies of each line
+    row_lengths = lengths[codes]
+    row_starts = np.cumsum(row_lengths) - row_lengths
+    positions = np.repeat(starts[codes] - row_starts, row_lengths) + np.arange(
+        row_lengths.sum()
+    )
+
+    df_companies = df_companies.iloc[positions]
+    df_companies.index = lines.index.repeat(row_lengths)
+    return df_companies
@@ -0,0 +1,114 @@
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from carbon_bombs.io.rystad import _explode_companies
+from carbon_bombs.utils.logger import get_logger
+from carbon_bombs.utils.logger import LOGGER
+
+
+def _explode_companies_loops(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous implementation of `_explode_companies` (Python loops), kept
+    as reference for timings and outputs
+    """
+    companies_split = df["Company_involved"].str.split("\n")
+    df_expanded = df.loc[df.index.repeat(companies_split.str.len())]
+    df_expanded["Company_involved"] = [
+        company for companies in companies_split for company in companies
+    ]
+    df_expanded["Company_involvement_rank"] = [
+        rank for companies in companies_split for rank in range(1, len(companies) + 1)
+    ]
+
+    headquarters_split = df["Company_headquarters_country"].str.split("\n")
+    headquarters_flat = []
+    for idx, companies in enumerate(companies_split):
+        countries = headquarters_split.iloc[idx]
+        if len(countries) == len(companies):
+            headquarters_flat.extend(countries)
+        else:
+            LOGGER.warning(
+                f"Project {df['Project_name'].iloc[idx]} has a mismatch between "
+                "number of companies and headquarters countries."
+            )
+            headquarters_flat.extend([countries[0]] * len(companies))
+    df_expanded["Company_headquarters_country"] = headquarters_flat
+
+    return df_expanded.reset_index(drop=True)
+
+
+def _make_extract(n_projects: int, mismatch_rate: float, seed: int = 0):
+    """Synthetic Rystad company extract: 1 to 6 companies per project, a
+    share `mismatch_rate` of projects having one headquarters country too many
+    """
+    rng = np.random.default_rng(seed)
+    n_companies = rng.integers(1, 7, n_projects)
+    mismatch = rng.random(n_projects) < mismatch_rate
+
+    companies = [
+        "\n".join(f"Company {i}" for i in rng.integers(0, 5000, n))
+        for n in n_companies
+    ]
+    countries = [
+        "\n".join(f"Country {i}" for i in rng.integers(0, 150, n + m))
+        for n, m in zip(n_companies, mismatch)
+    ]
+    return pd.DataFrame(
+        {
+            "Project_name": [f"Project {i}" for i in range(n_projects)],
+            "Country": "Country",
+            "Company_involved": companies,
+            "Company_headquarters_country": countries,
+            "Potential_emissions_in_GTCO2": rng.random(n_projects),
+        },
+        # shuffled non range index like a filtered extract
+        index=rng.permutation(n_projects) * 2,
+    )
+
+
+def _best_time(func, df: pd.DataFrame, repeat: int) -> tuple:
+    """Return the best time of `repeat` calls of `func` and its output"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = func(df.copy())
+        timings.append(time.perf_counter() - start)
+    return min(timings), output
+
+
+@click.command()
+@click.option("-v", "--verbose", default=50, help="Verbosity level")
+@click.option(
+    "-n",
+    "--n-projects",
+    multiple=True,
+    type=int,
+    default=[400, 10_000, 50_000],
+    help="Number of projects of a synthetic extract (can be repeated)",
+)
+@click.option("--mismatch-rate", default=0.05, help="Share of mismatch projects")
+@click.option("--repeat", default=3, help="Number of timings kept the best of")
+def benchmark_rystad_explode(verbose, n_projects, mismatch_rate, repeat):
+    """Time the Rystad company explode against the previous loops"""
+    # mismatch warnings (one per project) are timed too unless hidden
+    LOGGER = get_logger(verbose=verbose, name="carbon_bombs", log=True)
+    LOGGER.info("Start benchmark rystad explode script")
+
+    for n in n_projects:
+        df = _make_extract(n, mismatch_rate)
+        time_loops, expected = _best_time(_explode_companies_loops, df, repeat)
+        time_vectorised, output = _best_time(_explode_companies, df, repeat)
+
+        pd.testing.assert_frame_equal(output, expected)
+        click.echo(
+            f"{n} projects ({len(output)} rows): "
+            f"vectorised {time_vectorised:.3f}s, loops {time_loops:.3f}s"
+        )
+
+    LOGGER.info("Benchmark rystad explode script - DONE")
+
+
+if __name__ == "__main__":
+    benchmark_rystad_explode()
@@ -6,12 +6,20 @@ from carbon_bombs.utils.logger import get_logger
 
 @click.command()
 @click.option("-v", "--verbose", default=50, help="Verbosity level")
-def create_local_database_script(verbose):
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    default="json",
+    type=click.Choice(["json", "gzip", "msgpack"]),
+    help="Output format (msgpack requires the msgpack package)",
+)
+def create_local_database_script(verbose, fmt):
     """"""
     LOGGER = get_logger(verbose=verbose, name="carbon_bombs", log=True)
     LOGGER.info("Start create local database script")
 
-    create_local_database()
+    create_local_database(fmt=fmt)
 
     LOGGER.info("Create local database script - DONE")
 
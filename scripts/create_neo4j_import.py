@@ -0,0 +1,27 @@
+import click
+
+from carbon_bombs.conf import DATA_NEO4J_IMPORT_PATH
+from carbon_bombs.io.neo4j import create_bulk_import_files
+from carbon_bombs.utils.logger import get_logger
+
+
+@click.command()
+@click.option("-v", "--verbose", default=50, help="Verbosity level")
+@click.option(
+    "-o",
+    "--out-dir",
+    default=DATA_NEO4J_IMPORT_PATH,
+    help="Folder where neo4j-admin import files are written",
+)
+def create_neo4j_import_script(verbose, out_dir):
+    """"""
+    LOGGER = get_logger(verbose=verbose, name="carbon_bombs", log=True)
+    LOGGER.info("Start create neo4j import script")
+
+    create_bulk_import_files(out_dir=out_dir)
+
+    LOGGER.info("Create neo4j import script - DONE")
+
+
+if __name__ == "__main__":
+    create_neo4j_import_script()
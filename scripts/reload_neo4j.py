@@ -1,26 +1,63 @@
 import click
 
+from carbon_bombs.io.neo4j import NEO4J_BATCH_SIZE
+from carbon_bombs.io.neo4j import NEO4J_CONCURRENCY
 from carbon_bombs.io.neo4j import purge_database
+from carbon_bombs.io.neo4j import sync_neo4j
 from carbon_bombs.io.neo4j import update_neo4j
+from carbon_bombs.io.neo4j import update_neo4j_async
 from carbon_bombs.utils.logger import get_logger
 
 
 @click.command()
 @click.option("-v", "--verbose", default=50, help="Verbosity level")
-def reload_neo4j(verbose):
+@click.option(
+    "--batch-size", default=NEO4J_BATCH_SIZE, help="Number of rows per transaction"
+)
+@click.option(
+    "--sync",
+    is_flag=True,
+    help="Only write changes since the last load or sync instead of purging",
+)
+@click.option(
+    "--purge-label",
+    multiple=True,
+    help="Only purge nodes of this label (can be repeated), default all nodes",
+)
+@click.option(
+    "--parallel",
+    is_flag=True,
+    help="Write node labels and relationship types in parallel (async driver)",
+)
+@click.option(
+    "--concurrency",
+    default=NEO4J_CONCURRENCY,
+    help="Maximum number of parallel transactions with --parallel",
+)
+def reload_neo4j(verbose, batch_size, sync, purge_label, parallel, concurrency):
     """"""
     LOGGER = get_logger(verbose=verbose, name="carbon_bombs", log=True)
     LOGGER.info("Start reload neo4j script")
 
-    # Step 1: purge all data from neo4j
-    LOGGER.info("Step 1 - Purge database start")
-    purge_database()
-    LOGGER.info("Step 1 - Purge database done")
+    if sync:
+        # Only write what changed since the last load or sync
+        LOGGER.info("Sync neo4j data with the synced snapshot start")
+        sync_neo4j(batch_size=batch_size)
+        LOGGER.info("Sync neo4j data with the synced snapshot done")
 
-    # Step 2: Update neo4j data and load it into database
-    LOGGER.info("Step 2 - Update neo4j data and load it into database start")
-    update_neo4j()
-    LOGGER.info("Step 2 - Update neo4j data and load it into database done")
+    else:
+        # Step 1: purge all data from neo4j
+        LOGGER.info("Step 1 - Purge database start")
+        purge_database(labels=list(purge_label) or None, batch_size=batch_size)
+        LOGGER.info("Step 1 - Purge database done")
+
+        # Step 2: Update neo4j data and load it into database
+        LOGGER.info("Step 2 - Update neo4j data and load it into database start")
+        if parallel:
+            update_neo4j_async(batch_size=batch_size, concurrency=concurrency)
+        else:
+            update_neo4j(batch_size=batch_size)
+        LOGGER.info("Step 2 - Update neo4j data and load it into database done")
 
     LOGGER.info("Reload neo4j script - DONE")
 
@@ -0,0 +1,26 @@
+import click
+
+from carbon_bombs.conf import DATA_SOURCE_PATH
+from carbon_bombs.conf import FPATH_SRC_MANIFEST
+from carbon_bombs.io.manifest import update_manifest
+from carbon_bombs.utils.logger import get_logger
+
+
+@click.command()
+@click.option("-v", "--verbose", default=50, help="Verbosity level")
+@click.option(
+    "-d", "--dir-path", default=DATA_SOURCE_PATH, help="Folder of source files"
+)
+@click.option("-o", "--out", default=FPATH_SRC_MANIFEST, help="Manifest path")
+def update_sources_manifest(verbose, dir_path, out):
+    """"""
+    LOGGER = get_logger(verbose=verbose, name="carbon_bombs", log=True)
+    LOGGER.info("Start update sources manifest script")
+
+    manifest = update_manifest(dir_path=dir_path, fpath=out)
+
+    LOGGER.info(f"Update sources manifest - DONE ({len(manifest)} files)")
+
+
+if __name__ == "__main__":
+    update_sources_manifest()
@@ -0,0 +1,56 @@
+"""Check that each workbook is opened once per run by the Excel loaders"""
+import os
+
+import pandas as pd
+import pytest
+
+from carbon_bombs.io import excel
+from carbon_bombs.io.excel import read_excel_cached
+from carbon_bombs.io.excel import read_excel_sheets
+
+SHEETS = {
+    "first": pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+    "second": pd.DataFrame({"c": [3.5, 4.5]}),
+    "third": pd.DataFrame({"d": ["z"]}),
+}
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    fpath = str(tmp_path / "workbook.xlsx")
+    with pd.ExcelWriter(fpath, engine="openpyxl") as writer:
+        for sheet_name, df in SHEETS.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    monkeypatch.setattr(excel, "DATA_CACHE_PATH", str(tmp_path / "cache"))
+    excel.close_workbooks()
+    yield fpath
+    excel.close_workbooks()
+
+
+def test_workbook_opened_once(workbook):
+    sheets = read_excel_sheets(workbook, list(SHEETS), engine="openpyxl")
+    read_excel_cached(workbook, "first", engine="openpyxl", usecols=["a"])
+
+    for sheet_name, df in SHEETS.items():
+        pd.testing.assert_frame_equal(sheets[sheet_name], df)
+    assert excel.workbook_open_counts[os.path.abspath(workbook)] == 1
+
+
+def test_workbook_not_opened_when_cached(workbook):
+    read_excel_sheets(workbook, list(SHEETS), engine="openpyxl")
+    excel.close_workbooks()
+    count = excel.workbook_open_counts[os.path.abspath(workbook)]
+
+    sheets = read_excel_sheets(workbook, list(SHEETS), engine="openpyxl")
+
+    for sheet_name, df in SHEETS.items():
+        pd.testing.assert_frame_equal(sheets[sheet_name], df)
+    assert excel.workbook_open_counts[os.path.abspath(workbook)] == count
+
+
+def test_workbook_registry_keyed_by_engine(workbook):
+    workbook_openpyxl = excel.get_workbook(workbook, engine="openpyxl")
+
+    assert excel.get_workbook(workbook, engine="openpyxl") is workbook_openpyxl
+    assert excel.get_workbook(workbook) is not workbook_openpyxl
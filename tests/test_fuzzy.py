@@ -0,0 +1,81 @@
+"""Check that batched fuzzy scores are identical to fuzzywuzzy scores"""
+import os
+import random
+
+import numpy as np
+import pytest
+from fuzzywuzzy import fuzz
+
+from carbon_bombs.conf import FPATH_SRC_GEM_COAL
+from carbon_bombs.io.gem import load_coal_mine_gem_database
+from carbon_bombs.utils import fuzzy
+from carbon_bombs.utils.fuzzy import get_fuzz_ratios
+from carbon_bombs.utils.fuzzy import get_fuzz_ratios_matrix
+
+EDGE_CASES = ["", "a", "A", "Coal Mine", "Coal  Mine ", "mine coal"]
+
+
+@pytest.fixture(scope="module")
+def gem_names():
+    if not os.path.isfile(FPATH_SRC_GEM_COAL):
+        pytest.skip(f"{FPATH_SRC_GEM_COAL} not found")
+
+    names = load_coal_mine_gem_database(columns=["Mine Name"])["Mine Name"]
+    names = names.dropna().unique().tolist()
+    random.Random(0).shuffle(names)
+    return names
+
+
+def _get_expected_matrix(queries, choices):
+    return np.array(
+        [[fuzz.ratio(choice, query) for choice in choices] for query in queries]
+    )
+
+
+def test_matrix_identical_to_fuzz_ratio(gem_names):
+    queries = gem_names[:150] + EDGE_CASES
+    choices = gem_names[150:750] + EDGE_CASES
+
+    scores = get_fuzz_ratios_matrix(queries, choices)
+
+    np.testing.assert_array_equal(scores, _get_expected_matrix(queries, choices))
+
+
+def test_matrix_score_cutoff(gem_names):
+    queries = gem_names[:100] + EDGE_CASES
+    choices = gem_names[100:600] + EDGE_CASES
+    expected = _get_expected_matrix(queries, choices)
+
+    scores = get_fuzz_ratios_matrix(queries, choices, score_cutoff=60)
+
+    np.testing.assert_array_equal(scores, np.where(expected >= 60, expected, 0))
+
+
+def test_pairs_identical_to_fuzz_ratio(gem_names):
+    queries = sorted(gem_names[:2000]) + EDGE_CASES
+    choices = gem_names[2000:4000] + EDGE_CASES[::-1]
+
+    scores = get_fuzz_ratios(queries, choices)
+
+    expected = [fuzz.ratio(choice, query) for query, choice in zip(queries, choices)]
+    np.testing.assert_array_equal(scores, expected)
+
+
+def test_pairs_workers_identical(gem_names, monkeypatch):
+    monkeypatch.setattr(fuzzy, "MIN_PAIRS_PER_WORKER", 100)
+    queries = sorted(gem_names[:1000])
+    choices = gem_names[1000:2000]
+
+    scores = get_fuzz_ratios(queries, choices, workers=3)
+
+    np.testing.assert_array_equal(scores, get_fuzz_ratios(queries, choices))
+
+
+def test_pairs_invalid_workers():
+    with pytest.raises(ValueError):
+        get_fuzz_ratios(["a"], ["a"], workers=0)
+
+
+def test_pairs_different_lengths():
+    with pytest.raises(ValueError):
+        get_fuzz_ratios(["a", "b"], ["a"])
@@ -0,0 +1,36 @@
+"""Check that importing processing modules does not load any data source"""
+import subprocess
+import sys
+import time
+
+import pytest
+
+from carbon_bombs.conf import REPO_PATH
+
+# Seconds allowed to start python and import a module: reading a single
+# source workbook at import time is enough to exceed it
+IMPORT_TIME_BUDGET = 2.0
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "carbon_bombs.processing",
+        "carbon_bombs.processing.banks",
+        "carbon_bombs.utils.match_company_bocc",
+    ],
+)
+def test_import_time(module):
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=REPO_PATH,
+        check=True,
+        capture_output=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < IMPORT_TIME_BUDGET, (
+        f"import {module} took {elapsed:.2f}s "
+        f"(budget: {IMPORT_TIME_BUDGET:.2f}s)"
+    )
@@ -0,0 +1,136 @@
+"""Check the neo4j-admin import files written by `create_bulk_import_files`"""
+import pandas as pd
+import pytest
+
+from carbon_bombs.io import neo4j
+from carbon_bombs.io.neo4j import create_bulk_import_files
+
+NODES = (
+    # carbon bombs
+    pd.DataFrame(
+        {
+            "name": ["Bomb A", "Bomb B"],
+            "country": ["France", "Chile"],
+            "potential_gtco2": [1.5, 2.0],
+        }
+    ),
+    # companies
+    pd.DataFrame({"name": ["Company A", "Company B"], "country": ["France", "None"]}),
+    # banks
+    pd.DataFrame({"name": ["Bank A"], "latitude": [48.8]}),
+    # countries
+    pd.DataFrame({"name": ["France", "Chile"], "population_in_millions": [68, 19]}),
+)
+
+CONNEXIONS = {
+    "cb_companies": pd.DataFrame(
+        {
+            "carbon_bomb": ["Bomb A", "Bomb B", "Bomb C"],
+            "company": ["Company A", "Company B", "Company A"],
+            "country": ["France", "Chile", "France"],
+            "weight": 1,
+        }
+    ),
+    "bank_companies": pd.DataFrame(
+        {
+            "bank": ["Bank A", "Bank A"],
+            "company": ["Company A", "Company B"],
+            "total": [10.0, 5.5],
+            "year_2016": [10, 5],
+        }
+    ),
+    "cb_country": pd.DataFrame(
+        {"carbon_bomb": ["Bomb A", "Bomb B"], "country": ["France", "Chile"]}
+    ),
+    "companies_country": pd.DataFrame(
+        {"company": ["Company A", "Company B"], "country": ["France", None]}
+    ),
+    "bank_country": pd.DataFrame({"bank": ["Bank A"], "country": ["France"]}),
+}
+
+
+@pytest.fixture
+def import_dir(tmp_path, monkeypatch):
+    # cleaned datasets and neo4j CSV of the repository are not used
+    monkeypatch.setattr(neo4j, "read_cleaned_datasets", lambda: {})
+    monkeypatch.setattr(neo4j, "update_csv_nodes_neo4j", lambda cleaned: NODES)
+    monkeypatch.setattr(
+        neo4j, "update_csv_connexions_neo4j", lambda cleaned: CONNEXIONS
+    )
+
+    command = create_bulk_import_files(out_dir=str(tmp_path))
+    assert command[:4] == ["neo4j-admin", "database", "import", "full"]
+    return tmp_path
+
+
+def _read_import_file(import_dir, name):
+    return pd.read_csv(import_dir / f"{name}.csv", dtype=str, keep_default_na=False)
+
+
+@pytest.mark.parametrize(
+    "name, columns, n_rows",
+    [
+        (
+            "nodes_carbon_bomb",
+            [":ID(carbon_bomb)", "name", "country", "potential_gtco2:double"],
+            2,
+        ),
+        ("nodes_company", [":ID(company)", "name", "country"], 2),
+        ("nodes_bank", [":ID(bank)", "name", "latitude:double"], 1),
+        (
+            "nodes_country",
+            [":ID(country)", "name", "population_in_millions:long"],
+            2,
+        ),
+    ],
+)
+def test_nodes_files(import_dir, name, columns, n_rows):
+    data = _read_import_file(import_dir, name)
+
+    assert list(data.columns) == columns + [":LABEL"]
+    assert len(data) == n_rows
+    assert (data[":LABEL"] == name.split("_", 1)[1]).all()
+
+
+def test_nodes_ids(import_dir):
+    data = _read_import_file(import_dir, "nodes_carbon_bomb")
+
+    assert data[":ID(carbon_bomb)"].tolist() == ["Bomb A|France", "Bomb B|Chile"]
+
+
+@pytest.mark.parametrize(
+    "name, start, end, properties, rel_type, n_rows",
+    [
+        # "Bomb C" is not a carbon bomb node: its relationship is skipped
+        ("cb_companies", "company", "carbon_bomb", ["weight:long"], "OPERATES", 2),
+        (
+            "bank_companies",
+            "bank",
+            "company",
+            ["total:double", "year_2016:long"],
+            "FINANCES",
+            2,
+        ),
+        ("cb_country", "carbon_bomb", "country", [], "IS_LOCATED", 2),
+        # a relationship without its country key is skipped
+        ("companies_country", "company", "country", [], "IS_LOCATED", 1),
+        ("bank_country", "bank", "country", [], "IS_LOCATED", 1),
+    ],
+)
+def test_relationships_files(
+    import_dir, name, start, end, properties, rel_type, n_rows
+):
+    data = _read_import_file(import_dir, f"relationships_{name}")
+
+    assert list(data.columns) == (
+        [f":START_ID({start})", f":END_ID({end})"] + properties + [":TYPE"]
+    )
+    assert len(data) == n_rows
+    assert (data[":TYPE"] == rel_type).all()
+
+
+def test_relationships_ids(import_dir):
+    data = _read_import_file(import_dir, "relationships_cb_companies")
+
+    assert data[":START_ID(company)"].tolist() == ["Company A", "Company B"]
+    assert data[":END_ID(carbon_bomb)"].tolist() == ["Bomb A|France", "Bomb B|Chile"]